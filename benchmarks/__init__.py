@@ -0,0 +1,3 @@
+"""
+__init__.py para hacer que la carpeta benchmarks sea un paquete Python.
+"""
@@ -0,0 +1,54 @@
+"""
+Benchmark: counterparty extraction from BNB details, and lookups through the
+counterparty index against a scan of the details text.
+
+Usage:
+    python -m benchmarks.bench_counterparties [rows] [counterparties]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.synthetic import standardized_statements
+from src.processors.counterparty_extractor import extract_counterparties
+from src.store.counterparty_index import CounterpartyIndex
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    counterparties = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    rng = np.random.default_rng(0)
+    ids = rng.integers(0, counterparties, rows)
+    df = standardized_statements(rows, bank_code='BNB1', account_number='1000092297')
+    df['additional_details'] = (np.char.add('Cuenta Origen: ', (1041300000 + ids).astype(str)).astype(object)
+                                + '. Nombre Originante: EMPRESA ' + ids.astype(str).astype(object) + ' S.R.L..')
+    print(f"Rows: {rows}, counterparties: {counterparties}")
+
+    start = time.perf_counter()
+    extract_counterparties(df)
+    print(f"extract_counterparties:     {time.perf_counter() - start:.3f} s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = CounterpartyIndex(Path(tmp) / "counterparties.csv")
+        start = time.perf_counter()
+        index.update(df)
+        print(f"index update (write):       {time.perf_counter() - start:.3f} s")
+
+        target = 'EMPRESA 123 S.R.L.'
+        start = time.perf_counter()
+        scanned = df[df['additional_details'].str.contains(f'Nombre Originante: {target}', regex=False)]
+        scan = time.perf_counter() - start
+        start = time.perf_counter()
+        found = index.lookup(name=target)
+        indexed = time.perf_counter() - start
+        print(f"name lookup: scan {scan * 1000:.1f} ms, index {indexed * 1000:.2f} ms, {len(found)} rows")
+        assert len(found) == len(scanned)
+
+        start = time.perf_counter()
+        found = index.lookup(account=str(1041300000 + 123))
+        print(f"account lookup: index {(time.perf_counter() - start) * 1000:.2f} ms, {len(found)} rows")
+
+if __name__ == "__main__":
+    main()
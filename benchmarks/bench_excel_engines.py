@@ -0,0 +1,51 @@
+"""
+Benchmark: reading raw statements with each installed Excel engine, a full
+read_detected parse and a streamed iter_excel_chunks pass over a synthetic
+.xlsx sheet, plus the sample files in data/raw.
+
+Usage:
+    python -m benchmarks.bench_excel_engines [rows]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import raw_statement
+from src.reader.engines import available_engines, set_excel_engine
+from src.reader.excel_reader import iter_excel_chunks, read_detected
+from src.utils.file_manager import DATA_RAW
+
+def _measure(label: str, read) -> None:
+    start = time.perf_counter()
+    rows = read()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<44} {elapsed:7.3f} s  {rows:>8} rows")
+
+def _bench_file(path: Path, engines) -> None:
+    for engine in engines:
+        if path.suffix.lower() not in ('.xlsx', '.xlsm') and engine == 'openpyxl':
+            continue
+        if path.suffix.lower() != '.xls' and engine == 'xlrd':
+            continue
+        set_excel_engine(engine)
+        _measure(f"{path.name} read_detected {engine}", lambda: len(read_detected(path)[1]))
+        _measure(f"{path.name} iter_excel_chunks {engine}",
+                 lambda: sum(len(chunk) for chunk in iter_excel_chunks(path, 10_000)))
+    set_excel_engine(None)
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    engines = available_engines()
+    print(f"Installed engines: {', '.join(engines)}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "statement.xlsx"
+        raw_statement('BCP', rows).to_excel(path, header=False, index=False)
+        _bench_file(path, engines)
+
+    for path in sorted(DATA_RAW.glob("*.xls*")):
+        _bench_file(path, engines)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmark: writing a processed statement with a single df.to_csv call against
+the atomic chunked writer, uncompressed and gzip/zstd compressed (time and
+file size).
+
+Usage:
+    python -m benchmarks.bench_output_writer [rows]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import standardized_statements
+from src.utils.schema import STANDARD_DATE_FORMATS, STANDARD_FLOAT_FORMAT
+from src.utils.stream_writer import write_csv
+
+def _measure(label: str, write, rows: int) -> None:
+    start = time.perf_counter()
+    path = write()
+    elapsed = time.perf_counter() - start
+    size = path.stat().st_size
+    print(f"{label:<22} {elapsed:7.3f} s  {size / 1024 / 1024:8.1f} MB  {rows / elapsed:,.0f} rows/s")
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    df = standardized_statements(rows)
+    formats = {'float_format': STANDARD_FLOAT_FORMAT, 'date_format': STANDARD_DATE_FORMATS['transaction_date']}
+    print(f"Rows: {rows}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        def to_csv():
+            path = Path(tmp) / "to_csv.csv"
+            df.to_csv(path, index=False)
+            return path
+
+        _measure("df.to_csv", to_csv, rows)
+        for compression in [None, 'gzip', 'zstd']:
+            _measure(f"write_csv {compression or 'plain'}",
+                     lambda: write_csv(df, Path(tmp) / "writer.csv", compression, **formats), rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmark: partition-parallel cleaning of one large statement across 1-16 workers.
+
+Usage:
+    python -m benchmarks.bench_parallel_clean [rows] [bank]
+"""
+import os
+import sys
+import time
+from functools import partial
+
+from benchmarks.synthetic import raw_statement
+from src.detector.layout_cache import find_header_row
+from src.processors.bcp_cleaner import clean_bcp
+from src.processors.bnb_cleaner import clean_bnb
+from src.processors.parallel import clean_partitioned
+from src.processors.union_cleaner import clean_union, find_union_header_row
+
+WORKER_COUNTS = [1, 2, 4, 8, 16]
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    bank = sys.argv[2] if len(sys.argv) > 2 else 'BCP'
+    df = raw_statement(bank, rows)
+
+    if bank == 'BCP':
+        cleaner, header_row = clean_bcp, find_header_row(df, ['Fecha', 'Hora'])
+    elif bank == 'BNB':
+        cleaner, header_row = partial(clean_bnb, bank_code='BNB1', account_number='1000092297', header_row=0), 1
+    else:
+        cleaner, header_row = partial(clean_union, account_number='10000012345'), find_union_header_row(df)
+
+    print(f"Rows: {rows} ({bank}), CPUs: {os.cpu_count()}")
+    baseline = None
+    for workers in WORKER_COUNTS:
+        start = time.perf_counter()
+        df_clean = clean_partitioned(cleaner, df, header_row, workers=workers, import_batch_id='benchmark')
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>2} workers: {elapsed:.3f} s ({baseline / elapsed:.2f}x), {len(df_clean)} rows")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Benchmark: reconciling a statement against a ledger export that books most of its rows.
+
+Usage:
+    python -m benchmarks.bench_reconcile [rows]
+"""
+import sys
+import time
+
+from benchmarks.synthetic import ledger_entries, standardized_statements
+from src.reconciler.ledger_reconciler import reconcile
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    df_statement = standardized_statements(rows)
+    df_ledger = ledger_entries(df_statement)
+
+    start = time.perf_counter()
+    df_matched, df_unmatched_bank, df_unmatched_ledger, stats = reconcile(df_statement, df_ledger)
+    elapsed = time.perf_counter() - start
+
+    print(f"\nRows: {rows} statement, {len(df_ledger)} ledger")
+    print(f"Reconciliation: {elapsed:.3f} s")
+    for key, value in stats.items():
+        print(f"  {key}: {value}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmark: handing a standardized statement to a non-pandas consumer with
+iterrows() against the record and column batch iterators (time and bytes per
+row object).
+
+Usage:
+    python -m benchmarks.bench_records [rows]
+"""
+import sys
+import time
+
+from benchmarks.synthetic import standardized_statements
+from src.utils.records import iter_column_batches, iter_records
+
+def _measure(label: str, consume, rows: int) -> None:
+    start = time.perf_counter()
+    consume()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:7.3f} s  {rows / elapsed:12,.0f} rows/s")
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    df = standardized_statements(rows)
+    print(f"Rows: {rows}")
+
+    # iterrows is timed on a slice and scaled: it is the slow baseline
+    sample = min(rows, 20_000)
+    start = time.perf_counter()
+    for _, row in df.head(sample).iterrows():
+        row['company_voucher']
+    elapsed = (time.perf_counter() - start) * rows / sample
+    print(f"{'iterrows (extrapolated)':<28} {elapsed:7.3f} s  {rows / elapsed:12,.0f} rows/s")
+
+    _measure("iter_records", lambda: sum(1 for _ in iter_records(df)), rows)
+    _measure("iter_column_batches", lambda: sum(len(b['balance']) for b in iter_column_batches(df)), rows)
+
+    record = next(iter_records(df))
+    row = next(df.iterrows())[1]
+    print(f"Size per row: TransactionRecord {sys.getsizeof(record)} bytes, "
+          f"dict {sys.getsizeof(record.as_dict())} bytes, Series {row.memory_usage(deep=False)}+ bytes")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Benchmark: reloading a year of processed history with bare read_csv vs the typed schema reader.
+
+Both variants end with transaction_date as datetime, the form the enricher needs.
+
+Usage:
+    python -m benchmarks.bench_reload [rows]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.synthetic import standardized_statements
+from src.utils.schema import CSV_ENGINE, read_standardized_csv
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "bcpHistoricos_clean.csv"
+        standardized_statements(rows).to_csv(path, index=False)
+
+        start = time.perf_counter()
+        df_bare = pd.read_csv(path)
+        df_bare['transaction_date'] = pd.to_datetime(df_bare['transaction_date'])
+        bare_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        df_typed = read_standardized_csv(path)
+        typed_time = time.perf_counter() - start
+
+    print(f"Rows: {rows} (engine: {CSV_ENGINE})")
+    print(f"Bare read_csv + to_datetime: {bare_time:.3f} s")
+    print(f"read_standardized_csv:       {typed_time:.3f} s ({bare_time / typed_time:.1f}x)")
+    print(f"bank_voucher dtype: bare {df_bare['bank_voucher'].dtype}, typed {df_typed['bank_voucher'].dtype}")
+
+if __name__ == "__main__":
+    main()
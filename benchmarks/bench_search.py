@@ -0,0 +1,56 @@
+"""
+Benchmark: full-text search through the SQLite index against a scan of the
+description and details text of every loaded statement.
+
+Usage:
+    python -m benchmarks.bench_search [rows]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import standardized_statements
+from src.store.search_index import SearchIndex
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    rng = np.random.default_rng(0)
+    ids = rng.integers(0, 20_000, rows)
+    frames = []
+    for bank_code in ['BCP', 'BNB1', 'UNION']:
+        df = standardized_statements(rows // 3, bank_code=bank_code)
+        df['company_voucher'] = bank_code + '-' + df['company_voucher'].astype(object)
+        df['additional_details'] = ('Nombre Originante: EMPRESA ' + ids[:len(df)].astype(str).astype(object)
+                                    + ' S.R.L. - PAGO FACT ' + np.arange(len(df)).astype(str).astype(object))
+        frames.append(df)
+    df_all = pd.concat(frames, ignore_index=True)
+    print(f"Rows: {len(df_all)} in 3 banks")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = SearchIndex(Path(tmp) / "search.db")
+        start = time.perf_counter()
+        for df in frames:
+            index.add_batch(df)
+        print(f"index build:            {time.perf_counter() - start:.3f} s")
+        start = time.perf_counter()
+        index.add_batch(frames[0])
+        print(f"re-feed unchanged batch: {time.perf_counter() - start:.3f} s")
+
+        target = 'EMPRESA 123 S.R.L.'
+        start = time.perf_counter()
+        text = df_all['description'].astype(object) + ' ' + df_all['additional_details']
+        scanned = df_all[text.str.contains(target, case=False, regex=False)]
+        scan = time.perf_counter() - start
+        start = time.perf_counter()
+        found = index.search('empresa 123 s.r.l', limit=len(df_all))
+        indexed = time.perf_counter() - start
+        print(f"search: scan {scan * 1000:.1f} ms, index {indexed * 1000:.2f} ms, {len(found)} rows")
+        assert len(found) == len(scanned)
+        index.close()
+
+if __name__ == "__main__":
+    main()
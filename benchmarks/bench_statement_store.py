@@ -0,0 +1,55 @@
+"""
+Benchmark: one account-year query from the partitioned statement store against
+loading every processed CSV and filtering it.
+
+Usage:
+    python -m benchmarks.bench_statement_store [rows_per_account_year] [accounts] [years]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.synthetic import standardized_statements
+from src.store.statement_store import StatementStore
+from src.utils.schema import read_standardized_csv
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    accounts = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    years = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+    print(f"Rows: {rows * accounts * years} ({accounts} accounts, {years} years)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = StatementStore(Path(tmp) / "statements")
+        csv_files = []
+        start = time.perf_counter()
+        for account in range(accounts):
+            for year in range(years):
+                df = standardized_statements(rows, account_number=str(201204 + account),
+                                             start=f'{2022 + year}-01-01', seed=account * years + year)
+                df['company_voucher'] = df['company_voucher'] + f'-{account}'
+                csv_file = Path(tmp) / f"statement_{account}_{year}_clean.csv"
+                df.to_csv(csv_file, index=False)
+                csv_files.append(csv_file)
+                store.append(df)
+        print(f"write (CSV + store):  {time.perf_counter() - start:.3f} s")
+
+        start = time.perf_counter()
+        df_all = pd.concat([read_standardized_csv(path) for path in csv_files], ignore_index=True)
+        scanned = df_all[(df_all['account_number'] == '201205')
+                         & (df_all['transaction_date'] >= '2023-01-01') & (df_all['transaction_date'] <= '2023-12-31')
+                         & (df_all['credit_amount'] >= 1000)]
+        scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = store.query(account_number='201205', start='2023-01-01', end='2023-12-31', min_amount=1000,
+                            columns=['company_voucher', 'transaction_date', 'credit_amount', 'debit_amount'])
+        queried = time.perf_counter() - start
+        print(f"account-year query: load CSVs {scan:.3f} s, store {queried:.3f} s, {len(found)} rows")
+        assert set(scanned['company_voucher']) <= set(found['company_voucher'])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark: per-cell clean_text against column-wise normalize_text on a large,
+repetitive text column. Reports CPU time and the memory held by the result.
+
+Usage:
+    python -m benchmarks.bench_text_normalization [rows] [distinct]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import random_descriptions
+from src.utils.formatter import clean_text, normalize_text
+
+def messy_texts(n: int, distinct: int) -> pd.Series:
+    """Descriptions as exported: padded, doubled spaces, escaped line breaks, some missing."""
+    rng = np.random.default_rng(1)
+    texts = random_descriptions(n, distinct=distinct).to_numpy(dtype=object)
+    noise = np.array(['  {}  ', '{}\\n', '{}', '\t{}'], dtype=object)
+    texts = np.array([pattern.format(text).replace(' ', '  ', 1)
+                      for pattern, text in zip(noise[rng.integers(0, len(noise), n)], texts)], dtype=object)
+    texts[rng.random(n) < 0.01] = None
+    return pd.Series(texts, dtype=object)
+
+def held_bytes(values: pd.Series) -> int:
+    """Memory held by a column; shared string objects are counted once."""
+    if values.dtype != object:
+        return int(values.memory_usage(deep=True, index=False))
+    distinct = {id(value): value for value in values.to_numpy()}
+    return values.to_numpy().nbytes + sum(sys.getsizeof(value) for value in distinct.values())
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    values = messy_texts(rows, distinct)
+    print(f"Rows: {rows}, distinct descriptions: {distinct}")
+
+    start = time.perf_counter()
+    per_cell = pd.Series([clean_text(value) for value in values], dtype=object)
+    baseline = time.perf_counter() - start
+
+    runs = [
+        ('clean_text per cell', per_cell, baseline),
+        ('same, as arrow str', per_cell.astype('str'), baseline),
+    ]
+    for label, options in [('normalize_text', {}), ('normalize_text categorical', {'categorical': True}),
+                           ('normalize_text NFKC', {'unicode_form': 'NFKC'})]:
+        start = time.perf_counter()
+        result = normalize_text(values, **options)
+        runs.append((label, result, time.perf_counter() - start))
+        assert result.astype(object).where(result.notna(), None).tolist() == per_cell.tolist()
+
+    for label, result, elapsed in runs:
+        print(f"{label:<28} {elapsed:7.3f} s ({baseline / elapsed:5.1f}x)  {held_bytes(result) / 2**20:8.1f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Benchmark: pairing internal transfers over a year of five accounts.
+
+Usage:
+    python -m benchmarks.bench_transfers [rows_per_account]
+"""
+import sys
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import standardized_statements
+from src.reconciler.transfer_pairing import pair_internal_transfers
+
+BANK_CODES = ['BCP', 'BNB1', 'BNB2', 'BNBUSD', 'UNION']
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    df = pd.concat([
+        standardized_statements(rows, bank_code=bank_code, account_number=str(seed), seed=seed)
+        for seed, bank_code in enumerate(BANK_CODES)
+    ], ignore_index=True)
+
+    start = time.perf_counter()
+    df_paired, stats = pair_internal_transfers(df)
+    elapsed = time.perf_counter() - start
+
+    print(f"Rows: {len(df)} ({len(BANK_CODES)} accounts)")
+    print(f"Transfer pairing: {elapsed:.3f} s")
+    for key, value in stats.items():
+        print(f"  {key}: {value}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Synthetic bank data generators for benchmarks and scaling tests.
+"""
+import numpy as np
+import pandas as pd
+
+DESCRIPTIONS = [
+    'Abono Cta por ACH', 'Cargo por transferencia', 'TRANSFERENCIA ENTRE CUENTAS',
+    'PAGO FACTURA', 'DEPOSITO EN EFECTIVO', 'TRASPASO A CUENTA PROPIA',
+    'COMISION MANTENIMIENTO', 'Débito automático', 'CREDITO POR INTERESES',
+    'RETIRO CAJERO', 'TRF RECIBIDA QR', 'OTRO TIPO DE OPERACION'
+]
+
+def random_descriptions(n: int, distinct: int = 5000, seed: int = 0) -> pd.Series:
+    """Generate n repetitive transaction descriptions drawn from a pool of distinct values."""
+    rng = np.random.default_rng(seed)
+    pool = np.array([
+        f"{DESCRIPTIONS[i % len(DESCRIPTIONS)]} {i // len(DESCRIPTIONS):05d}"
+        for i in range(distinct)
+    ], dtype=object)
+    return pd.Series(pool[rng.integers(0, distinct, n)])
+
+def standardized_statements(n: int, bank_code: str = 'BCP', account_number: str = '201204',
+                            start: str = '2024-01-01', days: int = 365, seed: int = 0) -> pd.DataFrame:
+    """Generate n rows of a cleaned statement in the bank_statements layout, sorted by date and time."""
+    from src.utils.schema import STANDARD_COLUMNS
+
+    rng = np.random.default_rng(seed)
+    timestamps = np.sort(
+        pd.Timestamp(start).value + rng.integers(0, days * 86_400, n) * 1_000_000_000
+    )
+    timestamps = pd.to_datetime(timestamps)
+    amounts = np.round(rng.choice([-1, 1], n) * rng.lognormal(5, 1.5, n), 2)
+    vouchers = pd.Series(np.arange(100_000, 100_000 + n)).astype(str)
+
+    df = pd.DataFrame({
+        'bank_code': bank_code,
+        'account_number': account_number,
+        'company_voucher': f"{bank_code}-" + timestamps.strftime('%Y%m%d') + '-' + vouchers,
+        'bank_voucher': vouchers,
+        'transaction_date': timestamps.date,
+        'transaction_time': timestamps.time,
+        'description': random_descriptions(n, seed=seed),
+        'transaction_type': 'OTHER',
+        'reference_number': vouchers,
+        'transaction_code': '2401',
+        'debit_amount': np.where(amounts < 0, -amounts, np.nan),
+        'credit_amount': np.where(amounts > 0, amounts, np.nan),
+        'balance': np.round(100_000 + np.cumsum(amounts), 2),
+        'itf_amount': 0.00,
+        'branch_office': None,
+        'agency_code': '201204',
+        'user_code': 'TLC',
+        'operation_number': vouchers,
+        'additional_details': None,
+        'import_batch_id': '00000000-0000-4000-8000-000000000000'
+    })
+    return df[STANDARD_COLUMNS]
+
+def ledger_entries(df_statement: pd.DataFrame, coverage: float = 0.98, reference_share: float = 0.3,
+                   max_shift_days: int = 3, seed: int = 0) -> pd.DataFrame:
+    """Generate a ledger export booking most statement rows, some with their voucher and a shifted date."""
+    rng = np.random.default_rng(seed)
+    n = len(df_statement)
+    amounts = df_statement['credit_amount'].fillna(0) - df_statement['debit_amount'].fillna(0)
+    shift = rng.integers(-max_shift_days, max_shift_days + 1, n) * (rng.random(n) < 0.5)
+    df = pd.DataFrame({
+        'entry_id': pd.Series(np.arange(n)).astype(str),
+        'entry_date': pd.to_datetime(df_statement['transaction_date']) + pd.to_timedelta(shift, unit='D'),
+        'account_number': df_statement['account_number'],
+        'reference': df_statement['company_voucher'].where(rng.random(n) < reference_share),
+        'description': df_statement['description'],
+        'amount': amounts.round(2)
+    })
+    return df.sample(frac=coverage, random_state=seed).reset_index(drop=True)
+
+def payment_report(df_statement: pd.DataFrame, coverage: float = 0.5, seed: int = 0) -> pd.DataFrame:
+    """Generate a cleaned BCP payment report paying a share of the statement credits."""
+    rng = np.random.default_rng(seed)
+    df_credits = df_statement[df_statement['credit_amount'].notna()]
+    df_credits = df_credits[rng.random(len(df_credits)) < coverage]
+    n = len(df_credits)
+    numbers = pd.Series(np.arange(n)).astype(str).to_numpy()
+    return pd.DataFrame({
+        'CANAL': rng.choice(['BANCA MOVIL', 'ACH', 'QR', 'CAJA'], n),
+        'FECHA': pd.to_datetime(df_credits['transaction_date']).dt.strftime('%d/%m/%Y').to_numpy(),
+        'HORA': '10:00:00',
+        'MONTO ABONADO': df_credits['credit_amount'].to_numpy(),
+        'MONTO OP.': df_credits['credit_amount'].to_numpy(),
+        'MONEDA OP.': 'BOB',
+        'GLOSA': 'FACT ' + numbers,
+        'TITULAR': 'CLIENTE ' + numbers,
+        'Adicionales': 'CLIENTE ' + numbers + ' - FACT ' + numbers,
+    })
+
+def raw_payment_report(n: int, seed: int = 0) -> pd.DataFrame:
+    """Generate a raw BCP payment report sheet (header row, n payments) as read without headers."""
+    rng = np.random.default_rng(seed)
+    dates = pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 365, n), unit='D')
+    times = pd.to_timedelta(rng.integers(0, 86_400, n), unit='s')
+    amounts = np.round(rng.lognormal(5, 1.5, n), 2)
+    numbers = np.arange(n).astype(str)
+    header = ['CANAL', 'FECHA', 'HORA', 'MONTO ABONADO', 'MONTO OP.', 'MONEDA OP.', 'GLOSA', 'TITULAR']
+    body = {
+        0: rng.choice(['BANCA MOVIL', 'ACH', 'QR', 'CAJA'], n),
+        1: dates.strftime('%d/%m/%Y'),
+        2: (pd.Timestamp('2024-01-01') + times).strftime('%H:%M:%S'),
+        3: pd.Series(amounts).map('{:,.2f}'.format).to_numpy(),
+        4: amounts,
+        5: 'BOB',
+        6: np.where(rng.random(n) < 0.9, np.char.add('FACT ', numbers), None),
+        7: np.where(rng.random(n) < 0.95, np.char.add('CLIENTE ', numbers), None),
+    }
+    df_body = pd.DataFrame(body, index=range(n), dtype=object)
+    return pd.concat([pd.DataFrame([header], dtype=object), df_body], ignore_index=True)
+
+def raw_statement(bank: str, n: int, seed: int = 0) -> pd.DataFrame:
+    """Generate a raw BCP, BNB or UNION sheet (title rows, header row, n movements) as read without headers."""
+    rng = np.random.default_rng(seed)
+    dates = (pd.Timestamp('2024-01-01') + pd.to_timedelta(np.sort(rng.integers(0, 365, n)), unit='D')).strftime('%d/%m/%Y')
+    amounts = np.round(rng.choice([-1, 1], n) * rng.lognormal(5, 1.5, n), 2)
+    balances = np.round(100_000 + np.cumsum(amounts), 2)
+    descriptions = random_descriptions(n, seed=seed).to_numpy()
+    numbers = np.arange(100_000, 100_000 + n).astype(str)
+
+    def fmt(values):
+        return pd.Series(values).map('{:,.2f}'.format).to_numpy()
+
+    if bank == 'BCP':
+        title = [['Cuenta', '201-0005751-3-23'] + [None] * 7, [None] * 9]
+        header = ['Fecha', 'Hora', 'Glosa', 'Tipo', 'Suc. Age.', 'Usuario', 'Importe', 'Saldo', 'Nro. Operación']
+        body = {0: dates, 1: '10:14:28', 2: descriptions, 3: '2401', 4: '201204', 5: 'TLC',
+                6: fmt(amounts), 7: fmt(balances), 8: numbers}
+    elif bank == 'BNB':
+        title = [['Número De cuenta', '1000092297'] + [None] * 9]
+        header = ['Fecha', 'Hora', 'Oficina', 'Descripción', 'Referencia', 'Código de transacción',
+                  'ITF', 'Débitos', 'Créditos', 'Saldo', 'Adicionales']
+        body = {0: dates, 1: '15:20:16', 2: 'LA PAZ-AGENCIA CENTRAL', 3: descriptions, 4: numbers,
+                5: np.char.add('1O5T3', numbers), 6: '0.00', 7: fmt(np.where(amounts < 0, -amounts, 0)),
+                8: fmt(np.where(amounts > 0, amounts, 0)), 9: fmt(balances), 10: 'Cuenta Origen: 1041305633.'}
+    elif bank == 'UNION':
+        title = [['Cuenta:', None, '10000012345'] + [None] * 4]
+        header = ['Fecha Movimiento', 'AG', 'Descripción', 'Nro Documento', 'Monto', 'Saldo', 'Adicionales']
+        body = {0: dates, 1: '201', 2: descriptions, 3: numbers, 4: amounts, 5: balances, 6: 'Obs'}
+    else:
+        raise ValueError(f"Unknown bank {bank}")
+
+    df_body = pd.DataFrame(body, index=range(n), dtype=object)
+    return pd.concat([pd.DataFrame(title + [header], dtype=object), df_body], ignore_index=True)
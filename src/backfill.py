@@ -0,0 +1,36 @@
+"""
+backfill.py - Out-of-core processing of many statement files with bounded memory.
+
+Usage: python -m src.backfill [--memory-mb MB] [--output NAME] [--compression gzip|zstd] [--engine NAME] <file.xlsx> [...]
+"""
+import argparse
+
+from src.reader.engines import EXCEL_ENGINES, set_excel_engine
+from src.utils.file_manager import COMPRESSION_SUFFIXES, DATA_RAW, ensure_dirs
+from src.workflows.backfill_workflow import DEFAULT_MEMORY_BUDGET_MB, process_backfill_workflow
+
+def main():
+    """Entry point of the out-of-core backfill."""
+    parser = argparse.ArgumentParser(description="Clean, validate and enrich many statements chunk by chunk.")
+    parser.add_argument('files', nargs='+', help="Statement files in data/raw")
+    parser.add_argument('--memory-mb', type=int, default=DEFAULT_MEMORY_BUDGET_MB,
+                        help=f"Memory budget in MB (default {DEFAULT_MEMORY_BUDGET_MB})")
+    parser.add_argument('--output', default="backfill", help="Prefix of the output files (default backfill)")
+    parser.add_argument('--compression', choices=sorted(COMPRESSION_SUFFIXES), help="Compress the output files")
+    parser.add_argument('--engine', choices=list(EXCEL_ENGINES),
+                        help="Excel reader engine (default: fastest installed for the file type)")
+    args = parser.parse_args()
+    set_excel_engine(args.engine)
+
+    ensure_dirs()
+    file_paths = [DATA_RAW / name for name in args.files]
+    missing = [path for path in file_paths if not path.exists()]
+    if missing:
+        for path in missing:
+            print(f"File not found: {path}")
+        return
+
+    process_backfill_workflow(file_paths, args.output, args.memory_mb, args.compression)
+
+if __name__ == "__main__":
+    main()
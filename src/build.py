@@ -0,0 +1,67 @@
+"""
+build.py - Bring every processed output up to date with the raw files.
+
+Usage: python -m src.build [--force] [--engine NAME] [--compression gzip|zstd] [<file.xls> ...]
+
+Each raw file in data/raw is cleaned only when it (or its *_clean.csv) changed
+since the last build, and bcp_final.csv is enriched again only when the cleaned
+BCP statement or the payment store changed. A run with nothing to do only
+stats the files.
+"""
+import argparse
+import time
+
+from src.reader.engines import EXCEL_ENGINES, set_excel_engine
+from src.utils.build_state import get_build_state
+from src.utils.file_manager import (BCP_FINAL_FILE, COMPRESSION_SUFFIXES, DATA_RAW, bcp_final_inputs,
+                                    clean_output_path, ensure_dirs, find_bcp_clean_statement, output_path,
+                                    set_output_compression)
+
+RAW_SUFFIXES = ('.xls', '.xlsx')
+
+def main():
+    """Entry point of the incremental build."""
+    parser = argparse.ArgumentParser(description="Rebuild the processed outputs whose inputs changed.")
+    parser.add_argument('files', nargs='*', help="Raw files in data/raw (default: all Excel files)")
+    parser.add_argument('--force', action='store_true', help="Rebuild every output")
+    parser.add_argument('--engine', choices=list(EXCEL_ENGINES),
+                        help="Excel reader engine (default: fastest installed for the file type)")
+    parser.add_argument('--compression', choices=sorted(COMPRESSION_SUFFIXES), help="Compress the processed outputs")
+    args = parser.parse_args()
+    set_excel_engine(args.engine)
+    set_output_compression(args.compression)
+
+    start = time.perf_counter()
+    ensure_dirs()
+    if args.files:
+        file_paths = [DATA_RAW / name for name in args.files]
+    else:
+        file_paths = sorted(p for p in DATA_RAW.iterdir() if p.suffix.lower() in RAW_SUFFIXES)
+
+    state = get_build_state()
+    rebuilt = 0
+    for file_path in file_paths:
+        if not file_path.exists():
+            print(f"File not found: {file_path}")
+            continue
+        if not args.force and state.is_current(clean_output_path(file_path), [file_path]):
+            continue
+        # Imported on demand: a run with nothing to rebuild never loads pandas
+        from src.main import process_file
+        process_file(file_path, force=True)
+        rebuilt += 1
+
+    statement_file = find_bcp_clean_statement()
+    inputs = bcp_final_inputs(statement_file) if statement_file else []
+    if len(inputs) > 1 and (args.force or not state.is_current(output_path(BCP_FINAL_FILE), inputs)):
+        from src.workflows.bcp_workflow import build_bcp_final
+        # Only the changed dates are enriched again, unless the build is forced
+        build_bcp_final(statement_file, force=args.force)
+        rebuilt += 1
+
+    state.save()
+    print(f"{rebuilt} outputs rebuilt, {len(file_paths) + (len(inputs) > 1) - rebuilt} up to date "
+          f"({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+if __name__ == "__main__":
+    main()
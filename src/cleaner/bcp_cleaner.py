@@ -4,7 +4,7 @@ BCP statement cleaner implementation.
 from typing import Dict
 import pandas as pd
 from .base_cleaner import BankStatementCleaner
-from ..utils.formatter import clean_text, format_currency, standardize_date
+from ..utils.formatter import format_currency, normalize_text, standardize_date
 
 class BCPCleaner(BankStatementCleaner):
     def get_column_mapping(self) -> Dict[str, str]:
@@ -60,7 +60,7 @@ class BCPCleaner(BankStatementCleaner):
             df_clean['Saldo'] = df_clean['Saldo'].apply(format_currency)
             
         if 'Glosa' in df_clean.columns:
-            df_clean['Glosa'] = df_clean['Glosa'].apply(clean_text)
+            df_clean['Glosa'] = normalize_text(df_clean['Glosa'])
             
         # Reset index and standardize columns
         df_clean = df_clean.reset_index(drop=True)
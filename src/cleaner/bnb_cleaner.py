@@ -4,7 +4,7 @@ BNB statement cleaner implementation.
 from typing import Dict
 import pandas as pd
 from .base_cleaner import BankStatementCleaner
-from ..utils.formatter import clean_text, format_currency, standardize_date
+from ..utils.formatter import format_currency, normalize_text, standardize_date
 
 class BNBCleaner(BankStatementCleaner):
     def get_column_mapping(self) -> Dict[str, str]:
@@ -39,9 +39,7 @@ class BNBCleaner(BankStatementCleaner):
         text_columns = ['Referencia', 'Descripción', 'Código de transacción', 'Adicionales']
         for col in text_columns:
             if col in df_clean.columns:
-                df_clean[col] = df_clean[col].apply(
-                    lambda x: clean_text(x, remove_all_spaces=(col=='Código de transacción'))
-                )
+                df_clean[col] = normalize_text(df_clean[col], remove_all_spaces=(col=='Código de transacción'))
         
         # Clean numeric columns
         numeric_columns = ['Débitos', 'Créditos', 'Saldo', 'ITF']
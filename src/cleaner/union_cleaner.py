@@ -4,7 +4,7 @@ UNION bank statement cleaner implementation.
 from typing import Dict
 import pandas as pd
 from .base_cleaner import BankStatementCleaner
-from ..utils.formatter import clean_text, format_currency, standardize_date
+from ..utils.formatter import clean_text, format_currency, normalize_text, standardize_date
 
 class UnionCleaner(BankStatementCleaner):
     def get_column_mapping(self) -> Dict[str, str]:
@@ -63,10 +63,10 @@ class UnionCleaner(BankStatementCleaner):
         
         # Clean text fields
         if 'Descripción' in df_clean.columns:
-            df_clean['Descripción'] = df_clean['Descripción'].apply(clean_text)
+            df_clean['Descripción'] = normalize_text(df_clean['Descripción'])
             
         if 'Adicionales' in df_clean.columns:
-            df_clean['Adicionales'] = df_clean['Adicionales'].apply(clean_text)
+            df_clean['Adicionales'] = normalize_text(df_clean['Adicionales'])
             
         # Clean numeric fields
         if 'Monto' in df_clean.columns:
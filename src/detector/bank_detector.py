@@ -2,7 +2,9 @@
 Bank and account detection module.
 """
 import pandas as pd
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
+
+from src.detector.layout_cache import find_header_row
 
 def detect_bank_and_account(df: pd.DataFrame) -> Tuple[str, str]:
     """
@@ -70,3 +72,51 @@ def detect_bcp_payment_report(df: pd.DataFrame) -> Tuple[bool, Optional[str]]:
                             return True, account
                 return True, None
     return False, None
+
+# Header labels per file kind: (labels, find_header_row options)
+HEADER_LABELS = {
+    'BCP': (['Fecha', 'Hora'], {}),
+    'BNB': (['Fecha', 'Descripción'], {'exact': True}),
+    'UNION': (['Fecha Movimiento'], {'exact': True}),
+    'BCP_PAYMENTS': (['FECHA', 'MONTO ABONADO'], {'case_sensitive': False}),
+}
+
+def detect_file_layout(df_peek: pd.DataFrame) -> Dict:
+    """
+    Decide file kind, bank and account from the first rows of a file and plan
+    how to parse the rest of it.
+    
+    Args:
+        df_peek: First rows of the sheet, read without headers
+        
+    Returns:
+        dict: {
+            'kind': 'payment_report' or 'statement',
+            'bank': bank name as returned by detect_bank_and_account,
+            'account': detected account number,
+            'header_row': header position in the frame read with read_options,
+            'read_options': pd.read_excel options (skiprows) for the body
+        }
+    """
+    is_payment_report, account = detect_bcp_payment_report(df_peek)
+    if is_payment_report:
+        kind, bank, labels_key = 'payment_report', 'BCP', 'BCP_PAYMENTS'
+    else:
+        kind = 'statement'
+        bank, account = detect_bank_and_account(df_peek)
+        labels_key = 'BNB' if bank.startswith('BNB') else bank
+        
+    layout = {'kind': kind, 'bank': bank, 'account': account, 'header_row': None, 'read_options': {}}
+    if labels_key not in HEADER_LABELS:
+        return layout
+        
+    labels, options = HEADER_LABELS[labels_key]
+    header_row = find_header_row(df_peek, labels, **options)
+    if header_row is None:
+        return layout
+        
+    # Skip the title rows; every column is kept, since data may sit under a
+    # blank header cell (the cleaners drop the empty columns)
+    layout['header_row'] = 0
+    layout['read_options'] = {'skiprows': header_row}
+    return layout
@@ -0,0 +1,151 @@
+"""
+Header detection and layout cache for bank statement files.
+
+Exports from a given bank portal keep the same layout month after month. The
+layout cache stores, per bank, the header row index and the resolved column
+mapping under a fingerprint of the non-null cell pattern of the first rows, so
+repeat layouts skip header and column detection.
+"""
+import hashlib
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from src.utils.file_manager import DATA_PROCESSED, atomic_path
+
+LAYOUT_CACHE_FILE = DATA_PROCESSED / "layout_cache.json"
+
+# Rows of the raw sheet used to fingerprint its layout
+FINGERPRINT_ROWS = 10
+
+# Rows scanned first when looking for a header row
+HEADER_SCAN_ROWS = 100
+
+def _rows_containing(block: pd.DataFrame, label: str, exact: bool, case_sensitive: bool) -> np.ndarray:
+    """Boolean mask of the rows with a cell equal to (or containing) label."""
+    if exact:
+        return block.eq(label).any(axis=1).to_numpy()
+    hits = np.zeros(len(block), dtype=bool)
+    for col in block.columns:
+        values = block[col]
+        # Only text columns can hold a header label
+        if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_datetime64_any_dtype(values):
+            continue
+        hits |= values.astype('string').str.contains(label, case=case_sensitive, regex=False, na=False).to_numpy()
+    return hits
+
+def find_header_row(df: pd.DataFrame, labels: Sequence[str], exact: bool = False,
+                    case_sensitive: bool = True, last: bool = False) -> Optional[int]:
+    """
+    Find the position of the header row of a raw sheet.
+
+    Args:
+        df (pd.DataFrame): Raw sheet read without headers
+        labels (list): Labels that must all appear in the header row
+        exact (bool): If True a cell must equal the label, otherwise contain it
+        case_sensitive (bool): Whether label matching is case sensitive
+        last (bool): Return the last matching row instead of the first one
+
+    Returns:
+        int | None: Row position of the header, None if not found
+    """
+    blocks = [df] if last else [df.iloc[:HEADER_SCAN_ROWS], df.iloc[HEADER_SCAN_ROWS:]]
+    offset = 0
+    for block in blocks:
+        if not block.empty:
+            mask = np.ones(len(block), dtype=bool)
+            for label in labels:
+                mask &= _rows_containing(block, label, exact, case_sensitive)
+            positions = np.flatnonzero(mask)
+            if len(positions):
+                return offset + int(positions[-1] if last else positions[0])
+        offset += len(block)
+    return None
+
+def layout_fingerprint(df: pd.DataFrame, n_rows: int = FINGERPRINT_ROWS) -> str:
+    """
+    Fingerprint the layout of a raw sheet from the non-null pattern of its first rows.
+
+    Args:
+        df (pd.DataFrame): Raw sheet read without headers
+        n_rows (int): Number of leading rows to fingerprint
+
+    Returns:
+        str: Hex digest identifying the layout
+    """
+    pattern = df.iloc[:n_rows].notna().to_numpy()
+    digest = hashlib.sha1(f"{pattern.shape}".encode())
+    digest.update(np.packbits(pattern).tobytes())
+    return digest.hexdigest()
+
+def _header_labels(row: pd.Series) -> List[str]:
+    return ['' if pd.isna(val) else str(val) for val in row]
+
+class LayoutCache:
+    """Persistent cache of header rows and column mappings keyed by layout fingerprint."""
+
+    def __init__(self, path: Path = LAYOUT_CACHE_FILE, n_rows: int = FINGERPRINT_ROWS):
+        self.path = Path(path)
+        self.n_rows = n_rows
+        self._layouts: Optional[Dict[str, Dict]] = None
+
+    def _load(self) -> Dict[str, Dict]:
+        if self._layouts is None:
+            try:
+                self._layouts = json.loads(self.path.read_text(encoding='utf-8'))
+            except (FileNotFoundError, ValueError):
+                self._layouts = {}
+        return self._layouts
+
+    def _key(self, bank: str, df: pd.DataFrame) -> str:
+        return f"{bank}:{layout_fingerprint(df, self.n_rows)}"
+
+    def get(self, bank: str, df: pd.DataFrame) -> Optional[Dict]:
+        """
+        Look up the cached layout of a raw sheet.
+
+        Args:
+            bank (str): Bank or file kind the layout belongs to
+            df (pd.DataFrame): Raw sheet read without headers
+
+        Returns:
+            dict | None: {'header_row': int, 'columns': dict} on a hit, None on a miss
+        """
+        layout = self._load().get(self._key(bank, df))
+        if layout is None or layout['header_row'] >= len(df):
+            return None
+        # Guard against fingerprint collisions: the header labels must match too
+        if _header_labels(df.iloc[layout['header_row']]) != layout['headers']:
+            return None
+        return layout
+
+    def put(self, bank: str, df: pd.DataFrame, header_row: int, columns: Optional[Dict] = None) -> None:
+        """
+        Store the resolved layout of a raw sheet.
+
+        Args:
+            bank (str): Bank or file kind the layout belongs to
+            df (pd.DataFrame): Raw sheet read without headers
+            header_row (int): Position of the header row
+            columns (dict, optional): Resolved mapping of standard to source column names
+        """
+        layouts = self._load()
+        layouts[self._key(bank, df)] = {
+            'header_row': int(header_row),
+            'headers': _header_labels(df.iloc[header_row]),
+            'columns': columns or {}
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_path(self.path) as tmp_path:
+            tmp_path.write_text(json.dumps(layouts, ensure_ascii=False, indent=2), encoding='utf-8')
+
+_default_cache: Optional[LayoutCache] = None
+
+def get_layout_cache() -> LayoutCache:
+    """Return the shared layout cache stored in the processed data folder."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = LayoutCache()
+    return _default_cache
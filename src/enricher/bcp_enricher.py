@@ -4,66 +4,23 @@ BCP payment details enrichment module.
 from pathlib import Path
 import pandas as pd
 from typing import Dict, Tuple
-from ..utils.formatter import clean_text, format_currency, standardize_date
+from ..processors.bcp_payment_cleaner import clean_bcp_payments
+from ..store.payment_store import PaymentStore, PAYMENT_KEY_COLUMNS, add_payment_keys
 
 class BCPEnricher:
     def clean_payment_report(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and standardize BCP payment report data."""
-        # Find header row
-        header_row = None
-        for i, row in df.iterrows():
-            if any(isinstance(val, str) and 'FECHA' in str(val).upper() for val in row) and \
-               any(isinstance(val, str) and 'MONTO ABONADO' in str(val).upper() for val in row):
-                header_row = i
-                break
-        
-        if header_row is None:
-            return pd.DataFrame()
-            
-        # Create clean DataFrame
-        df_clean = df.iloc[header_row+1:].copy()
-        df_clean.columns = df.iloc[header_row]
-        
-        # Select relevant columns
-        required_columns = [
-            'CANAL', 'FECHA', 'HORA', 'MONTO ABONADO',
-            'MONTO OP.', 'MONEDA OP.', 'GLOSA', 'TITULAR'
-        ]
-        
-        df_new = pd.DataFrame()
-        for col in required_columns:
-            if col in df_clean.columns:
-                df_new[col] = df_clean[col]
-            else:
-                df_new[col] = None
-                
-        # Remove empty rows
-        df_new = df_new.dropna(how='all')
-        
-        # Clean dates and convert to datetime
-        if 'FECHA' in df_new.columns:
-            df_new['FECHA'] = pd.to_datetime(df_new['FECHA'].apply(standardize_date))
-            
-        # Clean amounts
-        if 'MONTO ABONADO' in df_new.columns:
-            df_new['MONTO ABONADO'] = df_new['MONTO ABONADO'].apply(format_currency)
-            
-        # Generate enriched details column
-        df_new['Adicionales'] = df_new.apply(
-            lambda row: ' - '.join(filter(pd.notna, [
-                row.get('TITULAR', None),
-                row.get('GLOSA', None),
-                f"Canal: {row.get('CANAL', '')}" if pd.notna(row.get('CANAL', None)) else None
-            ])),
-            axis=1
-        )
-        
-        return df_new
+        """Clean and standardize BCP payment report data (see clean_bcp_payments)."""
+        return clean_bcp_payments(df)
         
     def enrich_statement(self, df_bcp: pd.DataFrame, df_payments: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
         """
         Enrich BCP statement with payment details according to updated mapping schema.
         
+        Statement rows and payments are matched on (date, amount in cents) with a
+        keyed join. Both the raw statement layout (Fecha/Importe, details written to
+        Adicionales) and the standardized bank_statements layout (transaction_date/
+        credit_amount, details written to additional_details) are accepted.
+        
         Args:
             df_bcp (pd.DataFrame): Cleaned BCP statement
             df_payments (pd.DataFrame): Cleaned payment details
@@ -80,10 +37,12 @@ class BCPEnricher:
         
         # Verify required columns
         required_bcp = ['Fecha', 'Importe', 'Nro. Operación']
+        required_standard = ['transaction_date', 'credit_amount', 'additional_details']
         required_payments = ['FECHA', 'MONTO ABONADO', 'Adicionales']
         
-        if not all(col in df_bcp.columns for col in required_bcp):
-            return df_bcp, {'error': f'Missing required columns in BCP statement: {required_bcp}'}
+        is_raw = all(col in df_bcp.columns for col in required_bcp)
+        if not is_raw and not all(col in df_bcp.columns for col in required_standard):
+            return df_bcp, {'error': f'Missing required columns in BCP statement: {required_bcp} or {required_standard}'}
             
         if not all(col in df_payments.columns for col in required_payments):
             return df_bcp, {'error': f'Missing required columns in payment report: {required_payments}'}
@@ -96,33 +55,79 @@ class BCPEnricher:
             'multiple_matches': 0,
             'no_match': 0
         }
-          # Ensure datetime for matching
-        df_enriched['Fecha'] = pd.to_datetime(df_enriched['Fecha'])
-        df_payments['FECHA'] = pd.to_datetime(df_payments['FECHA'], format='%d/%m/%Y')
         
-        # Add details column if not exists
-        if 'Adicionales' not in df_enriched.columns:
-            df_enriched['Adicionales'] = None
+        # Build the (date, cents) key of every statement row
+        if is_raw:
+            df_enriched['Fecha'] = pd.to_datetime(df_enriched['Fecha'])
+            statement_dates = df_enriched['Fecha']
+            statement_amounts = pd.to_numeric(df_enriched['Importe'], errors='coerce').abs()
+            details_column = 'Adicionales'
+        else:
+            # Payment reports only list received credits
+            statement_dates = pd.to_datetime(df_enriched['transaction_date'])
+            statement_amounts = pd.to_numeric(df_enriched['credit_amount'], errors='coerce')
+            details_column = 'additional_details'
             
-        # Match records by date and amount
-        for idx, bcp_row in df_enriched.iterrows():            # Convert amounts to float and round
-            bcp_amount = round(float(abs(bcp_row['Importe'])), 2)
-            payment_amounts = df_payments['MONTO ABONADO'].astype(float).round(2)
-            
-            matches = df_payments[
-                (df_payments['FECHA'] == bcp_row['Fecha']) & 
-                (payment_amounts == bcp_amount)
-            ]
+        # Add details column if not exists
+        if details_column not in df_enriched.columns:
+            df_enriched[details_column] = None
             
-            if len(matches) == 1:
-                # Single match found
-                df_enriched.at[idx, 'Adicionales'] = matches.iloc[0]['Adicionales']
-                stats['matched'] += 1
-            elif len(matches) > 1:
-                # Multiple matches - concatenate details
-                df_enriched.at[idx, 'Adicionales'] = ' | '.join(matches['Adicionales'].dropna())
-                stats['multiple_matches'] += 1
-            else:
-                stats['no_match'] += 1
+        statement_keys = pd.DataFrame({
+            'payment_date': statement_dates.dt.normalize().to_numpy(),
+            'amount_cents': (statement_amounts * 100).round().astype('Int64').to_numpy()
+        })
+        
+        # Collapse payments to one row per key: count and concatenated details
+        payment_details = self._payment_details_by_key(df_payments)
+        matches = statement_keys.merge(payment_details, on=PAYMENT_KEY_COLUMNS, how='left')
+        match_count = matches['match_count'].fillna(0).to_numpy()
+        matched = match_count > 0
+        
+        details = df_enriched[details_column].to_numpy(dtype=object, copy=True)
+        details[matched] = matches['details'].to_numpy()[matched]
+        df_enriched[details_column] = details
+        
+        stats['matched'] = int((match_count == 1).sum())
+        stats['multiple_matches'] = int((match_count > 1).sum())
+        stats['no_match'] = int((match_count == 0).sum())
                 
         return df_enriched, stats
+        
+    def _payment_details_by_key(self, df_payments: pd.DataFrame) -> pd.DataFrame:
+        """Group payments by (date, cents) into a match count and the joined details."""
+        df_keyed = df_payments
+        if not all(col in df_payments.columns for col in PAYMENT_KEY_COLUMNS):
+            df_keyed = add_payment_keys(df_payments)
+        df_keyed = df_keyed.dropna(subset=PAYMENT_KEY_COLUMNS)
+        
+        grouped = df_keyed.groupby(PAYMENT_KEY_COLUMNS, sort=False)['Adicionales']
+        payment_details = grouped.size().rename('match_count').to_frame()
+        payment_details['details'] = grouped.first()
+        
+        # Multiple matches - concatenate details
+        multiple = payment_details['match_count'] > 1
+        if multiple.any():
+            df_multiple = df_keyed.set_index(PAYMENT_KEY_COLUMNS)
+            df_multiple = df_multiple[df_multiple.index.isin(payment_details.index[multiple])]
+            joined = df_multiple.groupby(level=PAYMENT_KEY_COLUMNS, sort=False)['Adicionales'].agg(
+                lambda values: ' | '.join(values.dropna())
+            )
+            payment_details.loc[joined.index, 'details'] = joined
+            
+        return payment_details.reset_index()
+        
+    def enrich_from_store(self, df_bcp: pd.DataFrame, store: PaymentStore) -> Tuple[pd.DataFrame, Dict]:
+        """
+        Enrich a standardized BCP statement with the stored payments of its dates.
+        
+        Only the payment store partitions covering the statement dates are read.
+        
+        Args:
+            df_bcp (pd.DataFrame): Standardized BCP statement
+            store (PaymentStore): Store of all processed payment reports
+            
+        Returns:
+            tuple: (enriched_df, statistics)
+        """
+        df_payments = store.load(df_bcp['transaction_date'].dropna().unique())
+        return self.enrich_statement(df_bcp, df_payments)
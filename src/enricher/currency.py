@@ -0,0 +1,180 @@
+"""
+Conversion of statement and payment report amounts to bolivianos.
+
+Accounts are kept in their own currency (BNBUSD in dollars) and payment
+reports carry the original operation amount in MONEDA OP. When a local
+exchange-rate table exists (data/raw/exchange_rates.csv with rate_date,
+currency and rate in bolivianos per unit), it is loaded once and every
+movement gets the rate of its transaction date, or of the last earlier date
+with a rate. The lookup is a sorted as-of search per currency over the whole
+frame, never a lookup per row.
+"""
+import numpy as np
+import pandas as pd
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from src.utils.file_manager import DATA_RAW
+from src.utils.schema import read_typed_csv
+
+EXCHANGE_RATES_FILE = DATA_RAW / "exchange_rates.csv"
+
+# Bank codes of accounts not held in bolivianos
+ACCOUNT_CURRENCIES: Dict[str, str] = {
+    'BNBUSD': 'USD',
+}
+DEFAULT_CURRENCY = 'BOB'
+
+# Spellings of the currency codes found in bank exports
+CURRENCY_ALIASES: Dict[str, str] = {
+    'BS': 'BOB', 'BS.': 'BOB', 'BOL': 'BOB',
+    '$US': 'USD', 'US$': 'USD', 'SUS': 'USD', '$': 'USD',
+}
+
+RATE_DTYPES = {'currency': str, 'rate': 'float64'}
+RATE_DATE_FORMATS = {'rate_date': '%Y-%m-%d'}
+
+def account_currencies(bank_codes: pd.Series) -> np.ndarray:
+    """
+    Currency of each row from its bank code.
+
+    Args:
+        bank_codes (pd.Series): bank_code column
+
+    Returns:
+        np.ndarray: Currency code per row (BOB unless listed in ACCOUNT_CURRENCIES)
+    """
+    return bank_codes.astype(object).map(ACCOUNT_CURRENCIES).fillna(DEFAULT_CURRENCY).to_numpy(dtype=object)
+
+def normalize_currency(values: pd.Series) -> np.ndarray:
+    """
+    Uppercase ISO codes from the currency spellings of the exports.
+
+    Args:
+        values (pd.Series): Currency column (e.g. MONEDA OP.)
+
+    Returns:
+        np.ndarray: Currency code per row, None where missing
+    """
+    values = pd.Series(values)
+    codes = values.astype(str).str.strip().str.upper().replace(CURRENCY_ALIASES)
+    return codes.astype(object).where(values.notna().to_numpy(), None).to_numpy(dtype=object)
+
+class ExchangeRates:
+    """Daily exchange rates to bolivianos, sorted per currency for as-of lookups."""
+
+    def __init__(self, df_rates: pd.DataFrame):
+        df_rates = df_rates.assign(currency=normalize_currency(df_rates['currency']))
+        df_rates = df_rates.dropna(subset=['rate_date', 'currency', 'rate'])
+        df_rates = df_rates.sort_values(['currency', 'rate_date'], kind='stable')
+        # Last rate of each day wins; dates as day numbers for searchsorted
+        df_rates = df_rates.drop_duplicates(['currency', 'rate_date'], keep='last')
+        self._series: Dict[str, Tuple[np.ndarray, np.ndarray]] = {
+            currency: (_day_numbers(group['rate_date']), group['rate'].to_numpy(dtype='float64'))
+            for currency, group in df_rates.groupby('currency', sort=True)
+        }
+
+    @classmethod
+    def from_csv(cls, path: Path = EXCHANGE_RATES_FILE) -> 'ExchangeRates':
+        """Read a rate table with rate_date (YYYY-MM-DD), currency and rate columns."""
+        return cls(read_typed_csv(path, RATE_DTYPES, RATE_DATE_FORMATS))
+
+    def currencies(self):
+        """Currencies with at least one rate."""
+        return sorted(self._series)
+
+    def rates(self, currencies, dates) -> np.ndarray:
+        """
+        Rate to bolivianos of each row on its date (as of the last earlier rate).
+
+        Args:
+            currencies: Currency code per row
+            dates: Date per row
+
+        Returns:
+            np.ndarray: Rate per row; 1 for bolivianos, NaN without a rate on or before the date
+        """
+        currencies = np.asarray(currencies, dtype=object)
+        dates = pd.to_datetime(pd.Series(np.asarray(dates)), errors='coerce')
+        result = np.full(len(currencies), np.nan)
+        result[currencies == DEFAULT_CURRENCY] = 1.0
+
+        valid = dates.notna().to_numpy()
+        days = np.zeros(len(dates), dtype=np.int64)
+        days[valid] = _day_numbers(dates[valid])
+        for currency, (rate_days, rate_values) in self._series.items():
+            if currency == DEFAULT_CURRENCY:
+                continue
+            rows = np.flatnonzero((currencies == currency) & valid)
+            position = np.searchsorted(rate_days, days[rows], side='right') - 1
+            found = position >= 0
+            result[rows[found]] = rate_values[position[found]]
+        return result
+
+def _day_numbers(dates: pd.Series) -> np.ndarray:
+    return pd.to_datetime(dates).to_numpy(dtype='datetime64[D]').astype(np.int64)
+
+def _amount(df: pd.DataFrame, column: str) -> np.ndarray:
+    values = df[column] if column in df.columns else pd.Series(np.nan, index=df.index)
+    if not pd.api.types.is_numeric_dtype(values):
+        values = values.astype(str).str.replace(',', '', regex=False)
+    return pd.to_numeric(values, errors='coerce').to_numpy(dtype='float64')
+
+def convert_statement_amounts(df: pd.DataFrame, rates: ExchangeRates) -> pd.DataFrame:
+    """
+    Attach the currency, the rate of the day and the amounts in bolivianos to statements.
+
+    Args:
+        df (pd.DataFrame): Standardized statements (one or several banks)
+        rates (ExchangeRates): Exchange rate table
+
+    Returns:
+        pd.DataFrame: Copy of df with currency, exchange_rate, debit_amount_bob,
+        credit_amount_bob and balance_bob
+    """
+    currencies = account_currencies(df['bank_code'])
+    exchange_rate = rates.rates(currencies, df['transaction_date'])
+    return df.assign(
+        currency=currencies,
+        exchange_rate=exchange_rate,
+        debit_amount_bob=np.round(_amount(df, 'debit_amount') * exchange_rate, 2),
+        credit_amount_bob=np.round(_amount(df, 'credit_amount') * exchange_rate, 2),
+        balance_bob=np.round(_amount(df, 'balance') * exchange_rate, 2),
+    )
+
+def convert_payment_amounts(df: pd.DataFrame, rates: ExchangeRates) -> pd.DataFrame:
+    """
+    Attach the operation amount in bolivianos to a cleaned payment report.
+
+    Args:
+        df (pd.DataFrame): Cleaned payment report with FECHA, MONTO OP. and MONEDA OP.
+        rates (ExchangeRates): Exchange rate table
+
+    Returns:
+        pd.DataFrame: Copy of df with exchange_rate and operation_amount_bob
+    """
+    dates = df['FECHA']
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, format='%d/%m/%Y', errors='coerce')
+    currencies = normalize_currency(df['MONEDA OP.'])
+    exchange_rate = rates.rates(np.where(pd.isna(currencies), DEFAULT_CURRENCY, currencies), dates)
+    return df.assign(
+        exchange_rate=exchange_rate,
+        operation_amount_bob=np.round(_amount(df, 'MONTO OP.') * exchange_rate, 2),
+    )
+
+@lru_cache(maxsize=None)
+def load_exchange_rates(path: Path = EXCHANGE_RATES_FILE) -> Optional[ExchangeRates]:
+    """
+    The local exchange rate table, read once per process.
+
+    Args:
+        path (Path): Rate table CSV
+
+    Returns:
+        ExchangeRates | None: The rates, None when the table does not exist
+    """
+    if not Path(path).exists():
+        return None
+    return ExchangeRates.from_csv(path)
@@ -0,0 +1,123 @@
+"""
+Date-sliced incremental enrichment of the BCP statement.
+
+bcp_final.csv is the cleaned BCP statement with payment details. Each statement
+date is a slice, enriched from the payments of that date only. When a payment
+report arrives, only the slices of the dates it covers are enriched again;
+when a statement arrives, only the dates whose rows differ from the rows the
+previous bcp_final was built from. Every other slice keeps its enriched rows.
+"""
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.enricher.bcp_enricher import BCPEnricher
+from src.store.payment_store import PaymentStore
+
+DATE_COLUMN = 'transaction_date'
+DETAILS_COLUMN = 'additional_details'
+
+# Columns that identify a statement row (the voucher embeds bank, date and
+# operation number) and the amounts enrichment matches on
+SLICE_COLUMNS = ['account_number', 'company_voucher', 'transaction_time', 'description',
+                 'debit_amount', 'credit_amount', 'balance']
+
+def _slice_rank(df: pd.DataFrame) -> np.ndarray:
+    """Position of each row within its date slice."""
+    return df.groupby(DATE_COLUMN, dropna=False, sort=False).cumcount().to_numpy()
+
+def _slice_hashes(df: pd.DataFrame, df_codes: pd.DataFrame) -> pd.Series:
+    """Sum per date of the row hashes, each mixed with its position in the slice."""
+    row_hashes = pd.util.hash_pandas_object(df_codes, index=False).to_numpy()
+    mixed = pd.util.hash_array(row_hashes ^ _slice_rank(df).astype('uint64'))
+    # The sum wraps around in uint64
+    return pd.Series(mixed, index=df[DATE_COLUMN].to_numpy()).groupby(level=0, dropna=False).sum()
+
+def changed_dates(df_statement: pd.DataFrame, df_previous: pd.DataFrame) -> set:
+    """
+    Dates whose statement rows differ from the ones an enriched statement was built from.
+
+    Text columns are factorized over both statements together and the slices
+    compared through hashes of the integer codes, which is much cheaper than
+    hashing the strings.
+
+    Args:
+        df_statement (pd.DataFrame): Cleaned statement
+        df_previous (pd.DataFrame): Previously enriched statement
+
+    Returns:
+        set: Changed or new transaction dates (NaT for undated rows)
+    """
+    columns = [col for col in SLICE_COLUMNS if col in df_statement.columns and col in df_previous.columns]
+    codes = {}
+    for col in columns:
+        values = pd.concat([df_statement[col], df_previous[col]], ignore_index=True)
+        if pd.api.types.is_numeric_dtype(values):
+            codes[col] = values.to_numpy()
+        else:
+            codes[col] = pd.factorize(values, use_na_sentinel=False)[0]
+    df_codes = pd.DataFrame(codes)
+
+    n = len(df_statement)
+    current = _slice_hashes(df_statement, df_codes.iloc[:n])
+    previous = _slice_hashes(df_previous, df_codes.iloc[n:]).to_dict()
+    return {date for date, value in current.items() if previous.get(date) != value}
+
+def enrich_incrementally(df_statement: pd.DataFrame, df_previous: Optional[pd.DataFrame], store: PaymentStore,
+                         dates: Optional[Iterable] = None, statement_changed: bool = True) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Enrich only the date slices of a statement that changed, keeping the others enriched as before.
+
+    Args:
+        df_statement (pd.DataFrame): Cleaned BCP statement, read with the standardized schema
+        df_previous (pd.DataFrame, optional): Previous bcp_final; None enriches every slice
+        store (PaymentStore): Store of all processed payment reports
+        dates (iterable, optional): Dates whose payments changed, enriched again even
+            when their statement rows did not
+        statement_changed (bool): False when df_previous was built from this very
+            statement, whose rows then line up one to one and are not compared
+
+    Returns:
+        tuple: (enriched_df, statistics) with the enricher statistics of the
+        re-enriched rows plus enriched_dates, enriched_rows and kept_rows
+    """
+    df_final = df_statement.copy()
+    statement_dates = df_final[DATE_COLUMN]
+    details = df_final[DETAILS_COLUMN].to_numpy(dtype=object, copy=True)
+
+    new_dates = set()
+    if dates is not None:
+        new_dates = set(pd.DatetimeIndex(pd.to_datetime(list(dates), errors='coerce')).dropna().normalize())
+
+    if df_previous is None:
+        affected = np.ones(len(df_final), dtype=bool)
+    elif not statement_changed and len(df_previous) == len(df_final):
+        affected = statement_dates.isin(new_dates).to_numpy()
+        kept = df_previous[DETAILS_COLUMN].to_numpy(dtype=object)
+        details[~affected] = kept[~affected]
+    else:
+        affected_dates = changed_dates(df_statement, df_previous) | new_dates
+        affected = statement_dates.isin(affected_dates).to_numpy()
+
+        # Unchanged slices hold the same rows in the same order: align them by (date, rank)
+        keys = pd.DataFrame({DATE_COLUMN: statement_dates.to_numpy(), 'rank': _slice_rank(df_final)})
+        previous = pd.DataFrame({
+            DATE_COLUMN: df_previous[DATE_COLUMN].to_numpy(),
+            'rank': _slice_rank(df_previous),
+            DETAILS_COLUMN: df_previous[DETAILS_COLUMN].to_numpy(dtype=object),
+        })
+        kept = keys.merge(previous, on=[DATE_COLUMN, 'rank'], how='left')[DETAILS_COLUMN].to_numpy(dtype=object)
+        details[~affected] = kept[~affected]
+
+    stats = {'total_bcp': len(df_final), 'matched': 0, 'multiple_matches': 0, 'no_match': 0}
+    if affected.any():
+        df_enriched, stats = BCPEnricher().enrich_from_store(df_final[affected], store)
+        if stats.get('error'):
+            return df_statement, stats
+        details[affected] = df_enriched[DETAILS_COLUMN].to_numpy(dtype=object)
+
+    df_final[DETAILS_COLUMN] = details
+    stats['enriched_dates'] = int(statement_dates[affected].nunique(dropna=False))
+    stats['enriched_rows'] = int(affected.sum())
+    stats['kept_rows'] = int((~affected).sum())
+    return df_final, stats
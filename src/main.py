@@ -1,17 +1,28 @@
 """
 main.py - Detect bank and account number from headers, clean and enrich data.
 """
+import argparse
 import os
-import sys
 import pandas as pd
 from pathlib import Path
 
-from src.detector.bank_detector import detect_bank_and_account, detect_bcp_payment_report
-from src.processors.bcp_cleaner import clean_bcp
-from src.processors.bnb_cleaner import clean_bnb
-from src.processors.union_cleaner import clean_union
+from src.enricher.currency import convert_statement_amounts, load_exchange_rates
+from src.processors.parallel import clean_bnb_parallel, clean_union_parallel
 from src.workflows.bcp_workflow import process_bcp_statement_workflow, process_bcp_payment_workflow
-from src.utils.file_manager import ensure_dirs, DATA_RAW, DATA_PROCESSED
+from src.workflows.workbook_workflow import payment_report_sheets, process_workbook, read_sheets
+from src.reader.engines import EXCEL_ENGINES, set_excel_engine
+from src.reader.excel_reader import list_sheets, open_excel, read_detected
+from src.detector.layout_cache import get_layout_cache
+from src.validator.constraints import validate_batch
+from src.store.account_aggregates import AccountAggregates
+from src.store.counterparty_index import CounterpartyIndex
+from src.store.search_index import SearchIndex
+from src.store.statement_store import StatementStore
+from src.utils.build_state import get_build_state
+from src.utils.file_manager import (clean_output_path, ensure_dirs, set_output_compression, COMPRESSION_SUFFIXES,
+                                    DATA_RAW, DATA_PROCESSED)
+from src.utils.schema import STANDARD_DATE_FORMATS
+from src.utils.stream_writer import write_csv
 
 # Configure pandas to show all columns
 pd.set_option('display.max_columns', None)
@@ -32,12 +43,38 @@ def show_summary(df: pd.DataFrame, bank: str, file_path: Path) -> None:
     print("\nLast 5 rows:")
     print(df.tail().to_string())
     
-    # Save clean version to CSV
+    # Save clean version to CSV (floats keep full precision: the frame may carry
+    # exchange rates next to the amounts)
     if file_path:
-        clean_file = DATA_PROCESSED / f"{file_path.stem}_clean.csv"
-        df.to_csv(clean_file, index=False)
+        clean_file = write_csv(df, DATA_PROCESSED / f"{file_path.stem}_clean.csv",
+                               date_format=STANDARD_DATE_FORMATS['transaction_date'])
         print(f"\nClean file saved to: {clean_file}")
 
+def update_aggregates(df: pd.DataFrame) -> None:
+    """Update the daily and monthly account aggregates with a cleaned batch."""
+    days = AccountAggregates().update(df)
+    print(f"Account aggregates updated: {days} account days")
+
+def update_statement_store(df: pd.DataFrame) -> None:
+    """Write a cleaned batch to the partitioned statement store."""
+    partitions = StatementStore().append(df)
+    print(f"Statement store updated: {partitions} partitions")
+
+def update_indexes(df: pd.DataFrame) -> None:
+    """Index the counterparties and the text of a cleaned batch."""
+    rows = CounterpartyIndex().update(df)
+    print(f"Counterparty index updated: {rows} rows")
+    with SearchIndex() as search_index:
+        rows = search_index.add_batch(df)
+    print(f"Search index updated: {rows} rows")
+
+def convert_currencies(df: pd.DataFrame) -> pd.DataFrame:
+    """Attach the amounts in bolivianos when the local exchange-rate table exists."""
+    rates = load_exchange_rates()
+    if rates is None:
+        return df
+    return convert_statement_amounts(df, rates)
+
 def mostrar_resumen_df(df, banco, archivo):
     """Muestra un resumen completo del DataFrame."""
     print(f"\nResumen del DataFrame ({banco}):")
@@ -58,33 +95,97 @@ def mostrar_resumen_df(df, banco, archivo):
 
 def main():
     """Main entry point for the bank statement processor."""
-    if len(sys.argv) < 2:
-        print("Error: You must specify the file name to process")
-        print("Usage: python -m src.main <file.xls>")
-        print("Example: python -m src.main bcpHistoricos.xls")
-        return
-
-    file_name = sys.argv[1]
-    file_path = DATA_RAW / file_name
+    parser = argparse.ArgumentParser(description="Detect, clean and enrich a bank statement or payment report.",
+                                     epilog="Example: python -m src.main bcpHistoricos.xls")
+    parser.add_argument('file', help="File name in data/raw")
+    parser.add_argument('--force', action='store_true', help="Process the file even when it did not change")
+    parser.add_argument('--engine', choices=list(EXCEL_ENGINES),
+                        help="Excel reader engine (default: fastest installed for the file type)")
+    parser.add_argument('--compression', choices=sorted(COMPRESSION_SUFFIXES), help="Compress the processed outputs")
+    args = parser.parse_args()
     
+    file_path = DATA_RAW / args.file
     if not file_path.exists():
         print(f"File not found: {file_path}")
         return
-        
-    print(f"Processing file: {file_path}")    # Read Excel - BNB files have 2 header rows
-    df = pd.read_excel(file_path, header=None)
+    
+    set_excel_engine(args.engine)
+    set_output_compression(args.compression)
+    process_file(file_path, force=args.force)
+
+def process_file(file_path: Path, force: bool = False) -> None:
+    """
+    Clean a raw file, unless its cleaned output is already up to date with it.
+    
+    Args:
+        file_path (Path): Raw statement or payment report
+        force (bool): Process the file even when it did not change
+    """
+    state = get_build_state()
+    clean_file = clean_output_path(file_path)
+    if not force and state.is_current(clean_file, [file_path]):
+        print(f"Up to date: {clean_file}")
+        return
+    
+    print(f"Processing file: {file_path}")
+    _process_file(file_path)
+    
+    # Later runs skip the file until it (or its output) changes
+    if clean_file.exists():
+        state.record(clean_file, [file_path])
+
+def _process_sheets(file_path: Path, sheets: dict) -> None:
+    """Send the payment report sheets of a workbook to their workflow and clean the other sheets together."""
+    reports = payment_report_sheets(sheets)
+    statements = [name for name, df_raw in sheets.items()
+                  if name not in reports and not df_raw.dropna(how='all').empty]
+    
+    for name, df in reports.items():
+        # A report alone in its workbook keeps the file name, as a single-sheet report does
+        report_path = file_path if len(reports) == 1 and not statements else file_path.with_name(
+            f"{file_path.stem}_{name}{file_path.suffix}")
+        print(f"\nSheet '{name}': BCP payment report")
+        process_bcp_payment_workflow(report_path, df)
+    if not statements:
+        return
+    
+    df_clean = process_workbook(file_path, statements, sheets=sheets)
+    df_clean = validate_batch(df_clean, DATA_PROCESSED / f"{file_path.stem}_rejected.csv")
+    update_aggregates(df_clean)
+    update_statement_store(df_clean)
+    update_indexes(df_clean)
+    df_clean = convert_currencies(df_clean)
+    show_summary(df_clean, "WORKBOOK", file_path)
+
+def _process_file(file_path: Path) -> None:
+    """Detect, clean, validate and save one raw file."""
+    # The workbook is opened once for listing, peeking and reading its sheets
+    with open_excel(file_path) as workbook:
+        sheet_names = list_sheets(workbook)
+        if len(sheet_names) > 1:
+            sheets = read_sheets(workbook, sheet_names)
+        else:
+            # Detect bank, account and file kind from the first rows, then parse
+            # the body only (title rows skipped, header row first)
+            layout, df = read_detected(workbook)
+    
+    # Workbooks with several sheets (monthly sheets, several accounts) are
+    # detected and cleaned per sheet in parallel
+    if len(sheet_names) > 1:
+        _process_sheets(file_path, sheets)
+        return
+    
+    account = layout['account']
     
     # First check if it's a BCP payment report
-    is_payment_report, account = detect_bcp_payment_report(df)
-    if is_payment_report:
+    if layout['kind'] == 'payment_report':
         # Payment report workflow
         if account:
             print(f"Account: {account}")
         df_result = process_bcp_payment_workflow(file_path, df)
         return
     
-    # If not a payment report, detect bank and account
-    bank, account = detect_bank_and_account(df)
+    bank = layout['bank']
     print(f"\nDetected bank: {bank}")
     print(f"Account number: {account}")
     
@@ -93,15 +194,24 @@ def main():
         # Special workflow for BCP statements
         df_clean = process_bcp_statement_workflow(file_path, df)
     else:        # Normal workflow for other banks
-        if bank in ["BNB", "BNB1", "BNB2"]:
+        if bank in ["BNB", "BNB1", "BNB2", "BNBUSD"]:
             # For BNB files, ensure correct bank_code format
-            bank_code = bank if bank in ["BNB1", "BNB2"] else "BNB1"
-            df_clean = clean_bnb(df, bank_code=bank_code, account_number=account)
+            bank_code = bank if bank in ["BNB1", "BNB2", "BNBUSD"] else "BNB1"
+            header_row = layout['header_row'] if layout['header_row'] is not None else 1
+            df_clean = clean_bnb_parallel(df, bank_code=bank_code, account_number=account, header_row=header_row)
         elif bank == "UNION":
-            df_clean = clean_union(df)
+            df_clean = clean_union_parallel(df, account_number=account, layout_cache=get_layout_cache())
         else:
             df_clean = df
         
+        # Split off the rows the database would reject
+        if bank in ["BNB", "BNB1", "BNB2", "BNBUSD", "UNION"]:
+            df_clean = validate_batch(df_clean, DATA_PROCESSED / f"{file_path.stem}_rejected.csv")
+            update_aggregates(df_clean)
+            update_statement_store(df_clean)
+            update_indexes(df_clean)
+            df_clean = convert_currencies(df_clean)
+        
         # Add bank column and save
         df_clean['bank'] = bank
         show_summary(df_clean, bank, file_path)
@@ -2,34 +2,51 @@
 BCP bank statement cleaner module.
 Generates output compatible with bank_statements table structure.
 """
+import numpy as np
 import pandas as pd
 from typing import Optional
 from datetime import datetime
 import uuid
+from src.processors.transaction_classifier import classify_transactions
+from src.detector.layout_cache import LayoutCache, find_header_row
+from src.utils.formatter import map_unique
+from src.utils.schema import STANDARD_COLUMNS
+
+def _as_text(values: pd.Series) -> pd.Series:
+    """Cell values as text, the way str() renders them (missing cells become 'nan')."""
+    return values.astype(object).map(str, na_action='ignore').fillna('nan').astype(object)
+
+def _to_number(values: pd.Series) -> pd.Series:
+    """Parse amounts with thousands separators ('1,234.50'), NaN when not a number."""
+    return pd.to_numeric(_as_text(values).str.replace(',', ''), errors='coerce')
 
 def generate_company_voucher(bank: str, date: datetime, voucher: str) -> str:
     """Generate a unique company voucher."""
     date_str = date.strftime('%Y%m%d')
     return f"{bank}-{date_str}-{voucher}"
 
-def clean_bcp(df: pd.DataFrame) -> pd.DataFrame:
+def clean_bcp(df: pd.DataFrame, import_batch_id: Optional[str] = None,
+              layout_cache: Optional[LayoutCache] = None) -> pd.DataFrame:
     """
     Clean and normalize BCP bank statements according to bank_statements table structure.
     
     Args:
         df (pd.DataFrame): Raw BCP statement DataFrame
+        import_batch_id (str, optional): Batch ID for the import process
+        layout_cache (LayoutCache, optional): Cache of known layouts to skip header detection
         
     Returns:
         pd.DataFrame: Cleaned DataFrame with columns matching bank_statements table
     """
     # Find header row with 'Fecha' and 'Hora'
-    header_row = None
-    for i, row in df.iterrows():
-        if (any(isinstance(val, str) and 'Fecha' in val for val in row) and 
-            any(isinstance(val, str) and 'Hora' in val for val in row)):
-            header_row = i
-            break
-    header_row = header_row if header_row is not None else 0
+    layout = layout_cache.get('BCP', df) if layout_cache else None
+    if layout:
+        header_row = layout['header_row']
+    else:
+        header_row = find_header_row(df, ['Fecha', 'Hora'])
+        header_row = header_row if header_row is not None else 0
+        if layout_cache:
+            layout_cache.put('BCP', df, header_row)
         
     # Use headers and clean data
     headers = df.iloc[header_row].values
@@ -54,82 +71,52 @@ def clean_bcp(df: pd.DataFrame) -> pd.DataFrame:
     if 'bank' in df_clean.columns:
         df_clean = df_clean.drop(columns=['bank'])
         
-    # Create new DataFrame with bank identifier
-    rows = []
-    import_batch_id = str(uuid.uuid4())
-    
-    for _, row in df_clean.iterrows():
-        # Convert date and time
-        try:
-            transaction_date = pd.to_datetime(row['Fecha'], format='%d/%m/%Y').date()
-            transaction_time = pd.to_datetime(row['Hora'], format='%H:%M:%S').time()
-        except:
-            transaction_date = None
-            transaction_time = None
-            
-        # Convert amount
-        try:
-            amount = float(str(row['Importe']).replace(',', ''))
-            debit_amount = abs(amount) if amount < 0 else None
-            credit_amount = amount if amount > 0 else None
-        except:
-            debit_amount = None
-            credit_amount = None
-            
-        # Convert balance
-        try:
-            balance = float(str(row['Saldo']).replace(',', ''))
-        except:
-            balance = 0.0
-            
-        # Create voucher components
-        bank_voucher = str(row['Nro. Operación'])
-        account = str(row['Suc. Age.'])
-        
-        # Generate company voucher
-        if transaction_date:
-            company_voucher = generate_company_voucher('BCP', datetime.combine(transaction_date, transaction_time or datetime.min.time()), bank_voucher)
-        else:
-            company_voucher = f"BCP-UNKNOWN-{bank_voucher}"
-            
-        # Build row
-        clean_row = {
-            'bank_code': 'BCP',
-            'account_number': account,
-            'company_voucher': company_voucher,
-            'bank_voucher': bank_voucher,
-            'transaction_date': transaction_date,
-            'transaction_time': transaction_time,
-            'description': str(row['Glosa']).strip(),
-            'transaction_type': str(row['Tipo']).strip(),
-            'reference_number': bank_voucher,
-            'transaction_code': str(row['Tipo']).strip(),
-            'debit_amount': debit_amount,
-            'credit_amount': credit_amount,
-            'balance': balance,
-            'itf_amount': 0.00,
-            'branch_office': None,
-            'agency_code': account,
-            'user_code': str(row['Usuario']),
-            'operation_number': bank_voucher,
-            'additional_details': row.get('Adicionales', None),
-            'import_batch_id': import_batch_id
-        }
-        rows.append(clean_row)
-    
-    # Create final DataFrame with correct schema
-    df_final = pd.DataFrame(rows)
-    
-    # Ensure correct column order matching the database table
-    desired_columns = [
-        'bank_code', 'account_number', 'company_voucher', 'bank_voucher',
-        'transaction_date', 'transaction_time', 'description', 'transaction_type',
-        'reference_number', 'transaction_code', 'debit_amount', 'credit_amount',
-        'balance', 'itf_amount', 'branch_office', 'agency_code', 'user_code',
-        'operation_number', 'additional_details', 'import_batch_id'
-    ]
-    
-    df_final = df_final[desired_columns]
+    import_batch_id = import_batch_id or str(uuid.uuid4())
+    
+    # Date and time: a row missing either one gets neither
+    dates = pd.to_datetime(df_clean['Fecha'], format='%d/%m/%Y', errors='coerce')
+    times = pd.to_datetime(df_clean['Hora'], format='%H:%M:%S', errors='coerce')
+    parsed = (dates.notna() & times.notna()).to_numpy()
+    transaction_date = np.where(parsed, map_unique(dates, lambda d: d.dt.date), None)
+    transaction_time = np.where(parsed, map_unique(times, lambda t: t.dt.time), None)
+    
+    # Amounts: the sign of Importe tells debit from credit
+    amount = _to_number(df_clean['Importe'])
+    balance = _to_number(df_clean['Saldo'])
+    # Unparseable balances default to 0.0
+    balance = balance.where(balance.notna() | _as_text(df_clean['Saldo']).str.replace(',', '').str.strip().str.lower().eq('nan'), 0.0)
+    
+    # Create voucher components
+    bank_voucher = _as_text(df_clean['Nro. Operación'])
+    account = _as_text(df_clean['Suc. Age.'])
+    date_str = pd.Series(np.where(parsed, map_unique(dates, lambda d: d.dt.strftime('%Y%m%d')), 'UNKNOWN'),
+                         index=df_clean.index, dtype=object)
+    
+    df_final = pd.DataFrame({
+        'bank_code': 'BCP',
+        'account_number': account.to_numpy(dtype=object),
+        'company_voucher': ('BCP-' + date_str + '-' + bank_voucher).to_numpy(dtype=object),
+        'bank_voucher': bank_voucher.to_numpy(dtype=object),
+        'transaction_date': transaction_date,
+        'transaction_time': transaction_time,
+        'description': _as_text(df_clean['Glosa']).str.strip().to_numpy(dtype=object),
+        'transaction_type': None,
+        'reference_number': bank_voucher.to_numpy(dtype=object),
+        'transaction_code': _as_text(df_clean['Tipo']).str.strip().to_numpy(dtype=object),
+        'debit_amount': amount.where(amount < 0).abs().to_numpy(),
+        'credit_amount': amount.where(amount > 0).to_numpy(),
+        'balance': balance.to_numpy(),
+        'itf_amount': 0.00,
+        'branch_office': None,
+        'agency_code': account.to_numpy(dtype=object),
+        'user_code': _as_text(df_clean['Usuario']).to_numpy(dtype=object),
+        'operation_number': bank_voucher.to_numpy(dtype=object),
+        'additional_details': df_clean['Adicionales'].to_numpy(dtype=object) if 'Adicionales' in df_clean.columns else None,
+        'import_batch_id': import_batch_id
+    }, columns=STANDARD_COLUMNS)
+    
+    # Tipo is a bank code: the semantic type comes from the description
+    df_final['transaction_type'] = classify_transactions(df_final['description'], 'BCP')
     
     return df_final.reset_index(drop=True)
 
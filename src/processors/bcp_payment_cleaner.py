@@ -1,91 +1,183 @@
 """
 BCP payment report cleaner module.
+
+The one cleaner of BCP payment reports, used by the payment workflow and by
+BCPEnricher. Every column is converted with vectorized operations: FECHA,
+HORA and MONTO ABONADO are parsed with their explicit formats (each distinct
+date and time once), Adicionales is concatenated column-wise from TITULAR,
+GLOSA and CANAL, and the (payment_date, amount_cents) key used to match
+statement rows is added to the result.
 """
+import datetime
 import pandas as pd
+from typing import Optional
+from src.detector.layout_cache import LayoutCache, find_header_row
+from src.utils.formatter import map_unique
+from src.utils.schema import PAYMENT_REPORT_DATE_FORMATS
+
+# Columns kept from the report, in output order
+PAYMENT_REPORT_SOURCE_COLUMNS = [
+    'CANAL', 'FECHA', 'HORA', 'MONTO ABONADO',
+    'MONTO OP.', 'MONEDA OP.', 'GLOSA', 'TITULAR'
+]
+
+PAYMENT_TIME_FORMAT = '%H:%M:%S'
 
-def clean_bcp_payments(df: pd.DataFrame) -> pd.DataFrame:
+def _text(values: pd.Series) -> pd.Series:
+    """Values as a text column, missing values kept missing."""
+    return values.astype(str).where(values.notna())
+
+def parse_payment_dates(values: pd.Series) -> pd.Series:
     """
-    Clean and normalize BCP payment reports.
+    Parse FECHA values: DD/MM/YYYY text or dates already typed by the Excel reader.
+
+    Args:
+        values (pd.Series): Raw FECHA column
+
+    Returns:
+        pd.Series: datetime64 dates, NaT where the value is not a date
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.normalize()
+    
+    def _parse(uniques: pd.Series) -> pd.Series:
+        uniques = uniques.astype(object)
+        typed = uniques.map(lambda value: isinstance(value, datetime.date))
+        parsed = pd.to_datetime(_text(uniques.where(~typed)).str.strip(),
+                                format=PAYMENT_REPORT_DATE_FORMATS['FECHA'], errors='coerce')
+        if typed.any():
+            parsed[typed] = pd.to_datetime(uniques[typed].tolist())
+        return parsed.dt.normalize()
     
+    # Reports hold few distinct dates: each one is parsed once
+    return pd.Series(map_unique(values, _parse, dtype=None), index=values.index)
+
+def format_payment_dates(dates: pd.Series) -> pd.Series:
+    """
+    Write payment dates in the report format (DD/MM/YYYY), each distinct date once.
+
+    Args:
+        dates (pd.Series): datetime64 dates
+
+    Returns:
+        pd.Series: Date text, None where the date is missing
+    """
+    text = map_unique(dates, lambda uniques: pd.DatetimeIndex(uniques).strftime(PAYMENT_REPORT_DATE_FORMATS['FECHA']))
+    return pd.Series(text, index=dates.index, dtype=object)
+
+def parse_payment_times(values: pd.Series) -> pd.Series:
+    """
+    Normalize HORA values to HH:MM:SS text.
+
+    Args:
+        values (pd.Series): Raw HORA column (text or datetime.time)
+
+    Returns:
+        pd.Series: HH:MM:SS text; values in another format are kept as they were
+    """
+    def _normalize(uniques: pd.Series) -> pd.Series:
+        text = _text(uniques.astype(object)).str.strip()
+        parsed = pd.to_datetime(text, format=PAYMENT_TIME_FORMAT, errors='coerce')
+        # Only times without zero padding (9:05:00) need formatting again
+        unpadded = parsed.notna() & (text.str.len() != 8)
+        if unpadded.any():
+            text[unpadded] = parsed[unpadded].dt.strftime(PAYMENT_TIME_FORMAT)
+        return text
+    
+    return pd.Series(map_unique(values, _normalize), index=values.index, dtype=object)
+
+def parse_payment_amounts(values: pd.Series) -> pd.Series:
+    """
+    Parse MONTO ABONADO values: numbers, or text with thousands separators.
+
+    Args:
+        values (pd.Series): Raw MONTO ABONADO column
+
+    Returns:
+        pd.Series: float64 amounts, NaN where the value is not a number
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype('float64')
+    amounts = pd.to_numeric(values, errors='coerce')
+    text = values.notna() & amounts.isna()
+    if text.any():
+        amounts[text] = pd.to_numeric(values[text].astype(str).str.replace(',', '').str.strip(), errors='coerce')
+    return amounts.astype('float64')
+
+def payment_details(df: pd.DataFrame) -> pd.Series:
+    """
+    Build the Adicionales column: 'TITULAR - GLOSA - Canal: CANAL', skipping missing parts.
+
+    Args:
+        df (pd.DataFrame): Payment report with TITULAR, GLOSA and CANAL
+
+    Returns:
+        pd.Series: Details per payment, None when all three are missing
+    """
+    details = _text(df['TITULAR'])
+    for part in [_text(df['GLOSA']), 'Canal: ' + _text(df['CANAL'])]:
+        # A missing side leaves the other one alone
+        details = (details + ' - ' + part).fillna(details).fillna(part)
+    return details.astype(object).where(details.notna(), None)
+
+def clean_bcp_payments(df: pd.DataFrame, layout_cache: Optional[LayoutCache] = None) -> pd.DataFrame:
+    """
+    Clean and normalize BCP payment reports.
+
     Args:
         df (pd.DataFrame): Raw payment report DataFrame
-        
+        layout_cache (LayoutCache, optional): Cache of known layouts to skip header detection
+
     Returns:
-        pd.DataFrame: Cleaned and normalized DataFrame
+        pd.DataFrame: Cleaned report: the report columns (FECHA as DD/MM/YYYY, HORA as
+        HH:MM:SS, MONTO ABONADO as float), Adicionales and the payment_date and
+        amount_cents matching key
     """
     print("\nStarting payment report cleaning...")
-    
+
     # Find header row
-    header_row = None
-    for i, row in df.iterrows():
-        if any(isinstance(val, str) and 'FECHA' in str(val).upper() for val in row) and \
-           any(isinstance(val, str) and 'MONTO ABONADO' in str(val).upper() for val in row):
-            header_row = i
-            break
-    
-    if header_row is None:
-        print("Could not find header row in payment report")
-        return pd.DataFrame()
-    
+    layout = layout_cache.get('BCP_PAYMENTS', df) if layout_cache else None
+    if layout:
+        header_row = layout['header_row']
+    else:
+        header_row = find_header_row(df, ['FECHA', 'MONTO ABONADO'], case_sensitive=False)
+        if header_row is None:
+            print("Could not find header row in payment report")
+            return pd.DataFrame()
+        if layout_cache:
+            layout_cache.put('BCP_PAYMENTS', df, header_row)
+
     print(f"Header row found at index: {header_row}")
-    
+
     # Create clean DataFrame
     df_clean = df.iloc[header_row+1:].copy()
     df_clean.columns = df.iloc[header_row]
-    
-    # Select relevant columns
-    required_cols = [
-        'CANAL', 'FECHA', 'HORA', 'MONTO ABONADO',
-        'MONTO OP.', 'MONEDA OP.', 'GLOSA', 'TITULAR'
-    ]
-    
-    # Create new DataFrame
-    df_new = pd.DataFrame()
-    for col in required_cols:
-        if col in df_clean.columns:
-            df_new[col] = df_clean[col]
-            print(f"Column found: {col}")
-        else:
-            print(f"Warning: Column {col} not found")
-            df_new[col] = None
-    
+
+    # Create new DataFrame with the relevant columns
+    df_new = pd.DataFrame(index=df_clean.index)
+    missing = [col for col in PAYMENT_REPORT_SOURCE_COLUMNS if col not in df_clean.columns]
+    for col in PAYMENT_REPORT_SOURCE_COLUMNS:
+        df_new[col] = None if col in missing else df_clean[col]
+    if missing:
+        print(f"Warning: Columns not found: {', '.join(missing)}")
+
     # Remove empty rows
-    df_new = df_new.dropna(how='all')
+    df_new = df_new.dropna(how='all').reset_index(drop=True)
     print(f"Total rows after removing empty: {len(df_new)}")
-    
-    # Clean dates
-    if 'FECHA' in df_new.columns:
-        print("\nProcessing dates...")
-        dates_before = df_new['FECHA'].head()
-        df_new['FECHA'] = pd.to_datetime(
-            df_new['FECHA'],
-            dayfirst=True
-        ).dt.strftime('%d/%m/%Y')
-        print("Date conversion example:")
-        print("Before:", dates_before.tolist())
-        print("After:", df_new['FECHA'].head().tolist())
-    
-    # Clean amounts
-    if 'MONTO ABONADO' in df_new.columns:
-        print("\nProcessing amounts...")
-        amounts_before = df_new['MONTO ABONADO'].head()
-        df_new['MONTO ABONADO'] = pd.to_numeric(
-            df_new['MONTO ABONADO'].astype(str).str.replace(',', ''),
-            errors='coerce'
-        )
-        print("Amount conversion example:")
-        print("Before:", amounts_before.tolist())
-        print("After:", df_new['MONTO ABONADO'].head().tolist())
-    
-    # Generate Additional Info column
-    print("\nGenerating Additional Info column...")
-    df_new['Adicionales'] = df_new.apply(
-        lambda row: f"{row['TITULAR']} - {row['GLOSA']}" if pd.notna(row['TITULAR']) and pd.notna(row['GLOSA']) 
-        else row['TITULAR'] if pd.notna(row['TITULAR']) 
-        else row['GLOSA'] if pd.notna(row['GLOSA'])
-        else None,
-        axis=1
-    )
-    
-    print(f"\nProcess complete. Total records: {len(df_new)}")
+
+    # Dates, times and amounts with their explicit formats
+    payment_date = parse_payment_dates(df_new['FECHA'])
+    df_new['FECHA'] = format_payment_dates(payment_date)
+    df_new['HORA'] = parse_payment_times(df_new['HORA'])
+    df_new['MONTO ABONADO'] = parse_payment_amounts(df_new['MONTO ABONADO'])
+
+    df_new['Adicionales'] = payment_details(df_new)
+
+    # Matching key of the enrichment: (date, amount in cents)
+    df_new['payment_date'] = payment_date
+    df_new['amount_cents'] = (df_new['MONTO ABONADO'] * 100).round().astype('Int64')
+
+    print(f"Process complete. Total records: {len(df_new)}, "
+          f"unparsed dates: {int(payment_date.isna().sum())}, "
+          f"unparsed amounts: {int(df_new['MONTO ABONADO'].isna().sum())}")
     return df_new
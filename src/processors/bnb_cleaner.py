@@ -23,6 +23,9 @@ import uuid
 from typing import Dict, Optional
 import pandas as pd
 import re
+from src.processors.transaction_classifier import classify_transactions
+from src.utils.formatter import normalize_text
+from src.utils.schema import STANDARD_COLUMNS
 
 def generate_company_voucher(bank_code: str, date: datetime, bank_voucher: str) -> str:
     """
@@ -35,21 +38,12 @@ def generate_company_voucher(bank_code: str, date: datetime, bank_voucher: str)
 def extract_transaction_type(description: str) -> str:
     """
     Extract transaction type from description.
-    Returns one of: DEBIT, CREDIT, TRANSFER
+    Returns one of: DEBIT, CREDIT, TRANSFER, OTHER
     """
-    description = description.upper()
-    
-    # Check for DEBIT first as it might contain 'TRANSFERENCIA'
-    if any(term in description for term in ['CARGO', 'DEBITO', 'PAGO']):
-        return 'DEBIT'
-    elif any(term in description for term in ['TRANSFERENCIA', 'TRF', 'TRASPASO']):
-        return 'TRANSFER'
-    elif any(term in description for term in ['ABONO', 'CREDITO', 'DEPOSITO']):
-        return 'CREDIT'
-    
-    return 'OTHER'
+    return classify_transactions(pd.Series([description]), 'BNB').iloc[0]
 
-def clean_bnb(df: pd.DataFrame, bank_code: str, account_number: str, import_batch_id: Optional[str] = None) -> pd.DataFrame:
+def clean_bnb(df: pd.DataFrame, bank_code: str, account_number: str, import_batch_id: Optional[str] = None,
+              header_row: int = 1) -> pd.DataFrame:
     """
     Clean and standardize BNB bank statements to match the database schema.
     
@@ -58,6 +52,8 @@ def clean_bnb(df: pd.DataFrame, bank_code: str, account_number: str, import_batc
         bank_code (str): Bank code (BNB1, BNB2, or BNBUSD)
         account_number (str): Account number for the statement
         import_batch_id (str, optional): Batch ID for the import process
+        header_row (int): Position of the header row (BNB files have account info in
+            row 0 and headers in row 1, 0 when the title rows were skipped on read)
         
     Returns:
         pd.DataFrame: Cleaned and standardized DataFrame matching the database schema
@@ -65,7 +61,6 @@ def clean_bnb(df: pd.DataFrame, bank_code: str, account_number: str, import_batc
     # Validate bank code
     if bank_code not in ['BNB1', 'BNB2', 'BNBUSD']:
         raise ValueError(f"Invalid bank code {bank_code}. Must be one of: BNB1, BNB2, BNBUSD")    # Start with a clean copy of the data after the header row
-    header_row = 1  # We know BNB files have account info in row 0 and headers in row 1
     df_clean = df.iloc[header_row+1:].copy()
     df_clean.columns = df.iloc[header_row]
     
@@ -80,28 +75,25 @@ def clean_bnb(df: pd.DataFrame, bank_code: str, account_number: str, import_batc
     df_clean['transaction_date'] = pd.to_datetime(df_clean['Fecha'], format='%d/%m/%Y', errors='coerce').dt.date
     df_clean['transaction_time'] = pd.to_datetime(df_clean['Hora'], format='%H:%M:%S', errors='coerce').dt.time
     
-    # Clean and map text columns with proper field names
-    df_clean['bank_voucher'] = df_clean['Código de transacción'].astype(str).apply(lambda x: 
-        x.strip().replace(' ', '') if pd.notna(x) else None
-    )
+    # Clean and map text columns with proper field names (column-wise, once per distinct value)
+    df_clean['bank_voucher'] = normalize_text(df_clean['Código de transacción'], remove_all_spaces=True)
     
-    # Generate company voucher (must be unique)
-    df_clean['company_voucher'] = df_clean.apply(
-        lambda row: generate_company_voucher(bank_code, pd.Timestamp(row['transaction_date']), row['bank_voucher'])
-        if pd.notna(row['bank_voucher']) else None,
-        axis=1
-    )
+    # Generate company voucher (must be unique): {BANK_CODE}-{DATE_YYYYMMDD}-{BANK_VOUCHER}
+    date_str = pd.to_datetime(df_clean['transaction_date']).dt.strftime('%Y%m%d').fillna('UNKNOWN')
+    company_voucher = f"{bank_code}-" + date_str + '-' + df_clean['bank_voucher'].astype(object)
+    df_clean['company_voucher'] = company_voucher.where(df_clean['bank_voucher'].notna(), None)
     
     # Map schema fields
     df_clean['bank_code'] = bank_code
     df_clean['account_number'] = account_number
-    df_clean['description'] = df_clean['Descripción'].astype(str).apply(lambda x: x.strip())
-    df_clean['reference_number'] = df_clean['Referencia'].astype(str).apply(lambda x: ' '.join(x.split()) if pd.notna(x) else None)
-    df_clean['branch_office'] = df_clean['Oficina'].astype(str).apply(lambda x: x.strip() if pd.notna(x) else None)
-    df_clean['additional_details'] = df_clean['Adicionales'].astype(str).apply(lambda x: x.strip() if pd.notna(x) != 'nan' else None)
+    # description is NOT NULL in the table: a missing description is stored empty
+    df_clean['description'] = normalize_text(df_clean['Descripción'], collapse_spaces=False).fillna('')
+    df_clean['reference_number'] = normalize_text(df_clean['Referencia'])
+    df_clean['branch_office'] = normalize_text(df_clean['Oficina'], collapse_spaces=False)
+    df_clean['additional_details'] = normalize_text(df_clean['Adicionales'], collapse_spaces=False)
     
     # Extract transaction type from description
-    df_clean['transaction_type'] = df_clean['description'].apply(extract_transaction_type)
+    df_clean['transaction_type'] = classify_transactions(df_clean['description'], bank_code)
     
     # Convert amounts to numeric, handling commas and ensuring positive values
     df_clean['debit_amount'] = pd.to_numeric(
@@ -131,12 +123,7 @@ def clean_bnb(df: pd.DataFrame, bank_code: str, account_number: str, import_batc
         df_clean['import_batch_id'] = str(uuid.uuid4())
     
     # Select and order final columns according to schema
-    final_columns = [
-        'bank_code', 'account_number', 'company_voucher', 'bank_voucher',
-        'transaction_date', 'transaction_time', 'description', 'transaction_type',
-        'reference_number', 'debit_amount', 'credit_amount', 'balance', 
-        'itf_amount', 'branch_office', 'additional_details', 'import_batch_id'
-    ]
+    final_columns = STANDARD_COLUMNS
     
     # Ensure all schema columns exist
     for col in final_columns:
@@ -0,0 +1,110 @@
+"""
+Counterparty extraction from the free-text details of a statement.
+
+BNB details carry structured text ("Cuenta Origen: 1041305633. Nombre
+Originante: MIP S.R.L..") and enriched BCP rows carry the payment report
+fields ("TITULAR - GLOSA - Canal: ACH"). Each bank has a list of regular
+expressions with named groups (account, name, channel); they are compiled
+once and applied column-wise with .str.extract, only to the distinct texts of
+the column. For each field the first pattern that captures it wins.
+"""
+import re
+import pandas as pd
+from functools import lru_cache
+from typing import Dict, List
+
+from src.utils.formatter import take_unique
+
+COUNTERPARTY_COLUMNS = ['counterparty_account', 'counterparty_name', 'counterparty_channel']
+FIELDS = ['account', 'name', 'channel']
+
+# Payment channels named in descriptions and details
+CHANNELS = r'ACH|QR|SIPAP|BANCA M[OÓ]VIL|BANCA POR INTERNET|CAJERO|CAJA|VENTANILLA'
+
+# Patterns of every bank, checked after the bank specific ones
+COUNTERPARTY_PATTERNS: List[str] = [
+    r'(?:Cuenta|Cta\.?)\s+(?:Origen|Destino|Ordenante|Beneficiario)\s*:\s*(?P<account>\d[\d-]{4,})',
+    r'Canal\s*:\s*(?P<channel>[^|.]+?)\s*(?:$|\||\.)',
+    r'\b(?P<channel>' + CHANNELS + r')\b',
+]
+
+# Bank specific patterns, in precedence order
+BANK_COUNTERPARTY_PATTERNS: Dict[str, List[str]] = {
+    # 'Nombre Originante: MIP S.R.L..' - the name ends at the next 'Field:' or at the end
+    'BNB': [
+        r'Nombre\s+(?:Originante|Ordenante|Destinatario|Beneficiario)\s*:\s*'
+        r'(?P<name>.+?)\.?\s*(?:$|\.\s+[A-ZÁÉÍÓÚ][\w ]*:)',
+    ],
+    # Enriched details: 'TITULAR - GLOSA[ - Canal: CANAL]', joined by ' | ' on multiple matches
+    'BCP': [
+        r'^(?P<name>[^|]+?)\s+-\s+',
+    ],
+    'UNION': [],
+}
+
+class CounterpartyExtractor:
+    """Extract counterparty fields from details with a compiled list of patterns."""
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+
+    def extract(self, details: pd.Series) -> pd.DataFrame:
+        """
+        Extract the counterparty fields of a column of details.
+
+        Args:
+            details (pd.Series): Free-text details (or descriptions)
+
+        Returns:
+            pd.DataFrame: counterparty_account, counterparty_name and
+            counterparty_channel per row (None where not found)
+        """
+        # Details repeat per counterparty: extract from each distinct text once
+        codes, uniques = pd.factorize(details)
+        texts = pd.Series(uniques, dtype=object).astype(str).astype(object)
+        fields = {field: pd.Series(None, index=texts.index, dtype=object) for field in FIELDS}
+        for pattern in self.patterns:
+            if texts.empty:
+                break
+            found = texts.str.extract(pattern)
+            for field in set(FIELDS) & set(found.columns):
+                fields[field] = fields[field].fillna(found[field].str.strip())
+
+        return pd.DataFrame({
+            column: take_unique(codes, fields[field].where(fields[field].notna(), None).to_numpy(dtype=object))
+            for column, field in zip(COUNTERPARTY_COLUMNS, FIELDS)
+        }, index=details.index, dtype=object)
+
+def _bank_family(bank_code: str) -> str:
+    """Map a bank code (BNB1, BNB2, BNBUSD, BCP, UNION) to its patterns key."""
+    return 'BNB' if bank_code.startswith('BNB') else bank_code
+
+@lru_cache(maxsize=None)
+def get_extractor(bank_code: str) -> CounterpartyExtractor:
+    """Return the compiled extractor of a bank, building it on first use."""
+    patterns = BANK_COUNTERPARTY_PATTERNS.get(_bank_family(bank_code), []) + COUNTERPARTY_PATTERNS
+    return CounterpartyExtractor(patterns)
+
+def extract_counterparties(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Extract the counterparty of every row of standardized statements.
+
+    The account and name come from additional_details; the channel from the
+    details, or else from the description.
+
+    Args:
+        df (pd.DataFrame): Standardized statements (one or several banks)
+
+    Returns:
+        pd.DataFrame: The counterparty columns, aligned with df
+    """
+    df_counterparties = pd.DataFrame(None, index=df.index, columns=COUNTERPARTY_COLUMNS, dtype=object)
+    for bank_code, df_bank in df.groupby('bank_code', sort=False):
+        extractor = get_extractor(str(bank_code))
+        found = extractor.extract(df_bank['additional_details'])
+        missing_channel = found['counterparty_channel'].isna()
+        if missing_channel.any() and 'description' in df_bank.columns:
+            from_description = extractor.extract(df_bank.loc[missing_channel, 'description'])
+            found.loc[missing_channel, 'counterparty_channel'] = from_description['counterparty_channel']
+        df_counterparties.loc[df_bank.index] = found
+    return df_counterparties
@@ -0,0 +1,143 @@
+"""
+Partition-parallel cleaning of a single large statement.
+
+The body below the header row is split into contiguous row partitions. Each
+partition gets a copy of the header row on top, so every cleaner sees a small
+statement of its usual shape, and partitions are cleaned in a process pool
+with one shared import_batch_id. Results are concatenated in partition order,
+which reproduces the row order of a single-process run; for cleaners that
+reverse their rows the partition order is reversed too.
+"""
+import os
+import uuid
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, List, Optional
+
+from src.detector.layout_cache import LayoutCache, find_header_row
+from src.processors.bcp_cleaner import clean_bcp
+from src.processors.bnb_cleaner import clean_bnb
+from src.processors.union_cleaner import clean_union, find_union_header_row
+
+# Below this many body rows a statement is cleaned in the calling process
+PARALLEL_MIN_ROWS = 200_000
+
+def split_partitions(df: pd.DataFrame, header_row: int, partitions: int) -> List[pd.DataFrame]:
+    """
+    Split the body of a raw sheet into contiguous partitions, each headed by the header row.
+
+    Args:
+        df (pd.DataFrame): Raw sheet read without headers
+        header_row (int): Position of the header row
+        partitions (int): Number of partitions
+
+    Returns:
+        list: Raw partitions with the header row at position 0 (row labels are kept)
+    """
+    header = df.iloc[[header_row]]
+    body = df.iloc[header_row + 1:]
+    bounds = np.linspace(0, len(body), max(1, partitions) + 1).astype(int)
+    return [
+        pd.concat([header, body.iloc[start:end]])
+        for start, end in zip(bounds[:-1], bounds[1:])
+        if end > start
+    ]
+
+def clean_partitioned(cleaner: Callable[..., pd.DataFrame], df: pd.DataFrame, header_row: int,
+                      workers: Optional[int] = None, partitions: Optional[int] = None,
+                      import_batch_id: Optional[str] = None) -> pd.DataFrame:
+    """
+    Clean a raw statement in row partitions on a process pool.
+
+    Args:
+        cleaner (callable): Module-level cleaner (or partial of one) taking a raw frame
+            with the header at row 0 and an import_batch_id keyword
+        df (pd.DataFrame): Raw sheet read without headers
+        header_row (int): Position of the header row
+        workers (int, optional): Worker processes (defaults to the CPU count)
+        partitions (int, optional): Number of partitions (defaults to workers)
+        import_batch_id (str, optional): Batch ID shared by every partition
+
+    Returns:
+        pd.DataFrame: Cleaned statement, in the order a single-process run produces
+    """
+    workers = workers or os.cpu_count() or 1
+    import_batch_id = import_batch_id or str(uuid.uuid4())
+    clean_one = partial(cleaner, import_batch_id=import_batch_id)
+
+    parts = split_partitions(df, header_row, partitions or workers)
+    if workers == 1 or len(parts) == 1:
+        results = [clean_one(part) for part in parts]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(clean_one, parts))
+    return pd.concat(results, ignore_index=True)
+
+def _use_pool(df: pd.DataFrame, workers: Optional[int]) -> bool:
+    """Whether the statement is large enough, and there are cores enough, for a process pool."""
+    return (workers or os.cpu_count() or 1) > 1 and len(df) >= PARALLEL_MIN_ROWS
+
+def clean_bcp_parallel(df: pd.DataFrame, import_batch_id: Optional[str] = None,
+                       workers: Optional[int] = None, layout_cache: Optional[LayoutCache] = None) -> pd.DataFrame:
+    """
+    Clean a BCP statement, in parallel row partitions when it is large.
+
+    Args:
+        df (pd.DataFrame): Raw BCP statement
+        import_batch_id (str, optional): Batch ID for the import process
+        workers (int, optional): Worker processes (defaults to the CPU count)
+        layout_cache (LayoutCache, optional): Layout cache used by the single-process path
+
+    Returns:
+        pd.DataFrame: Same result as clean_bcp
+    """
+    if not _use_pool(df, workers):
+        return clean_bcp(df, import_batch_id=import_batch_id, layout_cache=layout_cache)
+    header_row = find_header_row(df, ['Fecha', 'Hora'])
+    return clean_partitioned(clean_bcp, df, header_row or 0, workers, import_batch_id=import_batch_id)
+
+def clean_bnb_parallel(df: pd.DataFrame, bank_code: str, account_number: str,
+                       import_batch_id: Optional[str] = None, header_row: int = 1,
+                       workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Clean a BNB statement, in parallel row partitions when it is large.
+
+    Args:
+        df (pd.DataFrame): Raw BNB statement
+        bank_code (str): Bank code (BNB1, BNB2, or BNBUSD)
+        account_number (str): Account number for the statement
+        import_batch_id (str, optional): Batch ID for the import process
+        header_row (int): Position of the header row
+        workers (int, optional): Worker processes (defaults to the CPU count)
+
+    Returns:
+        pd.DataFrame: Same result as clean_bnb
+    """
+    if not _use_pool(df, workers):
+        return clean_bnb(df, bank_code, account_number, import_batch_id=import_batch_id, header_row=header_row)
+    cleaner = partial(clean_bnb, bank_code=bank_code, account_number=account_number, header_row=0)
+    return clean_partitioned(cleaner, df, header_row, workers, import_batch_id=import_batch_id)
+
+def clean_union_parallel(df: pd.DataFrame, account_number: Optional[str] = None,
+                         import_batch_id: Optional[str] = None, workers: Optional[int] = None,
+                         layout_cache: Optional[LayoutCache] = None) -> pd.DataFrame:
+    """
+    Clean a UNION statement, in parallel row partitions when it is large.
+
+    Args:
+        df (pd.DataFrame): Raw UNION statement
+        account_number (str, optional): Account number detected from the statement header
+        import_batch_id (str, optional): Batch ID for the import process
+        workers (int, optional): Worker processes (defaults to the CPU count)
+        layout_cache (LayoutCache, optional): Layout cache used by the single-process path
+
+    Returns:
+        pd.DataFrame: Same result as clean_union
+    """
+    if not _use_pool(df, workers):
+        return clean_union(df, account_number=account_number, import_batch_id=import_batch_id,
+                           layout_cache=layout_cache)
+    cleaner = partial(clean_union, account_number=account_number)
+    return clean_partitioned(cleaner, df, find_union_header_row(df), workers, import_batch_id=import_batch_id)
@@ -0,0 +1,96 @@
+"""
+Rule-based transaction type classifier shared by the BCP, BNB and UNION cleaners.
+
+Each rule maps a regular expression to a transaction type. Rules are listed in
+precedence order: when a description matches several rules, the first one wins.
+The rules of a bank are compiled once into a single regular expression and
+applied column-wise, only to the distinct descriptions of the column.
+"""
+import re
+import numpy as np
+import pandas as pd
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from src.utils.formatter import map_unique
+
+DEFAULT_TRANSACTION_TYPE = 'OTHER'
+
+# (transaction_type, pattern) in precedence order, matched case-insensitively
+# anywhere in the description. Patterns must not use capturing groups.
+TRANSACTION_TYPE_RULES: List[Tuple[str, str]] = [
+    # DEBIT goes first as debit descriptions may also mention 'TRANSFERENCIA'
+    ('DEBIT', r'CARGO|D[EÉ]BITO|PAGO'),
+    ('TRANSFER', r'TRANSFERENCIA|TRF|TRASPASO'),
+    ('CREDIT', r'ABONO|CR[EÉ]DITO|DEP[OÓ]SITO'),
+]
+
+# Bank specific rules, checked before the common rules
+BANK_TRANSACTION_TYPE_RULES: Dict[str, List[Tuple[str, str]]] = {
+    'BCP': [],
+    'BNB': [],
+    'UNION': [],
+}
+
+class TransactionClassifier:
+    """Classify descriptions into transaction types with a compiled rules table."""
+
+    def __init__(self, rules: List[Tuple[str, str]], default: str = DEFAULT_TRANSACTION_TYPE):
+        self.types = [transaction_type for transaction_type, _ in rules]
+        self.default = default
+        # One optional lookahead per rule: a single pass of the regex reports
+        # every rule that matches, and the first match in rule order wins
+        self._groups = [f'rule_{i}' for i in range(len(rules))]
+        self.pattern = re.compile(
+            '^' + ''.join(
+                f'(?:(?=.*?(?P<{group}>{pattern})))?'
+                for group, (_, pattern) in zip(self._groups, rules)
+            ),
+            re.IGNORECASE | re.DOTALL
+        )
+
+    def classify(self, descriptions: pd.Series) -> pd.Series:
+        """
+        Classify a column of descriptions.
+
+        Args:
+            descriptions (pd.Series): Transaction descriptions
+
+        Returns:
+            pd.Series: Transaction type per description (default type for missing values)
+        """
+        # Descriptions are highly repetitive: classify each distinct value once
+        types = map_unique(descriptions, lambda uniques: self._classify_unique(uniques.astype(object).astype(str)),
+                           self.default)
+        return pd.Series(types, index=descriptions.index, dtype=object)
+
+    def _classify_unique(self, values: pd.Series) -> np.ndarray:
+        if values.empty:
+            return np.array([], dtype=object)
+        matched = values.str.extract(self.pattern)[self._groups].notna().to_numpy()
+        first_rule = matched.argmax(axis=1)
+        first_rule[~matched.any(axis=1)] = len(self.types)
+        return np.array(self.types + [self.default], dtype=object)[first_rule]
+
+def _bank_family(bank_code: str) -> str:
+    """Map a bank code (BNB1, BNB2, BNBUSD, BCP, UNION) to its rules table key."""
+    return 'BNB' if bank_code.startswith('BNB') else bank_code
+
+@lru_cache(maxsize=None)
+def get_classifier(bank_code: str) -> TransactionClassifier:
+    """Return the compiled classifier of a bank, building it on first use."""
+    rules = BANK_TRANSACTION_TYPE_RULES.get(_bank_family(bank_code), []) + TRANSACTION_TYPE_RULES
+    return TransactionClassifier(rules)
+
+def classify_transactions(descriptions: pd.Series, bank_code: str) -> pd.Series:
+    """
+    Classify transaction descriptions of a bank.
+
+    Args:
+        descriptions (pd.Series): Transaction descriptions
+        bank_code (str): Bank code (BNB1, BNB2, BNBUSD, BCP or UNION)
+
+    Returns:
+        pd.Series: One of DEBIT, TRANSFER, CREDIT or OTHER per description
+    """
+    return get_classifier(bank_code).classify(descriptions)
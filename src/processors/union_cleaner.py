@@ -1,29 +1,66 @@
 """
 UNION bank statement cleaner module.
+Generates output compatible with bank_statements table structure.
 """
 import pandas as pd
+from typing import Optional
+import uuid
+from src.processors.transaction_classifier import classify_transactions
+from src.utils.formatter import normalize_text
+from src.detector.layout_cache import LayoutCache, find_header_row
 
-def clean_union(df: pd.DataFrame) -> pd.DataFrame:
+# Column mapping - look for variations in column names
+COLUMN_MAP = {
+    'Fecha Movimiento': ['Fecha Movimiento', 'FECHA MOVIMIENTO', 'Fecha'],
+    'AG': ['AG', 'Agencia', 'AGENCIA'],
+    'Descripción': ['Descripción', 'DESCRIPCIÓN', 'DESCRIPCION', 'Glosa', 'GLOSA'],
+    'Nro Documento': ['Nro Documento', 'NRO DOCUMENTO', 'NUM DOCUMENTO', 'N° DOCUMENTO'],
+    'Monto': ['Monto', 'MONTO', 'Importe', 'IMPORTE', 'VALOR'],
+    'Saldo': ['Saldo', 'SALDO'],
+    'Adicionales': ['Adicionales', 'ADICIONALES', 'Observaciones', 'OBSERVACIONES']
+}
+
+def find_column(df: pd.DataFrame, alternatives: list) -> Optional[str]:
+    """Find column name from list of alternatives."""
+    for alt in alternatives:
+        if alt in df.columns:
+            return alt
+    for col in df.columns:
+        for alt in alternatives:
+            if isinstance(col, str) and alt.lower().replace(' ', '') in col.lower().replace(' ', ''):
+                return col
+    return None
+
+def find_union_header_row(df: pd.DataFrame) -> int:
+    """Find the header row: the one with "Fecha Movimiento", else the last one mentioning "Fecha"."""
+    header_row = find_header_row(df, ['Fecha Movimiento'], exact=True)
+    if header_row is None:
+        header_row = find_header_row(df, ['Fecha'], last=True)
+    return header_row if header_row is not None else 0
+
+def clean_union(df: pd.DataFrame, account_number: Optional[str] = None, import_batch_id: Optional[str] = None,
+                layout_cache: Optional[LayoutCache] = None) -> pd.DataFrame:
     """
-    Clean UNION bank statements.
+    Clean UNION bank statements according to bank_statements table structure.
     
     Args:
         df (pd.DataFrame): Raw UNION statement DataFrame
+        account_number (str, optional): Account number detected from the statement header
+        import_batch_id (str, optional): Batch ID for the import process
+        layout_cache (LayoutCache, optional): Cache of known layouts to skip header and
+            column detection
         
     Returns:
-        pd.DataFrame: Cleaned and normalized DataFrame
+        pd.DataFrame: Cleaned DataFrame with columns matching bank_statements table
     """
-    # Find row with "Fecha Movimiento"
-    header_row = None
-    for i, row in df.iterrows():
-        if 'Fecha Movimiento' in row.values:
-            header_row = i
-            break
-    if header_row is None:
-        for i, row in df.iterrows():
-            if any(isinstance(val, str) and 'Fecha' in val for val in row):
-                header_row = i
-    header_row = header_row if header_row is not None else 0
+    # Known layouts reuse the cached header row and column mapping
+    layout = layout_cache.get('UNION', df) if layout_cache else None
+    if layout:
+        header_row = layout['header_row']
+        column_mapping = layout['columns']
+    else:
+        header_row = find_union_header_row(df)
+        column_mapping = None
     
     print(f"\nHeader row found at index: {header_row}")
     
@@ -54,48 +91,61 @@ def clean_union(df: pd.DataFrame) -> pd.DataFrame:
     df_clean = df_clean[mask].copy()
     df_clean = df_clean.reset_index(drop=True)
     
-    # Column mapping - look for variations in column names
-    column_map = {
-        'Fecha Movimiento': ['Fecha Movimiento', 'FECHA MOVIMIENTO', 'Fecha'],
-        'AG': ['AG', 'Agencia', 'AGENCIA'],
-        'Descripción': ['Descripción', 'DESCRIPCIÓN', 'DESCRIPCION', 'Glosa', 'GLOSA'],
-        'Nro Documento': ['Nro Documento', 'NRO DOCUMENTO', 'NUM DOCUMENTO', 'N° DOCUMENTO'],
-        'Monto': ['Monto', 'MONTO', 'Importe', 'IMPORTE', 'VALOR'],
-        'Saldo': ['Saldo', 'SALDO'],
-        'Adicionales': ['Adicionales', 'ADICIONALES', 'Observaciones', 'OBSERVACIONES']
-    }
+    # Resolve column name variations on layouts not seen before
+    if column_mapping is None:
+        column_mapping = {
+            new_col: find_column(df_clean, alternatives)
+            for new_col, alternatives in COLUMN_MAP.items()
+        }
+        if layout_cache:
+            layout_cache.put('UNION', df, header_row, column_mapping)
     
     # Create new DataFrame with standardized columns
-    df_new = pd.DataFrame()
+    df_new = pd.DataFrame(index=df_clean.index)
     
-    def find_column(df: pd.DataFrame, alternatives: list) -> str:
-        """Find column name from list of alternatives."""
-        for alt in alternatives:
-            if alt in df.columns:
-                return alt
-        for col in df.columns:
-            for alt in alternatives:
-                if isinstance(col, str) and alt.lower().replace(' ', '') in col.lower().replace(' ', ''):
-                    return col
-        return None
-    
-    for new_col, alternatives in column_map.items():
-        found_col = find_column(df_clean, alternatives)
-        if found_col:
+    for new_col, found_col in column_mapping.items():
+        if found_col and found_col in df_clean.columns:
             data = df_clean[found_col]
             
             if new_col == 'Adicionales' and data.notna().any():
-                data = data.astype(str).apply(lambda x: (
-                    x.replace('\\t', '')
-                     .replace('\\n', '')
-                     .replace('\t', '')
-                     .replace('\n', '')
-                     .strip()
-                ))
-                data = data.replace('nan', None)
+                data = normalize_text(data)
             
             df_new[new_col] = data
         else:
             df_new[new_col] = None
     
-    return df_new
+    return _to_bank_statements(df_new, account_number, import_batch_id)
+
+def _to_bank_statements(df: pd.DataFrame, account_number: Optional[str], import_batch_id: Optional[str]) -> pd.DataFrame:
+    """Map the resolved UNION columns to the bank_statements table structure."""
+    transaction_date = pd.to_datetime(df['Fecha Movimiento'], format='%d/%m/%Y', errors='coerce')
+    amount = pd.to_numeric(df['Monto'].astype(str).str.replace(',', ''), errors='coerce')
+    balance = pd.to_numeric(df['Saldo'].astype(str).str.replace(',', ''), errors='coerce')
+    description = normalize_text(df['Descripción'], collapse_spaces=False)
+    voucher = df['Nro Documento'].astype(str).str.strip().str.replace(r'\.0$', '', regex=True)
+    agency = normalize_text(df['AG'], collapse_spaces=False)
+    
+    df_final = pd.DataFrame({
+        'bank_code': 'UNION',
+        'account_number': account_number,
+        'company_voucher': 'UNION-' + transaction_date.dt.strftime('%Y%m%d').fillna('UNKNOWN') + '-' + voucher,
+        'bank_voucher': voucher,
+        'transaction_date': transaction_date.dt.date,
+        'transaction_time': None,
+        'description': description,
+        'transaction_type': classify_transactions(description, 'UNION'),
+        'reference_number': voucher,
+        'transaction_code': None,
+        'debit_amount': amount.where(amount < 0).abs(),
+        'credit_amount': amount.where(amount > 0),
+        'balance': balance,
+        'itf_amount': 0.00,
+        'branch_office': agency,
+        'agency_code': agency,
+        'user_code': None,
+        'operation_number': voucher,
+        'additional_details': df['Adicionales'],
+        'import_batch_id': import_batch_id or str(uuid.uuid4())
+    }, index=df.index)
+    
+    return df_final.reset_index(drop=True)
@@ -0,0 +1,60 @@
+"""
+Excel reader backends.
+
+pd.read_excel can parse a workbook with several engines, each for some file
+types and with very different speeds. The registry lists them fastest first;
+for each file the first installed engine that reads its type is used, unless
+an engine was chosen explicitly (--engine on the command line) and reads that
+type too: forcing openpyxl still reads .xls files with an engine that can.
+"""
+import importlib.util
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Engine name: (module it needs, file types it reads), fastest first
+EXCEL_ENGINES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    'calamine': ('python_calamine', ('.xlsx', '.xlsm', '.xls', '.xlsb', '.ods')),
+    'openpyxl': ('openpyxl', ('.xlsx', '.xlsm')),
+    'xlrd': ('xlrd', ('.xls',)),
+}
+
+_engine_override: Optional[str] = None
+
+def available_engines() -> List[str]:
+    """Installed engines, fastest first."""
+    return [name for name, (module, _) in EXCEL_ENGINES.items() if importlib.util.find_spec(module) is not None]
+
+def set_excel_engine(engine: Optional[str]) -> None:
+    """
+    Use one engine for every file read from now on.
+
+    Args:
+        engine (str, optional): Engine name, None to go back to automatic selection
+    """
+    global _engine_override
+    if engine is not None and engine not in EXCEL_ENGINES:
+        raise ValueError(f"Unknown Excel engine {engine}. Must be one of: {', '.join(EXCEL_ENGINES)}")
+    if engine is not None and engine not in available_engines():
+        raise ValueError(f"Excel engine {engine} is not installed (needs {EXCEL_ENGINES[engine][0]})")
+    _engine_override = engine
+
+def select_engine(file_path: Path, engine: Optional[str] = None) -> Optional[str]:
+    """
+    Engine to read a file with.
+
+    Args:
+        file_path (Path): Excel file
+        engine (str, optional): Engine requested for this read
+
+    Returns:
+        str | None: The requested engine when it reads the file type, else the fastest
+        installed one reading it, None to let pandas decide (unknown file types)
+    """
+    suffix = Path(file_path).suffix.lower()
+    engine = engine or _engine_override
+    if engine is not None and suffix in EXCEL_ENGINES[engine][1]:
+        return engine
+    for name in available_engines():
+        if suffix in EXCEL_ENGINES[name][1]:
+            return name
+    return None
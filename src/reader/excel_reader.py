@@ -2,8 +2,14 @@
 Bank statement file reader module.
 """
 import pandas as pd
+from contextlib import contextmanager
+from datetime import date, datetime, time
+from itertools import islice
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
+
+from src.detector.bank_detector import detect_file_layout
+from src.reader.engines import select_engine
 
 def read_bank_statement(file_path: Path) -> Tuple[pd.DataFrame, Optional[str]]:
     """
@@ -18,7 +24,7 @@ def read_bank_statement(file_path: Path) -> Tuple[pd.DataFrame, Optional[str]]:
             - Error message if there was a problem, None otherwise
     """
     try:
-        df = pd.read_excel(file_path, header=0)
+        df = pd.read_excel(file_path, header=0, engine=select_engine(file_path))
         if df.empty:
             return df, "File is empty"
         return df, None
@@ -26,3 +32,233 @@ def read_bank_statement(file_path: Path) -> Tuple[pd.DataFrame, Optional[str]]:
         return pd.DataFrame(), f"File not found: {file_path}"
     except Exception as e:
         return pd.DataFrame(), f"Error reading file: {str(e)}"
+
+def open_excel(file_path: Path) -> pd.ExcelFile:
+    """
+    Open an Excel workbook once to list, peek and read its sheets.
+    
+    .xls workbooks read with xlrd are opened on demand: a sheet is parsed the
+    first time it is read (peeking and reading it again reuse it) and sheets
+    never read are not parsed. Use as a context manager.
+    
+    Args:
+        file_path: Path to the Excel file
+        
+    Returns:
+        pd.ExcelFile: Open workbook, accepted by list_sheets, peek_excel and read_detected
+    """
+    engine = select_engine(file_path)
+    engine_kwargs = {'on_demand': True} if engine == 'xlrd' else None
+    return pd.ExcelFile(file_path, engine=engine, engine_kwargs=engine_kwargs)
+
+@contextmanager
+def _workbook(source) -> Iterator[pd.ExcelFile]:
+    """The workbook already opened with open_excel, or the file opened for one read."""
+    if isinstance(source, pd.ExcelFile):
+        yield source
+    else:
+        with open_excel(source) as workbook:
+            yield workbook
+
+def list_sheets(file_path: Path) -> List[str]:
+    """
+    List the sheet names of an Excel workbook in workbook order.
+    
+    Args:
+        file_path: Path to the Excel file, or the workbook opened with open_excel
+        
+    Returns:
+        list: Sheet names
+    """
+    with _workbook(file_path) as workbook:
+        return [str(name) for name in workbook.sheet_names]
+
+# Rows read to detect bank, account and file kind
+PEEK_ROWS = 40
+
+def peek_excel(file_path: Path, nrows: int = PEEK_ROWS, sheet_name=0) -> pd.DataFrame:
+    """
+    Read only the first rows of a sheet, without headers.
+    
+    Args:
+        file_path: Path to the Excel file, or the workbook opened with open_excel
+        nrows: Number of rows to read
+        sheet_name: Index or name of the sheet
+        
+    Returns:
+        pd.DataFrame: First rows of the sheet
+    """
+    with _workbook(file_path) as workbook:
+        return workbook.parse(sheet_name, header=None, nrows=nrows)
+
+def _calamine_cell(value):
+    """Cell value as pandas' calamine engine returns it (empty cells as None)."""
+    if value == '':
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+    return value
+
+def _iter_calamine_rows(file_path: Path, sheet_name) -> Iterator[tuple]:
+    """Rows of a sheet read with python-calamine, from cell A1 like openpyxl."""
+    from python_calamine import CalamineWorkbook
+    workbook = CalamineWorkbook.from_path(str(file_path))
+    sheet = workbook.get_sheet_by_index(sheet_name) if isinstance(sheet_name, int) else workbook.get_sheet_by_name(sheet_name)
+    # iter_rows starts at the first used cell
+    first_row, first_col = sheet.start or (0, 0)
+    for _ in range(first_row):
+        yield ()
+    for row in sheet.iter_rows():
+        yield (None,) * first_col + tuple(_calamine_cell(value) for value in row)
+
+def _xlrd_cell(value, cell_type: int, datemode: int):
+    """Cell value as pandas' xlrd engine returns it (empty cells as None)."""
+    import xlrd
+    if cell_type in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK, xlrd.XL_CELL_ERROR):
+        return None
+    if cell_type == xlrd.XL_CELL_BOOLEAN:
+        return bool(value)
+    if cell_type == xlrd.XL_CELL_DATE:
+        value = xlrd.xldate.xldate_as_datetime(value, datemode)
+        # Dates on the epoch day are times of day, as pandas reads them
+        if value.date() == (date(1904, 1, 1) if datemode else date(1899, 12, 31)):
+            return time(value.hour, value.minute, value.second, value.microsecond)
+        return value
+    if cell_type == xlrd.XL_CELL_NUMBER and float(value).is_integer():
+        return int(value)
+    return value
+
+def _iter_xlrd_rows(file_path: Path, sheet_name) -> Iterator[tuple]:
+    """Rows of an .xls sheet read with xlrd, without loading the other sheets."""
+    import xlrd
+    workbook = xlrd.open_workbook(str(file_path), on_demand=True)
+    try:
+        sheet = workbook.sheet_by_index(sheet_name) if isinstance(sheet_name, int) else workbook.sheet_by_name(sheet_name)
+        for i in range(sheet.nrows):
+            yield tuple(_xlrd_cell(value, cell_type, workbook.datemode)
+                        for value, cell_type in zip(sheet.row_values(i), sheet.row_types(i)))
+    finally:
+        workbook.release_resources()
+
+def iter_excel_chunks(file_path: Path, chunk_rows: int, sheet_name=0, skiprows: int = 0,
+                      usecols: Optional[List[int]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream a sheet in chunks of rows without loading it whole.
+    
+    Sheets are read row by row with python-calamine when it is installed, .xlsx
+    sheets with openpyxl read-only mode and .xls sheets with xlrd otherwise.
+    xlrd parses one sheet at a time (an .xls sheet holds at most 65,536 rows)
+    and rows are converted chunk by chunk. Other formats are parsed once and
+    sliced.
+    
+    Args:
+        file_path: Path to the Excel file
+        chunk_rows: Body rows per chunk
+        sheet_name: Index or name of the sheet
+        skiprows: Title rows above the header row
+        usecols: Positions of the columns to keep, all when None
+        
+    Yields:
+        pd.DataFrame: Raw chunk without headers, the header row at position 0
+    """
+    def _frame(rows) -> pd.DataFrame:
+        df = pd.DataFrame(rows)
+        if usecols is not None:
+            df = df.reindex(columns=range(max(usecols) + 1)).iloc[:, usecols]
+            df.columns = range(len(usecols))
+        return df
+        
+    engine = select_engine(file_path)
+    if engine == 'calamine':
+        rows = islice(_iter_calamine_rows(file_path, sheet_name), skiprows, None)
+        close = None
+    elif engine == 'xlrd':
+        rows = islice(_iter_xlrd_rows(file_path, sheet_name), skiprows, None)
+        close = None
+    elif Path(file_path).suffix.lower() != '.xlsx' or engine != 'openpyxl':
+        df = pd.read_excel(file_path, sheet_name=sheet_name, header=None, skiprows=skiprows, engine=engine)
+        rows = iter(df.itertuples(index=False, name=None))
+        close = None
+    else:
+        from openpyxl import load_workbook
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        sheet = workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+        rows = islice(sheet.iter_rows(values_only=True), skiprows, None)
+        close = workbook.close
+        
+    try:
+        header = next(rows, None)
+        if header is None:
+            return
+        while True:
+            body = list(islice(rows, chunk_rows))
+            if not body:
+                return
+            yield _frame([header] + body)
+    finally:
+        if close:
+            close()
+
+def apply_read_options(df_raw: pd.DataFrame, options: Dict) -> pd.DataFrame:
+    """
+    Cut the body out of a sheet that was read whole, as the read options would.
+    
+    Args:
+        df_raw: Raw sheet read without headers
+        options: read_options of the detected layout (skiprows, usecols)
+        
+    Returns:
+        pd.DataFrame: Body without title rows, columns renumbered from 0
+    """
+    df = df_raw.iloc[options.get('skiprows', 0):, options.get('usecols', slice(None))]
+    df = df.reset_index(drop=True)
+    df.columns = range(df.shape[1])
+    return df
+
+def detect_frame(df_raw: pd.DataFrame) -> Tuple[Dict, pd.DataFrame]:
+    """
+    Detect the layout of a sheet already in memory and cut its body.
+    
+    Args:
+        df_raw: Raw sheet read without headers
+        
+    Returns:
+        tuple: (layout, DataFrame) as returned by read_detected
+    """
+    layout = detect_file_layout(df_raw.iloc[:PEEK_ROWS])
+    if layout['bank'] == 'Unknown':
+        # Account details may sit below the first rows
+        return dict(detect_file_layout(df_raw), header_row=None, read_options={}), df_raw
+    return layout, apply_read_options(df_raw, layout['read_options'])
+
+def read_detected(file_path: Path, sheet_name=0) -> Tuple[Dict, pd.DataFrame]:
+    """
+    Detect the file layout from its first rows, then parse the body with the
+    bank specific read options.
+    
+    Unknown files are detected on the peek alone and fall back to a full parse.
+    
+    Args:
+        file_path: Path to the Excel file, or the workbook opened with open_excel
+        sheet_name: Index or name of the sheet
+        
+    Returns:
+        tuple: (layout, DataFrame)
+            - layout as returned by detect_file_layout
+            - Raw DataFrame without headers, starting at the header row when it was found
+    """
+    with _workbook(file_path) as workbook:
+        df_peek = peek_excel(workbook, sheet_name=sheet_name)
+        layout = detect_file_layout(df_peek)
+        if len(df_peek) < PEEK_ROWS and layout['bank'] != 'Unknown':
+            # The peek already holds the whole sheet
+            return layout, apply_read_options(df_peek, layout['read_options'])
+            
+        df = workbook.parse(sheet_name, header=None, **layout['read_options'])
+    if layout['bank'] == 'Unknown':
+        # Account details may sit below the peeked rows; the body was read in
+        # full, so the cleaners locate the header themselves
+        layout = dict(detect_file_layout(df), header_row=None, read_options={})
+    return layout, df
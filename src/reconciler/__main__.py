@@ -0,0 +1,31 @@
+"""
+Reconcile processed statements against a ledger export.
+
+Usage: python -m src.reconciler <ledger.csv> <statement_clean.csv> [<statement_clean.csv> ...]
+"""
+import sys
+
+from src.utils.file_manager import DATA_PROCESSED, DATA_RAW, ensure_dirs
+from src.workflows.reconciliation_workflow import process_reconciliation_workflow
+
+def main():
+    """Entry point of the ledger reconciliation."""
+    if len(sys.argv) < 3:
+        print("Error: You must specify the ledger export and at least one processed statement")
+        print("Usage: python -m src.reconciler <ledger.csv> <statement_clean.csv> [...]")
+        print("Example: python -m src.reconciler ledger.csv bcpHistoricos_clean.csv bnb_clean.csv")
+        return
+
+    ensure_dirs()
+    ledger_file = DATA_RAW / sys.argv[1]
+    statement_files = [DATA_PROCESSED / name for name in sys.argv[2:]]
+
+    for path in [ledger_file] + statement_files:
+        if not path.exists():
+            print(f"File not found: {path}")
+            return
+
+    process_reconciliation_workflow(statement_files, ledger_file)
+
+if __name__ == "__main__":
+    main()
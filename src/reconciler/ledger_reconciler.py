@@ -0,0 +1,167 @@
+"""
+Reconciliation of standardized bank statements against an accounting ledger export.
+
+Statement rows and ledger entries are matched one-to-one on their signed
+amount in cents, in three passes of decreasing strictness:
+
+1. reference: the ledger reference equals a voucher or reference of the row
+2. same_date: same amount on the same day
+3. date_window: same amount with dates at most window_days apart
+
+When the ledger has an account_number column, matches stay within an account.
+"""
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Tuple
+
+from src.reconciler.matching import DAY, ROW_ID, day_numbers, exact_pairs, window_pairs
+
+DEFAULT_WINDOW_DAYS = 3
+
+# Statement columns the ledger reference is compared with, in order
+BANK_REFERENCE_COLUMNS = ['company_voucher', 'reference_number', 'bank_voucher', 'operation_number']
+
+AMOUNT_CENTS = 'amount_cents'
+REFERENCE = 'reference'
+
+def _normalize_reference(values: pd.Series) -> pd.Series:
+    """Trimmed upper-case reference, missing when empty."""
+    values = values.astype('str').str.strip().str.upper()
+    return values.mask(values.isin(['', 'NAN', 'NONE']))
+
+def _bank_keys(df_bank: pd.DataFrame) -> pd.DataFrame:
+    """Signed amount in cents (credit minus debit) and day number of each statement row."""
+    debit = pd.to_numeric(df_bank['debit_amount'], errors='coerce')
+    credit = pd.to_numeric(df_bank['credit_amount'], errors='coerce')
+    # Rows without any amount stay missing instead of matching zero entries
+    amount = (credit.fillna(0) - debit.fillna(0)).mask(debit.isna() & credit.isna())
+    keys = pd.DataFrame({
+        ROW_ID: np.arange(len(df_bank)),
+        AMOUNT_CENTS: (amount * 100).round().astype('Int64').to_numpy(),
+        '_date': pd.to_datetime(df_bank['transaction_date'], errors='coerce').to_numpy()
+    })
+    if 'account_number' in df_bank.columns:
+        keys['account_number'] = df_bank['account_number'].astype('str').str.strip().to_numpy()
+    return keys
+
+def _ledger_keys(df_ledger: pd.DataFrame) -> pd.DataFrame:
+    """Signed amount in cents, day number and reference of each ledger entry."""
+    amount = pd.to_numeric(df_ledger['amount'], errors='coerce')
+    keys = pd.DataFrame({
+        ROW_ID: np.arange(len(df_ledger)),
+        AMOUNT_CENTS: (amount * 100).round().astype('Int64').to_numpy(),
+        '_date': pd.to_datetime(df_ledger['entry_date'], errors='coerce').to_numpy()
+    })
+    if 'account_number' in df_ledger.columns:
+        keys['account_number'] = df_ledger['account_number'].astype('str').str.strip().to_numpy()
+    if REFERENCE in df_ledger.columns:
+        keys[REFERENCE] = _normalize_reference(df_ledger[REFERENCE]).to_numpy()
+    return keys
+
+def _with_days(keys: pd.DataFrame) -> pd.DataFrame:
+    """Keep the rows with a date and amount, adding their day number."""
+    keys = keys[keys['_date'].notna() & keys[AMOUNT_CENTS].notna()].copy()
+    keys[AMOUNT_CENTS] = keys[AMOUNT_CENTS].astype(np.int64)
+    keys[DAY] = day_numbers(keys['_date'])
+    return keys.drop(columns='_date')
+
+def _unmatched(keys: pd.DataFrame, matched_ids: List[np.ndarray]) -> pd.DataFrame:
+    if not matched_ids:
+        return keys
+    return keys[~keys[ROW_ID].isin(np.concatenate(matched_ids))]
+
+def match_ledger(df_bank: pd.DataFrame, df_ledger: pd.DataFrame,
+                 window_days: int = DEFAULT_WINDOW_DAYS) -> pd.DataFrame:
+    """
+    Match statement rows with ledger entries.
+
+    Args:
+        df_bank (pd.DataFrame): Standardized statement (one or several banks)
+        df_ledger (pd.DataFrame): Ledger entries with entry_date and signed amount
+        window_days (int): Largest date distance allowed in the last pass
+
+    Returns:
+        pd.DataFrame: bank_row, ledger_row (positions in the inputs), day_gap and match_rule
+    """
+    bank = _with_days(_bank_keys(df_bank))
+    ledger = _with_days(_ledger_keys(df_ledger))
+    keys = [AMOUNT_CENTS]
+    if 'account_number' in bank.columns and 'account_number' in ledger.columns:
+        keys.append('account_number')
+
+    passes = []
+    bank_matched: List[np.ndarray] = []
+    ledger_matched: List[np.ndarray] = []
+
+    def _accept(pairs: pd.DataFrame, rule: str) -> None:
+        passes.append(pairs.assign(match_rule=rule))
+        bank_matched.append(pairs['left_id'].to_numpy())
+        ledger_matched.append(pairs['right_id'].to_numpy())
+
+    # 1. Reference: each statement reference column in turn, same amount
+    if REFERENCE in ledger.columns:
+        for col in BANK_REFERENCE_COLUMNS:
+            if col not in df_bank.columns:
+                continue
+            left = _unmatched(bank, bank_matched)
+            left = left.assign(**{REFERENCE: _normalize_reference(df_bank[col]).to_numpy()[left[ROW_ID].to_numpy()]})
+            right = _unmatched(ledger, ledger_matched)
+            _accept(exact_pairs(left, right, [REFERENCE] + keys), 'reference')
+
+    # 2. Same amount on the same day
+    _accept(exact_pairs(_unmatched(bank, bank_matched), _unmatched(ledger, ledger_matched), keys + [DAY]), 'same_date')
+
+    # 3. Same amount within the date window, closest dates first
+    if window_days > 0:
+        pairs = window_pairs(_unmatched(bank, bank_matched), _unmatched(ledger, ledger_matched), keys, window_days)
+        _accept(pairs, 'date_window')
+
+    matches = pd.concat(passes, ignore_index=True)
+    return matches.rename(columns={'left_id': 'bank_row', 'right_id': 'ledger_row'})
+
+def reconcile(df_bank: pd.DataFrame, df_ledger: pd.DataFrame,
+              window_days: int = DEFAULT_WINDOW_DAYS) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, Dict]:
+    """
+    Reconcile standardized statements against a ledger export.
+
+    Args:
+        df_bank (pd.DataFrame): Standardized output of clean_bcp, clean_bnb or clean_union
+        df_ledger (pd.DataFrame): Ledger entries with entry_date and signed amount
+        window_days (int): Largest date distance between a statement row and its entry
+
+    Returns:
+        tuple: (matched_df, unmatched_bank_df, unmatched_ledger_df, statistics)
+            - Statement columns side by side with the ledger columns (prefixed ledger_),
+              match_rule and day_gap
+            - Statement rows without a ledger entry
+            - Ledger entries without a statement row
+    """
+    print("\nStarting reconciliation...")
+    print(f"Statement rows: {len(df_bank)}")
+    print(f"Ledger entries: {len(df_ledger)}")
+
+    matches = match_ledger(df_bank, df_ledger, window_days)
+    bank_rows = matches['bank_row'].to_numpy()
+    ledger_rows = matches['ledger_row'].to_numpy()
+
+    df_matched = pd.concat([
+        df_bank.iloc[bank_rows].reset_index(drop=True),
+        df_ledger.iloc[ledger_rows].add_prefix('ledger_').reset_index(drop=True),
+        matches[['match_rule', 'day_gap']]
+    ], axis=1)
+
+    bank_unmatched = np.ones(len(df_bank), dtype=bool)
+    bank_unmatched[bank_rows] = False
+    ledger_unmatched = np.ones(len(df_ledger), dtype=bool)
+    ledger_unmatched[ledger_rows] = False
+
+    stats = {
+        'total_bank': len(df_bank),
+        'total_ledger': len(df_ledger),
+        'matched': len(matches),
+        'unmatched_bank': int(bank_unmatched.sum()),
+        'unmatched_ledger': int(ledger_unmatched.sum()),
+    }
+    stats.update(matches['match_rule'].value_counts().add_prefix('matched_').to_dict())
+
+    return df_matched, df_bank[bank_unmatched], df_ledger[ledger_unmatched], stats
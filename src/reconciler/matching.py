@@ -0,0 +1,143 @@
+"""
+One-to-one matching helpers shared by the reconciliation passes.
+
+Both sides are keyed frames with a row_id column. Pairs come from hashed
+joins on exact keys, with the n-th occurrence of a key on one side paired with
+its n-th occurrence on the other, so no pass ever compares every row of one
+side with every row of the other, not even for repeated amounts.
+"""
+import numpy as np
+import pandas as pd
+from typing import List
+
+ROW_ID = 'row_id'
+DAY = 'day'
+PAIR_COLUMNS = ['left_id', 'right_id', 'day_gap']
+
+def day_numbers(dates: pd.Series) -> np.ndarray:
+    """Days since the epoch of a date column; rows must have a date."""
+    return pd.to_datetime(dates).to_numpy(dtype='datetime64[D]').astype(np.int64)
+
+def exact_pairs(left: pd.DataFrame, right: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    """
+    Pair rows one-to-one on equal keys.
+
+    The n-th occurrence of a key on the left is paired with its n-th occurrence
+    on the right, so repeated keys never produce a cross product.
+
+    Args:
+        left (pd.DataFrame): Keyed rows with row_id and day columns
+        right (pd.DataFrame): Keyed rows with row_id and day columns
+        keys (list): Columns that must be equal
+
+    Returns:
+        pd.DataFrame: left_id, right_id and day_gap of each pair
+    """
+    left = left.dropna(subset=keys)
+    right = right.dropna(subset=keys)
+    columns = keys + ['_occurrence', ROW_ID] + ([] if DAY in keys else [DAY])
+    left = left.assign(_occurrence=left.groupby(keys, sort=False).cumcount())
+    right = right.assign(_occurrence=right.groupby(keys, sort=False).cumcount())
+    pairs = left[columns].merge(right[columns], on=keys + ['_occurrence'], suffixes=('_left', '_right'))
+    if DAY in keys:
+        day_gap = np.zeros(len(pairs), dtype=np.int64)
+    else:
+        day_gap = np.abs(pairs[f'{DAY}_left'].to_numpy() - pairs[f'{DAY}_right'].to_numpy())
+    return pd.DataFrame({
+        'left_id': pairs[f'{ROW_ID}_left'].to_numpy(),
+        'right_id': pairs[f'{ROW_ID}_right'].to_numpy(),
+        'day_gap': day_gap
+    })
+
+def window_pairs(left: pd.DataFrame, right: pd.DataFrame, keys: List[str], window_days: int) -> pd.DataFrame:
+    """
+    Pair rows one-to-one on equal keys with dates at most window_days apart, closest dates first.
+
+    For each distance from 0 to window_days, the rows still unpaired are paired
+    by rank with exact_pairs on the keys and the left day shifted by that
+    distance, later right dates before earlier ones. Repeated keys cost one
+    merge per distance, never a cross product.
+
+    Args:
+        left (pd.DataFrame): Keyed rows with row_id and day columns
+        right (pd.DataFrame): Keyed rows with row_id and day columns
+        keys (list): Columns that must be equal
+        window_days (int): Largest allowed distance between the dates
+
+    Returns:
+        pd.DataFrame: left_id, right_id and day_gap of each pair
+    """
+    left = left.dropna(subset=keys)
+    right = right.dropna(subset=keys)
+    accepted = []
+    for gap in range(window_days + 1):
+        for shift in ([gap, -gap] if gap else [0]):
+            pairs = exact_pairs(left.assign(**{DAY: left[DAY] + shift}), right, keys + [DAY])
+            accepted.append(pairs.assign(day_gap=gap))
+            left = left[~left[ROW_ID].isin(pairs['left_id'])]
+            right = right[~right[ROW_ID].isin(pairs['right_id'])]
+    return pd.concat(accepted, ignore_index=True)
+
+def window_candidates(left: pd.DataFrame, right: pd.DataFrame, keys: List[str], window_days: int) -> pd.DataFrame:
+    """
+    Candidate pairs with equal keys and dates at most window_days apart.
+
+    Every combination is listed, so a key repeated k times on both sides gives
+    k * k candidates: meant for small residues that need greedy_one_to_one.
+
+    Dates are cut into buckets of window_days + 1 days: rows within the window
+    are at most one bucket apart, so each left row is joined on its keys with
+    the right rows of its own and both neighbouring buckets only.
+
+    Args:
+        left (pd.DataFrame): Keyed rows with row_id and day columns
+        right (pd.DataFrame): Keyed rows with row_id and day columns
+        keys (list): Columns that must be equal
+        window_days (int): Largest allowed distance between the dates
+
+    Returns:
+        pd.DataFrame: left_id, right_id and day_gap of every candidate pair
+    """
+    left = left.dropna(subset=keys)
+    right = right.dropna(subset=keys)
+    bucket_size = window_days + 1
+
+    left_bucket = left[DAY].to_numpy() // bucket_size
+    left = left[keys + [ROW_ID, DAY]].iloc[np.repeat(np.arange(len(left)), 3)]
+    left['_bucket'] = np.repeat(left_bucket, 3) + np.tile([-1, 0, 1], len(left_bucket))
+    right = right[keys + [ROW_ID, DAY]].assign(_bucket=right[DAY].to_numpy() // bucket_size)
+
+    pairs = left.merge(right, on=keys + ['_bucket'], suffixes=('_left', '_right'))
+    day_gap = np.abs(pairs[f'{DAY}_left'].to_numpy() - pairs[f'{DAY}_right'].to_numpy())
+    within = day_gap <= window_days
+    return pd.DataFrame({
+        'left_id': pairs[f'{ROW_ID}_left'].to_numpy()[within],
+        'right_id': pairs[f'{ROW_ID}_right'].to_numpy()[within],
+        'day_gap': day_gap[within]
+    })
+
+def greedy_one_to_one(candidates: pd.DataFrame) -> pd.DataFrame:
+    """
+    Resolve candidate pairs into one-to-one matches, closest dates first.
+
+    Each round accepts every pair that is the closest remaining candidate of
+    both its rows, then drops the candidates of the rows just matched.
+
+    Args:
+        candidates (pd.DataFrame): left_id, right_id and day_gap of candidate pairs
+
+    Returns:
+        pd.DataFrame: Accepted pairs, each left_id and right_id at most once
+    """
+    remaining = candidates.sort_values(['day_gap', 'left_id', 'right_id'], kind='stable')
+    accepted = []
+    while not remaining.empty:
+        best = ~remaining['left_id'].duplicated() & ~remaining['right_id'].duplicated()
+        chosen = remaining[best]
+        accepted.append(chosen)
+        remaining = remaining[
+            ~remaining['left_id'].isin(chosen['left_id']) & ~remaining['right_id'].isin(chosen['right_id'])
+        ]
+    if not accepted:
+        return pd.DataFrame({col: pd.Series(dtype=np.int64) for col in PAIR_COLUMNS})
+    return pd.concat(accepted, ignore_index=True)
@@ -0,0 +1,216 @@
+"""
+Pairing of transfers between our own accounts.
+
+A transfer between two of our accounts shows up as a debit in one statement
+and a credit of the same amount in another. Debits and credits of the combined
+standardized output are paired one-to-one across different accounts, on equal
+amount and currency within a date window, closest dates first.
+
+An equal amount alone is weak evidence, so a pair also needs a secondary
+signal in the text of its legs (description, additional details, reference),
+strongest first:
+
+1. account: one leg mentions the account number of the other leg
+2. wording: one leg reads like a transfer (TRANSFERENCIA, TRASPASO, ...)
+
+Usage: python -m src.reconciler.transfer_pairing <statement_clean.csv> [<statement_clean.csv> ...]
+"""
+import sys
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Tuple
+
+from src.enricher.currency import account_currencies
+from src.reconciler.matching import (
+    DAY, ROW_ID, day_numbers, greedy_one_to_one, window_candidates, window_pairs
+)
+from src.utils.file_manager import DATA_PROCESSED
+from src.utils.schema import read_standardized_csv
+from src.utils.stream_writer import write_csv
+
+DEFAULT_TRANSFER_WINDOW_DAYS = 2
+
+# Text columns searched for the secondary signal
+SIGNAL_COLUMNS = ['description', 'additional_details', 'reference_number']
+
+# Words of a transfer between accounts, matched case-insensitively
+TRANSFER_WORDING = r'TRANSFERENCIA|TRASPASO|TRF|ENTRE CUENTAS|CUENTA PROPIA|CTA\.? PROPIA'
+
+# Shortest digit run taken for an account number in a text
+MIN_ACCOUNT_DIGITS = 6
+
+KEYS = ['amount_cents', 'currency']
+
+def _account_digits(values: pd.Series) -> pd.Series:
+    """Account numbers without separators, as they are written in descriptions."""
+    return values.astype('str').str.replace(r'\D', '', regex=True)
+
+def _signals(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Account and secondary signals of each row.
+
+    Returns:
+        pd.DataFrame: account (bank_code:account_number), own_account (digits),
+        mentioned_account (another of our accounts named in the text, missing
+        when none) and transfer_wording (bool), in the order of df
+    """
+    own = _account_digits(df['account_number'])
+    known = sorted({account for account in own.dropna().unique() if len(account) >= MIN_ACCOUNT_DIGITS})
+    texts = [df[col].astype('str').fillna('') for col in SIGNAL_COLUMNS if col in df.columns]
+
+    def _contains(pattern: str) -> np.ndarray:
+        found = np.zeros(len(df), dtype=bool)
+        for text in texts:
+            found |= text.str.contains(pattern, case=False, regex=True).to_numpy(dtype=bool)
+        return found
+
+    wording = _contains(TRANSFER_WORDING)
+    # Our accounts are few: each is searched column-wise, its digits possibly
+    # split by spaces, dots or dashes, and the first one found that is not
+    # the row's own account is kept
+    mentioned = np.full(len(df), None, dtype=object)
+    for account in known:
+        pattern = r'(?:^|\D)' + r'[\s.-]?'.join(account) + r'(?:\D|$)'
+        take = _contains(pattern) & (own != account).to_numpy() & pd.isna(mentioned)
+        mentioned[take] = account
+    return pd.DataFrame({
+        'account': (df['bank_code'].astype('str') + ':' + df['account_number'].astype('str')).to_numpy(dtype=object),
+        'own_account': own.to_numpy(dtype=object),
+        'mentioned_account': mentioned,
+        'transfer_wording': wording
+    })
+
+def _side(df: pd.DataFrame, amount_column: str, signals: pd.DataFrame) -> pd.DataFrame:
+    """Rows with a positive amount in amount_column, keyed by cents, currency and day, with their signals."""
+    amount = pd.to_numeric(df[amount_column], errors='coerce')
+    dates = pd.to_datetime(df['transaction_date'], errors='coerce')
+    present = (amount > 0).to_numpy() & dates.notna().to_numpy()
+    side = pd.DataFrame({
+        ROW_ID: np.flatnonzero(present),
+        'amount_cents': (amount[present] * 100).round().astype(np.int64).to_numpy(),
+        'currency': account_currencies(df['bank_code'])[present],
+        DAY: day_numbers(dates[present])
+    })
+    return pd.concat([side, signals[present].reset_index(drop=True)], axis=1)
+
+def _pair_across_accounts(debits: pd.DataFrame, credits: pd.DataFrame, keys: List[str],
+                          window_days: int) -> pd.DataFrame:
+    """
+    Pair debits and credits of different accounts one-to-one, closest dates first.
+
+    Debits are ranked by account and credits by account in reverse, so that
+    rank pairing rarely puts two legs of one account together. Such pairs are
+    undone and only the rows left with their keys are resolved pair by pair.
+    """
+    debits = debits.sort_values('account', kind='stable')
+    credits = credits.sort_values('account', ascending=False, kind='stable')
+    pairs = window_pairs(debits, credits, keys, window_days)
+
+    debit_accounts = debits.set_index(ROW_ID)['account']
+    credit_accounts = credits.set_index(ROW_ID)['account']
+    same = (debit_accounts.loc[pairs['left_id']].to_numpy() == credit_accounts.loc[pairs['right_id']].to_numpy())
+    if not same.any():
+        return pairs
+
+    kept = pairs[~same]
+    conflicts = debits.set_index(ROW_ID).loc[pairs.loc[same, 'left_id'], keys].drop_duplicates()
+    debits = debits[~debits[ROW_ID].isin(kept['left_id'])].merge(conflicts, on=keys)
+    credits = credits[~credits[ROW_ID].isin(kept['right_id'])].merge(conflicts, on=keys)
+    candidates = window_candidates(debits, credits, keys, window_days)
+    different = (debit_accounts.loc[candidates['left_id']].to_numpy()
+                 != credit_accounts.loc[candidates['right_id']].to_numpy())
+    return pd.concat([kept, greedy_one_to_one(candidates[different])], ignore_index=True)
+
+def pair_internal_transfers(df: pd.DataFrame,
+                            window_days: int = DEFAULT_TRANSFER_WINDOW_DAYS) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Link the debit and credit legs of transfers between our own accounts.
+
+    Args:
+        df (pd.DataFrame): Combined standardized output of several banks and accounts
+        window_days (int): Largest date distance between the two legs
+
+    Returns:
+        tuple: (paired_df, statistics)
+            - Copy of df with transfer_pair_id (same id on both legs, NA when
+              unpaired) and paired_company_voucher (company_voucher of the other leg)
+            - Pair counts
+    """
+    signals = _signals(df)
+    debits = _side(df, 'debit_amount', signals)
+    credits = _side(df, 'credit_amount', signals)
+
+    passes = []
+
+    def _accept(pairs: pd.DataFrame, rule: str) -> None:
+        nonlocal debits, credits
+        passes.append(pairs.assign(signal=rule))
+        debits = debits[~debits[ROW_ID].isin(pairs['left_id'])]
+        credits = credits[~credits[ROW_ID].isin(pairs['right_id'])]
+
+    # 1. Account: the debit names the credited account, or the credit the debited one
+    _accept(window_pairs(debits.assign(_counterpart=debits['mentioned_account']),
+                         credits.assign(_counterpart=credits['own_account']),
+                         KEYS + ['_counterpart'], window_days), 'account')
+    _accept(window_pairs(debits.assign(_counterpart=debits['own_account']),
+                         credits.assign(_counterpart=credits['mentioned_account']),
+                         KEYS + ['_counterpart'], window_days), 'account')
+
+    # 2. Wording: either leg reads like a transfer
+    _accept(_pair_across_accounts(debits[debits['transfer_wording']], credits, KEYS, window_days), 'wording')
+    _accept(_pair_across_accounts(debits, credits[credits['transfer_wording']], KEYS, window_days), 'wording')
+
+    pairs = pd.concat(passes, ignore_index=True).sort_values('left_id', ignore_index=True)
+
+    pair_ids = np.full(len(df), -1, dtype=np.int64)
+    pair_ids[pairs['left_id'].to_numpy()] = np.arange(len(pairs))
+    pair_ids[pairs['right_id'].to_numpy()] = np.arange(len(pairs))
+
+    vouchers = df['company_voucher'].to_numpy(dtype=object)
+    paired_vouchers = np.full(len(df), None, dtype=object)
+    paired_vouchers[pairs['left_id'].to_numpy()] = vouchers[pairs['right_id'].to_numpy()]
+    paired_vouchers[pairs['right_id'].to_numpy()] = vouchers[pairs['left_id'].to_numpy()]
+
+    df_paired = df.copy()
+    df_paired['transfer_pair_id'] = pd.array(pair_ids + 1, dtype='Int64')
+    df_paired.loc[pair_ids < 0, 'transfer_pair_id'] = pd.NA
+    df_paired['paired_company_voucher'] = paired_vouchers
+
+    stats = {
+        'total_rows': len(df),
+        'transfer_pairs': len(pairs),
+        'same_day_pairs': int((pairs['day_gap'] == 0).sum()),
+        'account_pairs': int((pairs['signal'] == 'account').sum()),
+        'paired_amount': round(float(pd.to_numeric(df['debit_amount'], errors='coerce').iloc[pairs['left_id']].sum()), 2),
+    }
+    return df_paired, stats
+
+def process_transfer_pairing_workflow(statement_files: List[str],
+                                      window_days: int = DEFAULT_TRANSFER_WINDOW_DAYS) -> pd.DataFrame:
+    """
+    Pair internal transfers across processed statements and save the combined result.
+
+    Args:
+        statement_files (list): Processed statement CSVs in the processed data folder
+        window_days (int): Largest date distance between the two legs
+
+    Returns:
+        pd.DataFrame: Combined statements with the transfer pairing columns
+    """
+    print("\nPairing internal transfers...")
+    df = pd.concat(
+        [read_standardized_csv(DATA_PROCESSED / name) for name in statement_files], ignore_index=True
+    )
+    df_paired, stats = pair_internal_transfers(df, window_days)
+
+    output_file = write_csv(df_paired, DATA_PROCESSED / "internal_transfers.csv")
+    print(f"\nStatements with transfer pairs saved to: {output_file}")
+    for key, value in stats.items():
+        print(f"  {key}: {value}")
+    return df_paired
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m src.reconciler.transfer_pairing <statement_clean.csv> [...]")
+    else:
+        process_transfer_pairing_workflow(sys.argv[1:])
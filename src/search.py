@@ -0,0 +1,56 @@
+"""
+search.py - Full-text search over the processed statements of every bank.
+
+Usage: python -m src.search [--bank CODE] [--limit N] <words> ...
+       python -m src.search --add <file_clean.csv> [<file_clean.csv> ...]
+       python -m src.search --remove-batch <import_batch_id>
+       python -m src.search --batches
+
+Words are matched as a phrase against description and additional_details,
+ignoring case and accents; the last word may be a prefix. Batches
+are added to the index by main.py and the workflows; --add indexes processed
+files from data/processed that were produced before the index existed.
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from src.store.search_index import SearchIndex
+from src.utils.file_manager import DATA_PROCESSED
+from src.utils.schema import read_standardized_csv
+
+def main():
+    """Entry point of the statement search."""
+    parser = argparse.ArgumentParser(description="Search statement descriptions and details across banks.")
+    parser.add_argument('words', nargs='*', help="Words to search")
+    parser.add_argument('--bank', help="Restrict to one bank code (BCP, BNB1, UNION, ...)")
+    parser.add_argument('--limit', type=int, default=20, help="Maximum number of rows (default 20)")
+    parser.add_argument('--add', nargs='+', metavar='FILE', help="Index processed files from data/processed")
+    parser.add_argument('--remove-batch', metavar='ID', help="Remove an import batch from the index")
+    parser.add_argument('--batches', action='store_true', help="List the indexed import batches")
+    args = parser.parse_args()
+
+    with SearchIndex() as index:
+        if args.add:
+            for name in args.add:
+                path = DATA_PROCESSED / name
+                if not path.exists():
+                    print(f"File not found: {path}")
+                    continue
+                rows = index.add_batch(read_standardized_csv(path))
+                print(f"{name}: {rows} rows indexed")
+        if args.remove_batch:
+            print(f"Removed {index.remove_batch(args.remove_batch)} rows of batch {args.remove_batch}")
+        if args.batches:
+            print(index.batches().to_string(index=False))
+        if args.words:
+            start = time.perf_counter()
+            df = index.search(' '.join(args.words), bank_code=args.bank, limit=args.limit)
+            elapsed = (time.perf_counter() - start) * 1000
+            with pd.option_context('display.max_colwidth', 60, 'display.width', 200):
+                print(df.to_string(index=False) if not df.empty else "No matches")
+            print(f"\n{len(df)} rows in {elapsed:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+"""
+__init__.py para hacer que la carpeta store sea un paquete Python.
+"""
@@ -0,0 +1,277 @@
+"""
+Materialized daily and monthly aggregates per account.
+
+Every cleaned batch updates the aggregates of the (account, day) pairs it
+covers, and the monthly aggregates of the months those days fall in. Daily
+aggregates are stored one file per month and monthly aggregates one file per
+year, so a batch rewrites only the partitions of its own months and years.
+Reports for a month or a year are answered from the aggregates without
+reloading any processed statement.
+
+A batch is taken to hold every movement of the days it covers, as statement
+exports do: the aggregates of a day are replaced, so re-importing an
+overlapping statement never counts a movement twice.
+"""
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.utils.file_manager import DATA_PROCESSED, atomic_path
+from src.utils.schema import read_typed_csv
+
+AGGREGATES_DIR = DATA_PROCESSED / "aggregates"
+
+ACCOUNT_COLUMNS = ['bank_code', 'account_number']
+DAILY_KEY_COLUMNS = ACCOUNT_COLUMNS + ['date']
+MONTHLY_KEY_COLUMNS = ACCOUNT_COLUMNS + ['month']
+AGGREGATE_COLUMNS = ['credit_total', 'debit_total', 'itf_total', 'transaction_count', 'closing_balance']
+
+AGGREGATE_DTYPES = {
+    'bank_code': str,
+    'account_number': str,
+    'month': str,
+    'credit_total': 'float64',
+    'debit_total': 'float64',
+    'itf_total': 'float64',
+    'transaction_count': 'Int64',
+    'closing_balance': 'float64',
+}
+AGGREGATE_DATE_FORMATS = {'date': '%Y-%m-%d'}
+
+def daily_aggregates(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregate a standardized statement per account and day.
+
+    Args:
+        df (pd.DataFrame): Standardized statement (one or several accounts)
+
+    Returns:
+        pd.DataFrame: bank_code, account_number, date and the day totals; closing_balance
+        is the balance after the last movement of the day
+    """
+    def _amount(col: str) -> np.ndarray:
+        if col not in df.columns:
+            return np.full(len(df), np.nan)
+        return pd.to_numeric(df[col], errors='coerce').to_numpy(dtype='float64')
+
+    dates = pd.to_datetime(df['transaction_date'], errors='coerce').dt.normalize()
+    df_day = pd.DataFrame({
+        'bank_code': df['bank_code'].astype('str').to_numpy(),
+        'account_number': df['account_number'].astype('str').to_numpy(),
+        'date': dates.to_numpy(),
+        'time': df['transaction_time'].astype('str').to_numpy() if 'transaction_time' in df.columns else '',
+        'credit_total': _amount('credit_amount'),
+        'debit_total': _amount('debit_amount'),
+        'itf_total': _amount('itf_amount'),
+        'closing_balance': _amount('balance'),
+    }).dropna(subset=['date'])
+
+    # Rows sorted by time within the day: the last one holds the closing balance
+    df_day = df_day.sort_values(DAILY_KEY_COLUMNS + ['time'], kind='stable')
+    grouped = df_day.groupby(DAILY_KEY_COLUMNS, sort=True)
+    df_daily = grouped[['credit_total', 'debit_total', 'itf_total']].sum()
+    df_daily['transaction_count'] = grouped.size().astype('Int64')
+    df_daily['closing_balance'] = grouped['closing_balance'].last()
+    return df_daily.reset_index()
+
+def combine_daily(frames) -> pd.DataFrame:
+    """
+    Merge daily aggregates of consecutive chunks of the same statements.
+
+    Args:
+        frames (list): Daily aggregates of each chunk, in statement order
+
+    Returns:
+        pd.DataFrame: One row per account and day; closing_balance from the last chunk
+    """
+    df_all = pd.concat(frames, ignore_index=True)
+    grouped = df_all.groupby(DAILY_KEY_COLUMNS, sort=True)
+    df_daily = grouped[['credit_total', 'debit_total', 'itf_total', 'transaction_count']].sum()
+    df_daily['closing_balance'] = grouped['closing_balance'].last()
+    return df_daily.reset_index()
+
+def monthly_aggregates(df_daily: pd.DataFrame) -> pd.DataFrame:
+    """
+    Roll daily aggregates up to months.
+
+    Args:
+        df_daily (pd.DataFrame): Daily aggregates
+
+    Returns:
+        pd.DataFrame: bank_code, account_number, month (YYYY-MM) and the month totals;
+        closing_balance is the closing balance of the last day with movements
+    """
+    df_month = df_daily.sort_values(DAILY_KEY_COLUMNS).assign(month=df_daily['date'].dt.strftime('%Y-%m'))
+    grouped = df_month.groupby(MONTHLY_KEY_COLUMNS, sort=True)
+    df_monthly = grouped[['credit_total', 'debit_total', 'itf_total', 'transaction_count']].sum()
+    df_monthly['closing_balance'] = grouped['closing_balance'].last()
+    return df_monthly.reset_index()
+
+def _upsert(df_existing: pd.DataFrame, df_new: pd.DataFrame, keys) -> pd.DataFrame:
+    """Replace the rows of df_existing whose keys appear in df_new, sorted by keys."""
+    if not df_existing.empty:
+        keep = ~pd.MultiIndex.from_frame(df_existing[keys]).isin(pd.MultiIndex.from_frame(df_new[keys]))
+        df_new = pd.concat([df_existing[keep], df_new], ignore_index=True)
+    return df_new.sort_values(keys, ignore_index=True)
+
+class AccountAggregates:
+    """Per-account aggregates, daily ones partitioned by month and monthly ones by year."""
+
+    def __init__(self, root: Path = AGGREGATES_DIR):
+        self.root = Path(root)
+        # Partitions read or written so far, by path
+        self._cache: Dict[Path, pd.DataFrame] = {}
+
+    def _daily_path(self, month: str) -> Path:
+        return self.root / f"daily_{month}.csv"
+
+    def _monthly_path(self, year: str) -> Path:
+        return self.root / f"monthly_{year}.csv"
+
+    def months(self) -> List[str]:
+        """List the months (YYYY-MM) with daily aggregates, oldest first."""
+        return sorted(p.stem.replace('daily_', '') for p in self.root.glob("daily_*.csv"))
+
+    def years(self) -> List[str]:
+        """List the years (YYYY) with monthly aggregates, oldest first."""
+        return sorted(p.stem.replace('monthly_', '') for p in self.root.glob("monthly_*.csv"))
+
+    def _read(self, path: Path, keys) -> pd.DataFrame:
+        if path in self._cache:
+            return self._cache[path]
+        if not path.exists():
+            return pd.DataFrame(columns=keys + AGGREGATE_COLUMNS)
+        self._cache[path] = read_typed_csv(path, AGGREGATE_DTYPES, AGGREGATE_DATE_FORMATS)
+        return self._cache[path]
+
+    def _concat(self, paths: List[Path], keys) -> pd.DataFrame:
+        if not paths:
+            return pd.DataFrame(columns=keys + AGGREGATE_COLUMNS)
+        return pd.concat([self._read(path, keys) for path in paths], ignore_index=True)
+
+    def daily(self, months: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """Daily aggregates of the given months (YYYY-MM), of every stored month when None."""
+        stored = self.months()
+        months = stored if months is None else sorted(set(months) & set(stored))
+        return self._concat([self._daily_path(month) for month in months], DAILY_KEY_COLUMNS)
+
+    def monthly(self, years: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """Monthly aggregates of the given years (YYYY), of every stored year when None."""
+        stored = self.years()
+        years = stored if years is None else sorted(set(years) & set(stored))
+        return self._concat([self._monthly_path(year) for year in years], MONTHLY_KEY_COLUMNS)
+
+    def update(self, df_batch: pd.DataFrame) -> int:
+        """
+        Update the aggregates with a cleaned batch, touching only the days and months it covers.
+
+        Args:
+            df_batch (pd.DataFrame): Standardized statement batch
+
+        Returns:
+            int: Number of (account, day) aggregates written
+        """
+        if df_batch.empty:
+            return 0
+        return self.update_daily(daily_aggregates(df_batch))
+
+    def update_daily(self, df_new_daily: pd.DataFrame) -> int:
+        """
+        Update the aggregates with already aggregated days (see daily_aggregates).
+
+        Only the daily partitions of the months of those days and the monthly
+        partitions of their years are rewritten.
+
+        Args:
+            df_new_daily (pd.DataFrame): Complete aggregates of the days to replace
+
+        Returns:
+            int: Number of (account, day) aggregates written
+        """
+        if df_new_daily.empty:
+            return 0
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        monthly_frames = []
+        for month, df_month in df_new_daily.groupby(df_new_daily['date'].dt.strftime('%Y-%m'), sort=True):
+            # Replace the days of the batch in their month
+            path = self._daily_path(month)
+            df_daily = _upsert(self._read(path, DAILY_KEY_COLUMNS), df_month, DAILY_KEY_COLUMNS)
+            self._write(path, df_daily)
+
+            # Recompute the month of the accounts the batch touches
+            touched = pd.MultiIndex.from_frame(df_month[ACCOUNT_COLUMNS].drop_duplicates())
+            in_touched = pd.MultiIndex.from_frame(df_daily[ACCOUNT_COLUMNS]).isin(touched)
+            monthly_frames.append(monthly_aggregates(df_daily[in_touched]))
+
+        df_new_monthly = pd.concat(monthly_frames, ignore_index=True)
+        for year, df_year in df_new_monthly.groupby(df_new_monthly['month'].str[:4], sort=True):
+            path = self._monthly_path(year)
+            self._write(path, _upsert(self._read(path, MONTHLY_KEY_COLUMNS), df_year, MONTHLY_KEY_COLUMNS))
+        return len(df_new_daily)
+
+    def _write(self, path: Path, df: pd.DataFrame) -> None:
+        with atomic_path(path) as tmp_path:
+            df.to_csv(tmp_path, index=False, date_format=AGGREGATE_DATE_FORMATS['date'])
+        self._cache[path] = df
+
+    def query_daily(self, start=None, end=None, bank_code: Optional[str] = None,
+                    account_number: Optional[str] = None) -> pd.DataFrame:
+        """
+        Daily aggregates within a date range.
+
+        Args:
+            start: First date (inclusive), None for no lower bound
+            end: Last date (inclusive), None for no upper bound
+            bank_code (str, optional): Restrict to one bank code
+            account_number (str, optional): Restrict to one account
+
+        Returns:
+            pd.DataFrame: Matching daily aggregates
+        """
+        # Only the monthly partitions overlapping the range are read
+        months = [
+            month for month in self.months()
+            if (start is None or month >= pd.Timestamp(start).strftime('%Y-%m'))
+            and (end is None or month <= pd.Timestamp(end).strftime('%Y-%m'))
+        ]
+        df = self.daily(months)
+        mask = np.ones(len(df), dtype=bool)
+        if start is not None:
+            mask &= (df['date'] >= pd.Timestamp(start)).to_numpy()
+        if end is not None:
+            mask &= (df['date'] <= pd.Timestamp(end)).to_numpy()
+        if bank_code is not None:
+            mask &= (df['bank_code'] == bank_code).to_numpy()
+        if account_number is not None:
+            mask &= (df['account_number'] == account_number).to_numpy()
+        return df[mask].reset_index(drop=True)
+
+    def query_period(self, period: str, bank_code: Optional[str] = None,
+                     account_number: Optional[str] = None) -> pd.DataFrame:
+        """
+        Totals per account for a month (YYYY-MM) or a year (YYYY).
+
+        Args:
+            period (str): 'YYYY-MM' or 'YYYY'
+            bank_code (str, optional): Restrict to one bank code
+            account_number (str, optional): Restrict to one account
+
+        Returns:
+            pd.DataFrame: One row per account with the period totals and its closing balance
+        """
+        df = self.monthly([period[:4]])
+        mask = df['month'].astype('str').str.startswith(period).to_numpy(dtype=bool)
+        if bank_code is not None:
+            mask &= (df['bank_code'] == bank_code).to_numpy()
+        if account_number is not None:
+            mask &= (df['account_number'] == account_number).to_numpy()
+        df = df[mask]
+        if len(period) == len('YYYY-MM'):
+            return df.reset_index(drop=True)
+
+        grouped = df.sort_values(MONTHLY_KEY_COLUMNS).groupby(ACCOUNT_COLUMNS, sort=True)
+        df_year = grouped[['credit_total', 'debit_total', 'itf_total', 'transaction_count']].sum()
+        df_year['closing_balance'] = grouped['closing_balance'].last()
+        return df_year.reset_index().assign(period=period)
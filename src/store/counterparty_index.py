@@ -0,0 +1,126 @@
+"""
+Counterparty index of the processed statements.
+
+Every cleaned or enriched batch adds its rows with an extracted counterparty
+to counterparties.csv, keyed by company_voucher (a re-imported row replaces
+the previous one). In memory the index is sorted by normalized counterparty
+name, with a hash map from counterparty account to rows: finding the
+movements of a counterparty is a binary search or a dictionary lookup, never
+a scan of the details text.
+"""
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.processors.counterparty_extractor import COUNTERPARTY_COLUMNS, extract_counterparties
+from src.utils.file_manager import DATA_PROCESSED, atomic_path
+from src.utils.formatter import map_unique, normalize_text
+from src.utils.schema import read_typed_csv
+
+COUNTERPARTY_INDEX_FILE = DATA_PROCESSED / "counterparties.csv"
+
+STATEMENT_COLUMNS = ['bank_code', 'account_number', 'company_voucher', 'transaction_date',
+                     'debit_amount', 'credit_amount']
+INDEX_COLUMNS = STATEMENT_COLUMNS + COUNTERPARTY_COLUMNS
+
+INDEX_DTYPES = {
+    'bank_code': str,
+    'account_number': str,
+    'company_voucher': str,
+    'debit_amount': 'float64',
+    'credit_amount': 'float64',
+    'counterparty_account': str,
+    'counterparty_name': str,
+    'counterparty_channel': str,
+}
+INDEX_DATE_FORMATS = {'transaction_date': '%Y-%m-%d'}
+
+def name_key(names: pd.Series) -> pd.Series:
+    """Lookup key of counterparty names: upper case, single spaces, no accents."""
+    def _keys(uniques: pd.Series) -> pd.Series:
+        folded = normalize_text(uniques.astype(object), unicode_form='NFKD')
+        return folded.str.replace('[\u0300-\u036f]', '', regex=True).str.upper()
+    
+    return pd.Series(map_unique(names, _keys), index=names.index, dtype=object)
+
+class CounterpartyIndex:
+    """Persistent index of statement rows by counterparty account and name."""
+
+    def __init__(self, path: Path = COUNTERPARTY_INDEX_FILE):
+        self.path = Path(path)
+        self._df: Optional[pd.DataFrame] = None
+        self._names: Optional[np.ndarray] = None
+        self._by_account: Optional[Dict[str, np.ndarray]] = None
+
+    def frame(self) -> pd.DataFrame:
+        """All indexed rows sorted by counterparty name, read once and kept in memory."""
+        if self._df is None:
+            if self.path.exists():
+                df = read_typed_csv(self.path, INDEX_DTYPES, INDEX_DATE_FORMATS)
+            else:
+                df = pd.DataFrame(columns=INDEX_COLUMNS)
+            self._set_frame(df)
+        return self._df
+
+    def _set_frame(self, df: pd.DataFrame) -> None:
+        # Sort the distinct keys only, then the rows by the rank of their key
+        codes, keys = pd.factorize(name_key(df['counterparty_name']).fillna(''))
+        keys = keys.to_numpy(dtype=object)
+        rank = np.empty(len(keys), dtype=np.int64)
+        rank[np.argsort(keys)] = np.arange(len(keys))
+        order = np.argsort(rank[codes], kind='stable')
+        self._df = df.iloc[order].reset_index(drop=True)
+        self._names = keys[codes[order]]
+        self._by_account = self._df.groupby('counterparty_account', sort=False).indices
+
+    def update(self, df_statements: pd.DataFrame) -> int:
+        """
+        Index the counterparties of a cleaned or enriched batch.
+
+        Args:
+            df_statements (pd.DataFrame): Standardized statements
+
+        Returns:
+            int: Number of rows with a counterparty written to the index
+        """
+        df_new = df_statements[STATEMENT_COLUMNS].join(extract_counterparties(df_statements))
+        df_new = df_new[df_new[COUNTERPARTY_COLUMNS].notna().any(axis=1)]
+        df_existing = self.frame()
+        if df_new.empty:
+            return 0
+
+        df_new = df_new.assign(transaction_date=pd.to_datetime(df_new['transaction_date'], errors='coerce'))
+        keep = ~df_existing['company_voucher'].isin(df_new['company_voucher'])
+        df_all = pd.concat([df_existing[keep], df_new], ignore_index=True) if keep.any() else df_new
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_path(self.path) as tmp_path:
+            df_all[INDEX_COLUMNS].to_csv(tmp_path, index=False, date_format=INDEX_DATE_FORMATS['transaction_date'])
+        self._set_frame(df_all[INDEX_COLUMNS])
+        return len(df_new)
+
+    def lookup(self, name: Optional[str] = None, account: Optional[str] = None) -> pd.DataFrame:
+        """
+        Movements of a counterparty.
+
+        Args:
+            name (str, optional): Counterparty name or its beginning (case and accents ignored)
+            account (str, optional): Counterparty account number
+
+        Returns:
+            pd.DataFrame: Indexed rows matching every given criterion
+        """
+        df = self.frame()
+        positions = None
+        if name is not None:
+            prefix = name_key(pd.Series([name])).iloc[0] or ''
+            start = np.searchsorted(self._names, prefix, side='left')
+            end = np.searchsorted(self._names, prefix + '\U0010ffff', side='left')
+            positions = np.arange(start, end)
+        if account is not None:
+            by_account = self._by_account.get(str(account), np.array([], dtype=np.int64))
+            positions = by_account if positions is None else np.intersect1d(positions, by_account)
+        if positions is None:
+            return df.copy()
+        return df.iloc[positions].reset_index(drop=True)
@@ -0,0 +1,136 @@
+"""
+Persistent store of BCP payment reports, partitioned by month.
+
+Every processed payment report is appended to the store. Rows are deduplicated
+and each monthly partition is kept sorted by (payment_date, amount_cents), the
+key used to match statement rows during enrichment.
+"""
+from collections import OrderedDict
+import pandas as pd
+from pathlib import Path
+from typing import Iterable, List
+
+from src.utils.file_manager import PAYMENT_STORE_DIR, atomic_path
+from src.utils.schema import PAYMENT_REPORT_DTYPES, PAYMENT_REPORT_DATE_FORMATS, read_typed_csv
+
+# Matching key shared with the enricher
+PAYMENT_KEY_COLUMNS = ['payment_date', 'amount_cents']
+
+# Partitions hold the cleaned report columns, matching key included
+PAYMENT_STORE_DTYPES = PAYMENT_REPORT_DTYPES
+PAYMENT_STORE_DATE_FORMATS = PAYMENT_REPORT_DATE_FORMATS
+
+# Columns identifying the same payment across overlapping reports
+DEDUP_COLUMNS = ['payment_date', 'HORA', 'amount_cents', 'CANAL', 'TITULAR', 'GLOSA']
+
+def add_payment_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the (payment_date, amount_cents) matching key to a cleaned payment report.
+    
+    Reports from clean_bcp_payments already carry the key, which is kept.
+    
+    Args:
+        df (pd.DataFrame): Cleaned payment report with FECHA and MONTO ABONADO
+        
+    Returns:
+        pd.DataFrame: Copy of the report with payment_date and amount_cents columns
+    """
+    df_keyed = df.copy()
+    if (all(col in df_keyed.columns for col in PAYMENT_KEY_COLUMNS)
+            and pd.api.types.is_datetime64_any_dtype(df_keyed['payment_date'])):
+        return df_keyed
+    if pd.api.types.is_datetime64_any_dtype(df_keyed['FECHA']):
+        payment_date = df_keyed['FECHA']
+    else:
+        payment_date = pd.to_datetime(df_keyed['FECHA'], format='%d/%m/%Y', errors='coerce')
+    amount = pd.to_numeric(df_keyed['MONTO ABONADO'], errors='coerce')
+    
+    df_keyed['payment_date'] = payment_date.dt.normalize()
+    df_keyed['amount_cents'] = (amount * 100).round().astype('Int64')
+    return df_keyed
+
+class PaymentStore:
+    """Month-partitioned, deduplicated store of cleaned BCP payment reports."""
+    
+    def __init__(self, root: Path = PAYMENT_STORE_DIR, cached_months: int = 0):
+        self.root = Path(root)
+        # Recently read partitions, for callers that load the same months chunk after chunk
+        self.cached_months = cached_months
+        self._cache: OrderedDict = OrderedDict()
+        
+    def _partition_path(self, month: str) -> Path:
+        return self.root / f"payments_{month}.csv"
+        
+    def months(self) -> List[str]:
+        """List the stored months (YYYY-MM), oldest first."""
+        return sorted(p.stem.replace('payments_', '') for p in self.root.glob("payments_*.csv"))
+        
+    def _read_partition(self, month: str) -> pd.DataFrame:
+        if month in self._cache:
+            self._cache.move_to_end(month)
+            return self._cache[month]
+        df = read_typed_csv(self._partition_path(month), PAYMENT_STORE_DTYPES, PAYMENT_STORE_DATE_FORMATS)
+        if self.cached_months:
+            self._cache[month] = df
+            while len(self._cache) > self.cached_months:
+                self._cache.popitem(last=False)
+        return df
+        
+    def append(self, df_payments: pd.DataFrame) -> int:
+        """
+        Append a cleaned payment report, rewriting only the months it touches.
+        
+        Args:
+            df_payments (pd.DataFrame): Cleaned payment report
+            
+        Returns:
+            int: Number of new payments added to the store
+        """
+        df_new = add_payment_keys(df_payments)
+        df_new = df_new[df_new['payment_date'].notna() & df_new['amount_cents'].notna()]
+        if df_new.empty:
+            return 0
+            
+        self.root.mkdir(parents=True, exist_ok=True)
+        stored_months = set(self.months())
+        added = 0
+        
+        for month, df_month in df_new.groupby(df_new['payment_date'].dt.strftime('%Y-%m')):
+            df_existing = self._read_partition(month) if month in stored_months else df_month.iloc[0:0]
+            df_all = pd.concat([df_existing, df_month], ignore_index=True)
+            dedup_key = df_all[DEDUP_COLUMNS].astype(str).where(df_all[DEDUP_COLUMNS].notna(), '')
+            df_all = df_all[~dedup_key.duplicated()]
+            added += len(df_all) - len(df_existing)
+            
+            df_all = df_all.sort_values(PAYMENT_KEY_COLUMNS, kind='stable')
+            self._write_partition(month, df_all)
+            
+        return added
+        
+    def _write_partition(self, month: str, df: pd.DataFrame) -> None:
+        # FECHA keeps the report date format whatever its type in the input
+        df = df.assign(FECHA=df['payment_date'].dt.strftime(PAYMENT_REPORT_DATE_FORMATS['FECHA']))
+        with atomic_path(self._partition_path(month)) as tmp_path:
+            df.to_csv(tmp_path, index=False, date_format=PAYMENT_STORE_DATE_FORMATS['payment_date'])
+        self._cache.pop(month, None)
+        
+    def load(self, dates: Iterable) -> pd.DataFrame:
+        """
+        Load the stored payments for the given dates.
+        
+        Only the monthly partitions covering the dates are read.
+        
+        Args:
+            dates: Transaction dates to load payments for
+            
+        Returns:
+            pd.DataFrame: Payments on those dates (empty if none are stored)
+        """
+        wanted = pd.DatetimeIndex(pd.to_datetime(pd.Series(list(dates)), errors='coerce').dropna().unique()).normalize()
+        stored_months = set(self.months())
+        months = sorted(set(wanted.strftime('%Y-%m')) & stored_months)
+        if not months:
+            return pd.DataFrame(columns=PAYMENT_KEY_COLUMNS + ['Adicionales'])
+            
+        df = pd.concat([self._read_partition(month) for month in months], ignore_index=True)
+        return df[df['payment_date'].isin(wanted)].reset_index(drop=True)
@@ -0,0 +1,176 @@
+"""
+Local full-text search index over statement descriptions and details.
+
+Cleaned batches are fed into a SQLite database with an FTS5 index on
+description and additional_details. Rows are keyed by company_voucher: a
+re-imported or re-enriched row replaces the previous one, and rows whose text
+did not change are left alone, so feeding a batch again costs no reindexing.
+Each row keeps its import_batch_id, so a batch can be removed as a whole.
+"""
+import sqlite3
+import pandas as pd
+from pathlib import Path
+from typing import List, Optional
+
+from src.utils.file_manager import DATA_PROCESSED
+
+SEARCH_INDEX_FILE = DATA_PROCESSED / "search.db"
+
+INDEXED_COLUMNS = ['company_voucher', 'bank_code', 'account_number', 'transaction_date',
+                   'debit_amount', 'credit_amount', 'description', 'additional_details', 'import_batch_id']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS statements (
+    company_voucher TEXT PRIMARY KEY,
+    bank_code TEXT,
+    account_number TEXT,
+    transaction_date TEXT,
+    debit_amount REAL,
+    credit_amount REAL,
+    description TEXT,
+    additional_details TEXT,
+    import_batch_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_statements_batch ON statements(import_batch_id);
+
+-- Case and accent insensitive; the FTS index mirrors the statements table
+CREATE VIRTUAL TABLE IF NOT EXISTS statements_fts USING fts5(
+    description, additional_details,
+    content='statements', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS statements_ai AFTER INSERT ON statements BEGIN
+    INSERT INTO statements_fts(rowid, description, additional_details)
+    VALUES (new.rowid, new.description, new.additional_details);
+END;
+CREATE TRIGGER IF NOT EXISTS statements_ad AFTER DELETE ON statements BEGIN
+    INSERT INTO statements_fts(statements_fts, rowid, description, additional_details)
+    VALUES ('delete', old.rowid, old.description, old.additional_details);
+END;
+CREATE TRIGGER IF NOT EXISTS statements_au AFTER UPDATE OF description, additional_details ON statements BEGIN
+    INSERT INTO statements_fts(statements_fts, rowid, description, additional_details)
+    VALUES ('delete', old.rowid, old.description, old.additional_details);
+    INSERT INTO statements_fts(rowid, description, additional_details)
+    VALUES (new.rowid, new.description, new.additional_details);
+END;
+"""
+
+# Only rows whose values changed are rewritten (and reindexed)
+UPSERT = f"""
+INSERT INTO statements ({', '.join(INDEXED_COLUMNS)})
+VALUES ({', '.join('?' for _ in INDEXED_COLUMNS)})
+ON CONFLICT(company_voucher) DO UPDATE SET
+    {', '.join(f'{col} = excluded.{col}' for col in INDEXED_COLUMNS[1:])}
+WHERE {' OR '.join(f'{col} IS NOT excluded.{col}' for col in INDEXED_COLUMNS[1:])}
+"""
+
+def match_expression(query: str) -> str:
+    """
+    Turn free text into an FTS5 phrase query: the words must appear together and in order,
+    the last one as a prefix when it is a plain word of 3 characters or more (shorter
+    prefixes match most of the index).
+
+    Args:
+        query (str): Words to search, e.g. a name or an invoice number
+
+    Returns:
+        str: FTS5 MATCH expression
+    """
+    words = query.split()
+    if not words:
+        return ''
+    expression = '"' + ' '.join(words).replace('"', '""') + '"'
+    if len(words[-1]) >= 3 and words[-1].isalnum():
+        expression += '*'
+    return expression
+
+class SearchIndex:
+    """SQLite FTS5 index of processed statements, keyed by company_voucher."""
+
+    def __init__(self, path: Path = SEARCH_INDEX_FILE):
+        self.path = Path(path)
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path)
+            self._connection.executescript(SCHEMA)
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> 'SearchIndex':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def add_batch(self, df: pd.DataFrame) -> int:
+        """
+        Index a cleaned or enriched batch.
+
+        Args:
+            df (pd.DataFrame): Standardized statements
+
+        Returns:
+            int: Number of rows inserted or changed
+        """
+        df_rows = df.reindex(columns=INDEXED_COLUMNS).dropna(subset=['company_voucher'])
+        dates = pd.to_datetime(df_rows['transaction_date'], errors='coerce').dt.strftime('%Y-%m-%d')
+        df_rows = df_rows.assign(transaction_date=dates).astype(object)
+        rows = df_rows.where(df_rows.notna(), None).itertuples(index=False, name=None)
+
+        connection = self._connect()
+        with connection:
+            return connection.executemany(UPSERT, rows).rowcount
+
+    def remove_batch(self, import_batch_id: str) -> int:
+        """
+        Remove every row of an import batch from the index.
+
+        Args:
+            import_batch_id (str): Batch to remove
+
+        Returns:
+            int: Number of rows removed
+        """
+        connection = self._connect()
+        with connection:
+            return connection.execute("DELETE FROM statements WHERE import_batch_id = ?", (import_batch_id,)).rowcount
+
+    def batches(self) -> pd.DataFrame:
+        """Indexed import batches with their row count and date range."""
+        return pd.read_sql_query(
+            "SELECT import_batch_id, bank_code, COUNT(*) AS rows, MIN(transaction_date) AS first_date, "
+            "MAX(transaction_date) AS last_date FROM statements GROUP BY import_batch_id, bank_code "
+            "ORDER BY last_date", self._connect())
+
+    def search(self, query: str, bank_code: Optional[str] = None, limit: int = 50) -> pd.DataFrame:
+        """
+        Find statement rows whose description or details contain a phrase.
+
+        Args:
+            query (str): Words to search (case and accents ignored, see match_expression)
+            bank_code (str, optional): Restrict to one bank code
+            limit (int): Maximum number of rows, best matches first
+
+        Returns:
+            pd.DataFrame: Matching rows
+        """
+        expression = match_expression(query)
+        if not expression:
+            return pd.DataFrame(columns=INDEXED_COLUMNS)
+        sql = (f"SELECT {', '.join('s.' + col for col in INDEXED_COLUMNS)} FROM statements_fts "
+               "JOIN statements s ON s.rowid = statements_fts.rowid WHERE statements_fts MATCH ?")
+        params: List = [expression]
+        if bank_code is not None:
+            sql += " AND s.bank_code = ?"
+            params.append(bank_code)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        return pd.read_sql_query(sql, self._connect(), params=params)
@@ -0,0 +1,170 @@
+"""
+Partitioned columnar store of the processed statements.
+
+Every cleaned or enriched batch is written to Parquet partitions laid out as
+bank_code=<code>/account_number=<account>/month=<YYYY-MM>/part.parquet. Only
+the partitions a batch touches are rewritten, and rows are keyed by
+company_voucher, so a re-imported or enriched row replaces the previous one.
+
+Queries prune partitions by bank, account and month from the directory names,
+and read only the requested columns plus the ones they filter on; row filters
+on dates and amounts are pushed down to the Parquet reader.
+"""
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import List, Optional
+
+from src.utils.file_manager import STATEMENT_STORE_DIR, atomic_path
+from src.utils.schema import STANDARD_COLUMNS, STANDARD_DTYPES
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+PARTITION_COLUMNS = ['bank_code', 'account_number', 'month']
+
+# Columns stored in the partition files (bank and account live in the path)
+FILE_COLUMNS = [col for col in STANDARD_COLUMNS if col not in PARTITION_COLUMNS]
+
+def _arrow_type(col: str):
+    if col == 'transaction_date':
+        return pa.date32()
+    return pa.float64() if STANDARD_DTYPES.get(col) == 'float64' else pa.string()
+
+def _to_table(df: pd.DataFrame) -> 'pa.Table':
+    """Arrow table of the file columns with the standardized types, whatever the input types."""
+    arrays = []
+    for col in FILE_COLUMNS:
+        values = df[col] if col in df.columns else pd.Series(None, index=df.index, dtype=object)
+        if col == 'transaction_date':
+            values = pd.to_datetime(values, errors='coerce').dt.normalize()
+            array = pa.array(values, from_pandas=True).cast(pa.timestamp('s')).cast(pa.date32())
+        elif STANDARD_DTYPES.get(col) == 'float64':
+            array = pa.array(pd.to_numeric(values, errors='coerce').to_numpy(dtype='float64'), from_pandas=True)
+        else:
+            # Times and numbers kept as text, missing values as nulls
+            text = values.astype(object).where(values.isna(), values.astype(str))
+            array = pa.array(text.to_numpy(dtype=object), type=pa.string(), from_pandas=True)
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, names=FILE_COLUMNS)
+
+class StatementStore:
+    """Parquet store of standardized statements partitioned by bank, account and month."""
+
+    def __init__(self, root: Path = STATEMENT_STORE_DIR):
+        self.root = Path(root)
+
+    def _partition_path(self, bank_code: str, account_number: str, month: str) -> Path:
+        return self.root / f"bank_code={bank_code}" / f"account_number={account_number}" / f"month={month}" / "part.parquet"
+
+    def partitions(self) -> pd.DataFrame:
+        """Stored partitions (bank_code, account_number, month), sorted."""
+        rows = [
+            [part.split('=', 1)[1] for part in path.relative_to(self.root).parts[:3]]
+            for path in self.root.glob("bank_code=*/account_number=*/month=*/part.parquet")
+        ]
+        return pd.DataFrame(sorted(rows), columns=PARTITION_COLUMNS)
+
+    def append(self, df: pd.DataFrame) -> int:
+        """
+        Add a cleaned or enriched batch, rewriting only the partitions it touches.
+
+        Args:
+            df (pd.DataFrame): Standardized statements (one or several accounts)
+
+        Returns:
+            int: Number of partitions written (0 when pyarrow is not installed)
+        """
+        if pa is None:
+            print("pyarrow is not installed: statement store not updated")
+            return 0
+        if df.empty:
+            return 0
+        dates = pd.to_datetime(df['transaction_date'], errors='coerce')
+        keyed = dates.notna() & df['bank_code'].notna() & df['account_number'].notna()
+        df = df[keyed]
+        if df.empty:
+            return 0
+
+        keys = pd.DataFrame({
+            'bank_code': df['bank_code'].astype(str).to_numpy(),
+            'account_number': df['account_number'].astype(str).to_numpy(),
+            'month': dates[keyed].dt.strftime('%Y-%m').to_numpy(),
+        })
+        written = 0
+        for (bank_code, account_number, month), positions in keys.groupby(PARTITION_COLUMNS, sort=True).indices.items():
+            path = self._partition_path(bank_code, account_number, month)
+            table = _to_table(df.iloc[positions])
+            if path.exists():
+                table = pa.concat_tables([pq.read_table(path), table])
+            self._write_partition(path, table)
+            written += 1
+        return written
+
+    def _write_partition(self, path: Path, table: 'pa.Table') -> None:
+        # The last row of a voucher wins; rows kept in date and time order
+        vouchers = table.column('company_voucher').to_pandas()
+        keep = ~(vouchers.notna() & vouchers.duplicated(keep='last')).to_numpy()
+        table = table.filter(pa.array(keep))
+        table = table.sort_by([('transaction_date', 'ascending'), ('transaction_time', 'ascending')])
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_path(path) as tmp_path:
+            pq.write_table(table, tmp_path)
+
+    def query(self, bank_code: Optional[str] = None, account_number: Optional[str] = None,
+              start=None, end=None, min_amount: Optional[float] = None, max_amount: Optional[float] = None,
+              columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Statements of an account and period, reading only the matching partitions and columns.
+
+        Args:
+            bank_code (str, optional): Restrict to one bank code
+            account_number (str, optional): Restrict to one account
+            start: First transaction date (inclusive), None for no lower bound
+            end: Last transaction date (inclusive), None for no upper bound
+            min_amount (float, optional): Smallest debit or credit amount
+            max_amount (float, optional): Largest debit or credit amount
+            columns (list, optional): Columns to return (default: every standardized column)
+
+        Returns:
+            pd.DataFrame: Matching rows in partition order, transaction_date as datetime64
+        """
+        if pa is None:
+            raise ImportError("pyarrow is required to query the statement store")
+        columns = list(columns or STANDARD_COLUMNS)
+        if not self.root.exists():
+            return pd.DataFrame(columns=columns)
+
+        partitioning = ds.partitioning(pa.schema([(col, pa.string()) for col in PARTITION_COLUMNS]), flavor='hive')
+        dataset = ds.dataset(self.root, format='parquet', partitioning=partitioning)
+
+        # Partition filters prune directories; the others are pushed down to the row groups
+        filters = []
+        if bank_code is not None:
+            filters.append(ds.field('bank_code') == bank_code)
+        if account_number is not None:
+            filters.append(ds.field('account_number') == str(account_number))
+        if start is not None:
+            start = pd.Timestamp(start)
+            filters.append(ds.field('month') >= start.strftime('%Y-%m'))
+            filters.append(ds.field('transaction_date') >= pa.scalar(start.date(), pa.date32()))
+        if end is not None:
+            end = pd.Timestamp(end)
+            filters.append(ds.field('month') <= end.strftime('%Y-%m'))
+            filters.append(ds.field('transaction_date') <= pa.scalar(end.date(), pa.date32()))
+        if min_amount is not None or max_amount is not None:
+            low = -np.inf if min_amount is None else min_amount
+            high = np.inf if max_amount is None else max_amount
+            filters.append(((ds.field('debit_amount') >= low) & (ds.field('debit_amount') <= high))
+                           | ((ds.field('credit_amount') >= low) & (ds.field('credit_amount') <= high)))
+
+        expression = None
+        for condition in filters:
+            expression = condition if expression is None else expression & condition
+        table = dataset.to_table(columns=[col for col in columns if col != 'month'], filter=expression)
+        return table.to_pandas(date_as_object=False)
@@ -0,0 +1,143 @@
+"""
+Build state of the processed outputs.
+
+The pipeline is a small build graph: raw file -> *_clean.csv, and cleaned BCP
+statement + payment store partitions -> bcp_final.csv. For every output the
+build state records the content hash of each input it was built from, and the
+hash of the output itself. An output is rebuilt only when an input hash
+changed, an input was added or removed, or the output is missing or was
+modified since it was built.
+
+Content hashes are cached per file under its size and modification time, so
+checking an unchanged graph only stats the files and never rereads them.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.utils.file_manager import BASE_DIR, DATA_PROCESSED, atomic_path
+
+BUILD_STATE_FILE = DATA_PROCESSED / ".build_state.json"
+
+# Bytes read at a time when hashing a file
+HASH_BLOCK_SIZE = 1 << 20
+
+def _key(path: Path) -> str:
+    """Path as stored in the build state: relative to the project when inside it."""
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(BASE_DIR.resolve()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+class BuildState:
+    """Persistent record of the input hashes each processed output was built from."""
+
+    def __init__(self, path: Path = BUILD_STATE_FILE):
+        self.path = Path(path)
+        self._state: Optional[Dict[str, Dict]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict]:
+        if self._state is None:
+            try:
+                self._state = json.loads(self.path.read_text(encoding='utf-8'))
+            except (FileNotFoundError, ValueError):
+                self._state = {}
+            self._state.setdefault('files', {})
+            self._state.setdefault('nodes', {})
+        return self._state
+
+    def file_hash(self, path: Path) -> Optional[str]:
+        """
+        Content hash of a file, reusing the cached hash while its size and mtime are unchanged.
+
+        Args:
+            path (Path): File to hash
+
+        Returns:
+            str | None: SHA-256 hex digest, None if the file does not exist
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        files = self._load()['files']
+        key = _key(path)
+        cached = files.get(key)
+        if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+            return cached['sha256']
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+        files[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest.hexdigest()}
+        self._dirty = True
+        return files[key]['sha256']
+
+    def is_current(self, output: Path, inputs: Iterable[Path]) -> bool:
+        """
+        Whether an output is up to date with its inputs.
+
+        Args:
+            output (Path): Processed output file
+            inputs (list): Files the output is built from
+
+        Returns:
+            bool: True when the output exists unchanged and was built from the current inputs
+        """
+        node = self._load()['nodes'].get(_key(output))
+        if node is None or self.file_hash(output) != node['output']:
+            return False
+        current = {_key(path): self.file_hash(path) for path in inputs}
+        return current == node['inputs']
+
+    def changed_inputs(self, output: Path, inputs: Iterable[Path]) -> List[Path]:
+        """
+        Inputs whose content differs from the last build of an output.
+
+        Args:
+            output (Path): Processed output file
+            inputs (list): Files the output is built from
+
+        Returns:
+            list: Inputs that changed or are new since the output was recorded (all of them if it never was)
+        """
+        recorded = self._load()['nodes'].get(_key(output), {}).get('inputs', {})
+        return [path for path in inputs if recorded.get(_key(path)) != self.file_hash(path)]
+
+    def record(self, output: Path, inputs: Iterable[Path]) -> None:
+        """
+        Record that an output was just built from the given inputs.
+
+        Args:
+            output (Path): Processed output file
+            inputs (list): Files the output was built from
+        """
+        self._load()['nodes'][_key(output)] = {
+            'inputs': {_key(path): self.file_hash(path) for path in inputs},
+            'output': self.file_hash(output),
+        }
+        self._dirty = True
+        self.save()
+
+    def save(self) -> None:
+        """Write the build state if it changed (hashes computed or outputs recorded)."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_path(self.path) as tmp_path:
+            tmp_path.write_text(json.dumps(self._load(), indent=2), encoding='utf-8')
+        self._dirty = False
+
+_default_state: Optional[BuildState] = None
+
+def get_build_state() -> BuildState:
+    """Return the shared build state stored in the processed data folder."""
+    global _default_state
+    if _default_state is None:
+        _default_state = BuildState()
+    return _default_state
@@ -4,6 +4,8 @@ Utilidades para convertir archivos XLS/XLSX a CSV.
 import os
 import pandas as pd
 
+from src.reader.engines import select_engine
+
 
 def convert_excel_to_csv(input_path, output_path=None, sheet_name=0):
     """
@@ -34,7 +36,7 @@ def convert_excel_to_csv(input_path, output_path=None, sheet_name=0):
             output_path = os.path.join(output_dir, f"{base_name}.csv")
         
         # Leer el archivo Excel
-        df = pd.read_excel(input_path, sheet_name=sheet_name)
+        df = pd.read_excel(input_path, sheet_name=sheet_name, engine=select_engine(input_path))
         
         # Guardar como CSV
         df.to_csv(output_path, index=False)
@@ -1,13 +1,143 @@
 """
 File management utilities for finding and managing statement files.
 """
+import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional
 
 # Project paths
 BASE_DIR = Path(__file__).parent.parent.parent
 DATA_RAW = BASE_DIR / "data" / "raw"
 DATA_PROCESSED = BASE_DIR / "data" / "processed"
+PAYMENT_STORE_DIR = DATA_PROCESSED / "payment_store"
+STATEMENT_STORE_DIR = DATA_PROCESSED / "statements"
+BCP_FINAL_FILE = DATA_PROCESSED / "bcp_final.csv"
+
+# File suffix of each supported compression (readers infer it from the suffix)
+COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+
+_output_compression: Optional[str] = None
+
+def set_output_compression(compression: Optional[str]) -> None:
+    """
+    Compress every processed output written from now on.
+    
+    Args:
+        compression (str, optional): 'gzip' or 'zstd', None for plain CSV
+    """
+    global _output_compression
+    if compression is not None and compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression {compression}. Must be one of: {', '.join(COMPRESSION_SUFFIXES)}")
+    _output_compression = compression
+
+def output_compression() -> Optional[str]:
+    """Compression of the processed outputs, None for plain CSV."""
+    return _output_compression
+
+def compressed_path(path: Path, compression: Optional[str]) -> Path:
+    """
+    Output path with the suffix of its compression.
+
+    Args:
+        path (Path): Output CSV path
+        compression (str, optional): None, 'gzip' or 'zstd'
+
+    Returns:
+        Path: path, with .gz or .zst appended when compressed and not already there
+    """
+    path = Path(path)
+    if compression is None:
+        return path
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression {compression}. Must be one of: {', '.join(COMPRESSION_SUFFIXES)}")
+    suffix = COMPRESSION_SUFFIXES[compression]
+    return path if path.suffix == suffix else path.with_name(path.name + suffix)
+
+def output_path(path: Path) -> Path:
+    """
+    Path a processed output is written to with the current output compression.
+    
+    Args:
+        path (Path): Output CSV path
+        
+    Returns:
+        Path: path, with the compression suffix when outputs are compressed
+    """
+    return compressed_path(path, _output_compression)
+
+def existing_outputs(path: Path) -> List[Path]:
+    """
+    Versions of a processed output on disk, plain or compressed.
+    
+    Args:
+        path (Path): Plain output CSV path
+        
+    Returns:
+        list: The existing files among path, path.gz and path.zst
+    """
+    path = Path(path)
+    candidates = [path] + [path.with_name(path.name + suffix) for suffix in COMPRESSION_SUFFIXES.values()]
+    return [candidate for candidate in candidates if candidate.exists()]
+
+def temporary_path(path: Path) -> Path:
+    """
+    Temporary file next to a target, unique to the writing process.
+    
+    Args:
+        path (Path): File about to be written
+        
+    Returns:
+        Path: {name}.{pid}.tmp in the folder of path
+    """
+    path = Path(path)
+    return path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+@contextmanager
+def atomic_path(path: Path) -> Iterator[Path]:
+    """
+    Write a file through a temporary file so readers never see a partial one.
+    
+    The block writes to the yielded path, which then replaces path in one
+    step. On error the temporary file is removed and path is left untouched.
+    
+    Args:
+        path (Path): File to write
+        
+    Yields:
+        Path: Temporary file to write instead of path
+    """
+    tmp_path = temporary_path(path)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+def clean_output_path(file_path: Path) -> Path:
+    """
+    Path of the cleaned output of a raw file.
+    
+    Args:
+        file_path (Path): Raw statement or payment report
+        
+    Returns:
+        Path: {stem}_clean.csv in the processed data folder, with the suffix of
+        the output compression
+    """
+    return output_path(DATA_PROCESSED / f"{Path(file_path).stem}_clean.csv")
+
+def bcp_final_inputs(statement_file: Path) -> List[Path]:
+    """
+    Files the enriched BCP statement is built from.
+    
+    Args:
+        statement_file (Path): Cleaned BCP statement
+        
+    Returns:
+        list: The statement and every payment store partition
+    """
+    return [Path(statement_file)] + sorted(PAYMENT_STORE_DIR.glob("payments_*.csv"))
 
 def find_bcp_clean_statement() -> Optional[Path]:
     """
@@ -16,7 +146,7 @@ def find_bcp_clean_statement() -> Optional[Path]:
     Returns:
         Path | None: Path of the file if it exists, None otherwise
     """
-    statement_candidates = list(DATA_PROCESSED.glob("bcpHistoricos_clean.csv"))
+    statement_candidates = existing_outputs(DATA_PROCESSED / "bcpHistoricos_clean.csv")
     if not statement_candidates:
         return None
     return max(statement_candidates, key=lambda p: p.stat().st_mtime)
@@ -28,7 +158,7 @@ def find_payment_report() -> Optional[Path]:
     Returns:
         Path | None: Path of the file if it exists, None otherwise
     """
-    report_candidates = list(DATA_PROCESSED.glob("ReporteAbonos_clean.csv"))
+    report_candidates = existing_outputs(DATA_PROCESSED / "ReporteAbonos_clean.csv")
     if not report_candidates:
         return None
     return max(report_candidates, key=lambda p: p.stat().st_mtime)
@@ -1,8 +1,16 @@
 """
 Data formatting utilities for bank statements.
 """
+import numpy as np
 import pandas as pd
-from typing import Union, Optional
+from typing import Callable, Union, Optional
+
+# Whitespace as str.split() sees it, spelled out so the pattern means the same
+# to the Python and the pyarrow (RE2) regex engines
+WHITESPACE_PATTERN = '[\\s\x1c-\x1f\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+'
+
+# Tabs and line breaks exported as the escaped text '\\t' / '\\n'
+ESCAPED_BREAK_PATTERN = r'\\[tn]'
 
 def format_currency(value: Union[str, float, int]) -> float:
     """
@@ -40,6 +48,84 @@ def clean_text(text: str, remove_all_spaces: bool = False) -> Optional[str]:
     # Normalize spaces (multiple spaces to single space)
     return ' '.join(clean.split())
 
+def take_unique(codes: np.ndarray, converted, missing=None) -> np.ndarray:
+    """
+    Spread results computed once per distinct value of a factorized column back to its rows.
+    
+    Args:
+        codes: Codes returned by pd.factorize (-1 where the value is missing)
+        converted: One result per distinct value, in the order of the uniques
+        missing: Result of the missing values
+        
+    Returns:
+        np.ndarray: Result per row (text results as objects)
+    """
+    converted = np.asarray(converted)
+    if converted.dtype.kind in 'US':
+        converted = converted.astype(object)
+    # Missing values have code -1, which picks the trailing missing result
+    tail = np.array([missing], dtype=converted.dtype)
+    return np.append(converted, tail)[codes]
+
+def map_unique(values: pd.Series, convert: Callable[[pd.Series], object], missing=None,
+               dtype=object) -> np.ndarray:
+    """
+    Convert a column through its distinct values, each one converted once.
+    
+    Statement columns repeat a lot (dates, times, descriptions): the column is
+    factorized, its distinct values converted with one vectorized call and the
+    results spread back to the rows.
+    
+    Args:
+        values: Column to convert
+        convert: Vectorized conversion of a Series of the distinct values, one result per value
+        missing: Result of the missing values
+        dtype: dtype of the results, None to keep the one convert returns
+        
+    Returns:
+        np.ndarray: Converted value per row
+    """
+    codes, uniques = pd.factorize(values)
+    return take_unique(codes, np.asarray(convert(pd.Series(uniques)), dtype=dtype), missing)
+
+def normalize_text(values: pd.Series, remove_all_spaces: bool = False, collapse_spaces: bool = True,
+                   unicode_form: Optional[str] = None, categorical: bool = False) -> pd.Series:
+    """
+    Column-wise clean_text: normalize every distinct value once with .str and regex operations.
+    
+    Texts repeat a lot in statement histories (descriptions, branch names), so
+    the column is factorized, its distinct values normalized, and the column
+    rebuilt from their codes: equal results share one string object, or one
+    category when categorical is set.
+    
+    Args:
+        values: Column to normalize (values of any type are read as str())
+        remove_all_spaces: If True, removes all whitespace (codes and vouchers)
+        collapse_spaces: If True, tabs, line breaks (also escaped) and runs of
+            whitespace become one space; if False the values are only stripped
+        unicode_form: Unicode normalization form ('NFC', 'NFKC', ...), None to skip
+        categorical: Return a dictionary encoded (category) column
+        
+    Returns:
+        pd.Series: Normalized column with the same index, None (NaN when categorical) where missing
+    """
+    codes, uniques = pd.factorize(values)
+    text = pd.Series(uniques, dtype=object).astype(str)
+    if unicode_form:
+        text = text.str.normalize(unicode_form)
+    if remove_all_spaces:
+        text = text.str.replace(ESCAPED_BREAK_PATTERN, '', regex=True).str.replace(WHITESPACE_PATTERN, '', regex=True)
+    elif collapse_spaces:
+        text = text.str.replace(ESCAPED_BREAK_PATTERN, ' ', regex=True).str.replace(WHITESPACE_PATTERN, ' ', regex=True)
+    text = text.str.strip()
+    
+    # Distinct inputs may normalize to the same text: encode the results again
+    result_codes, results = pd.factorize(text)
+    codes = np.where(codes >= 0, result_codes[codes], -1)
+    if categorical:
+        return pd.Series(pd.Categorical.from_codes(codes, categories=results), index=values.index)
+    return pd.Series(take_unique(codes, np.asarray(results, dtype=object)), index=values.index, dtype=object)
+
 def standardize_date(date: Union[str, pd.Timestamp], as_string: bool = True) -> Union[str, pd.Timestamp]:
     """
     Standardize date format.
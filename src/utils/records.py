@@ -0,0 +1,159 @@
+"""
+Standardized statements as plain Python records or column batches.
+
+Consumers that do not work with DataFrames (a reconciliation service, an ERP
+connector) read cleaned statements through these iterators instead of
+iterrows(): each column is converted once to a numpy array, batches are slices
+of those arrays and records are built from per-batch lists, never from a
+Series per row.
+"""
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterator, List, Optional
+
+from src.utils.formatter import map_unique
+from src.utils.schema import STANDARD_COLUMNS, STANDARD_DTYPES
+
+DEFAULT_BATCH_ROWS = 10_000
+
+AMOUNT_COLUMNS = [col for col, col_type in STANDARD_DTYPES.items() if col_type == 'float64']
+
+class TransactionRecord:
+    """
+    One row of the bank_statements table.
+
+    transaction_date is a datetime.date, transaction_time HH:MM:SS text and the
+    amounts floats; missing values are None.
+    """
+    __slots__ = tuple(STANDARD_COLUMNS)
+
+    # Positional order is STANDARD_COLUMNS; explicit assignments keep construction cheap
+    def __init__(self, bank_code=None, account_number=None, company_voucher=None,
+                 bank_voucher=None, transaction_date=None, transaction_time=None,
+                 description=None, transaction_type=None, reference_number=None,
+                 transaction_code=None, debit_amount=None, credit_amount=None,
+                 balance=None, itf_amount=None, branch_office=None,
+                 agency_code=None, user_code=None, operation_number=None,
+                 additional_details=None, import_batch_id=None):
+        self.bank_code = bank_code
+        self.account_number = account_number
+        self.company_voucher = company_voucher
+        self.bank_voucher = bank_voucher
+        self.transaction_date = transaction_date
+        self.transaction_time = transaction_time
+        self.description = description
+        self.transaction_type = transaction_type
+        self.reference_number = reference_number
+        self.transaction_code = transaction_code
+        self.debit_amount = debit_amount
+        self.credit_amount = credit_amount
+        self.balance = balance
+        self.itf_amount = itf_amount
+        self.branch_office = branch_office
+        self.agency_code = agency_code
+        self.user_code = user_code
+        self.operation_number = operation_number
+        self.additional_details = additional_details
+        self.import_batch_id = import_batch_id
+
+    def as_tuple(self) -> tuple:
+        """Values in the column order of the table."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def as_dict(self) -> Dict[str, object]:
+        """Values by column name."""
+        return dict(zip(self.__slots__, self.as_tuple()))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TransactionRecord):
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
+
+    def __repr__(self) -> str:
+        return (f"TransactionRecord({self.company_voucher!r}, {self.transaction_date}, "
+                f"debit={self.debit_amount}, credit={self.credit_amount})")
+
+def _column_array(df: pd.DataFrame, col: str) -> np.ndarray:
+    """One standardized column as a numpy array: datetime64[D], float64 or object with None."""
+    if col not in df.columns:
+        if col in AMOUNT_COLUMNS:
+            return np.full(len(df), np.nan)
+        return np.full(len(df), None, dtype=object)
+    values = df[col]
+    if col == 'transaction_date':
+        return pd.to_datetime(values, errors='coerce').to_numpy(dtype='datetime64[D]')
+    if col in AMOUNT_COLUMNS:
+        return pd.to_numeric(values, errors='coerce').to_numpy(dtype='float64')
+    if isinstance(values.dtype, pd.StringDtype):
+        return values.to_numpy(dtype=object, na_value=None)
+    # Other values, like datetime.time written as HH:MM:SS: each distinct value is converted once
+    return map_unique(values, lambda uniques: pd.Index(uniques).astype(str))
+
+def column_arrays(df: pd.DataFrame, columns: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+    """
+    Convert the columns of a standardized statement to numpy arrays once.
+
+    Args:
+        df (pd.DataFrame): Standardized statement (a cleaner output or a processed CSV)
+        columns (list, optional): Columns to convert, all schema columns when None
+
+    Returns:
+        dict: Array per column; dates as datetime64[D] (NaT when missing), amounts
+        as float64 (NaN when missing), text as object arrays (None when missing)
+    """
+    return {col: _column_array(df, col) for col in (columns or STANDARD_COLUMNS)}
+
+def iter_column_batches(df: pd.DataFrame, batch_rows: int = DEFAULT_BATCH_ROWS,
+                        columns: Optional[List[str]] = None) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Stream a standardized statement as batches of column arrays.
+
+    Args:
+        df (pd.DataFrame): Standardized statement
+        batch_rows (int): Rows per batch
+        columns (list, optional): Columns to include, all schema columns when None
+
+    Yields:
+        dict: Array per column for the rows of the batch (views of the converted columns)
+    """
+    arrays = column_arrays(df, columns)
+    for start in range(0, len(df), batch_rows):
+        yield {col: values[start:start + batch_rows] for col, values in arrays.items()}
+
+def _python_values(col: str, values: np.ndarray) -> list:
+    """Batch of one column as Python values, None where missing."""
+    if col in AMOUNT_COLUMNS:
+        result = values.astype(object)
+        result[np.isnan(values)] = None
+        return result.tolist()
+    # datetime64[D].tolist() gives datetime.date, and None for NaT
+    return values.tolist()
+
+def iter_record_batches(df: pd.DataFrame, batch_rows: int = DEFAULT_BATCH_ROWS) -> Iterator[List[TransactionRecord]]:
+    """
+    Stream a standardized statement as lists of records.
+
+    Args:
+        df (pd.DataFrame): Standardized statement
+        batch_rows (int): Records per list
+
+    Yields:
+        list: TransactionRecord per row of the batch, in frame order
+    """
+    for batch in iter_column_batches(df, batch_rows):
+        rows = zip(*(_python_values(col, values) for col, values in batch.items()))
+        yield [TransactionRecord(*row) for row in rows]
+
+def iter_records(df: pd.DataFrame, batch_rows: int = DEFAULT_BATCH_ROWS) -> Iterator[TransactionRecord]:
+    """
+    Stream a standardized statement record by record.
+
+    Args:
+        df (pd.DataFrame): Standardized statement
+        batch_rows (int): Rows converted at a time
+
+    Yields:
+        TransactionRecord: One per row, in frame order
+    """
+    for records in iter_record_batches(df, batch_rows):
+        yield from records
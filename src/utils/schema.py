@@ -0,0 +1,191 @@
+"""
+Column schemas of the processed files and typed CSV readers.
+
+The standardized schema matches the bank_statements table. Reading processed
+CSVs through these schemas skips type inference, keeps identifiers as text and
+parses dates once with an explicit format.
+"""
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    pa = None
+    CSV_ENGINE = 'c'
+
+# Column order of the bank_statements table
+STANDARD_COLUMNS: List[str] = [
+    'bank_code', 'account_number', 'company_voucher', 'bank_voucher',
+    'transaction_date', 'transaction_time', 'description', 'transaction_type',
+    'reference_number', 'transaction_code', 'debit_amount', 'credit_amount',
+    'balance', 'itf_amount', 'branch_office', 'agency_code', 'user_code',
+    'operation_number', 'additional_details', 'import_batch_id'
+]
+
+# transaction_time stays as HH:MM:SS text, the format the database expects
+STANDARD_DTYPES: Dict[str, object] = {
+    'bank_code': str,
+    'account_number': str,
+    'company_voucher': str,
+    'bank_voucher': str,
+    'transaction_time': str,
+    'description': str,
+    'transaction_type': str,
+    'reference_number': str,
+    'transaction_code': str,
+    'debit_amount': 'float64',
+    'credit_amount': 'float64',
+    'balance': 'float64',
+    'itf_amount': 'float64',
+    'branch_office': str,
+    'agency_code': str,
+    'user_code': str,
+    'operation_number': str,
+    'additional_details': str,
+    'import_batch_id': str,
+}
+
+STANDARD_DATE_FORMATS: Dict[str, str] = {
+    'transaction_date': '%Y-%m-%d',
+}
+
+# Amounts are DECIMAL(p,2) columns
+STANDARD_FLOAT_FORMAT = '%.2f'
+
+# Cleaned BCP payment report (ReporteAbonos_clean.csv), with the
+# (payment_date, amount_cents) key statement rows are matched on
+PAYMENT_REPORT_COLUMNS: List[str] = [
+    'CANAL', 'FECHA', 'HORA', 'MONTO ABONADO',
+    'MONTO OP.', 'MONEDA OP.', 'GLOSA', 'TITULAR', 'Adicionales',
+    'payment_date', 'amount_cents'
+]
+
+PAYMENT_REPORT_DTYPES: Dict[str, object] = {
+    'CANAL': str,
+    'HORA': str,
+    'MONTO ABONADO': 'float64',
+    'MONTO OP.': str,
+    'MONEDA OP.': str,
+    'GLOSA': str,
+    'TITULAR': str,
+    'Adicionales': str,
+    'amount_cents': 'Int64',
+}
+
+PAYMENT_REPORT_DATE_FORMATS: Dict[str, str] = {
+    'FECHA': '%d/%m/%Y',
+    'payment_date': '%Y-%m-%d',
+}
+
+# Accounting ledger export: amount is signed, positive for money received
+LEDGER_COLUMNS: List[str] = [
+    'entry_id', 'entry_date', 'account_number', 'reference', 'description', 'amount'
+]
+
+LEDGER_DTYPES: Dict[str, object] = {
+    'entry_id': str,
+    'account_number': str,
+    'reference': str,
+    'description': str,
+    'amount': 'float64',
+}
+
+LEDGER_DATE_FORMATS: Dict[str, str] = {
+    'entry_date': '%Y-%m-%d',
+}
+
+def read_typed_csv(path: Path, dtypes: Dict[str, object], date_formats: Dict[str, str],
+                   columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read a CSV with explicit column types and date formats.
+
+    Args:
+        path (Path): CSV file (compression is inferred from the extension)
+        dtypes (dict): Type per column; unknown columns are inferred
+        date_formats (dict): strptime format per date column
+        columns (list, optional): Subset of columns to read
+
+    Returns:
+        pd.DataFrame: Typed DataFrame, date columns as datetime64
+    """
+    if CSV_ENGINE == 'pyarrow':
+        # pyarrow also decompresses zstd, which pandas needs the zstandard package for
+        header = pa_csv.open_csv(path).schema.names
+        usecols = [col for col in header if columns is None or col in columns]
+        return _read_typed_csv_pyarrow(path, dtypes, date_formats, usecols)
+
+    header = pd.read_csv(path, nrows=0).columns
+    usecols = [col for col in header if columns is None or col in columns]
+
+    # Dates are read as text and parsed once with their known format
+    dtype = {col: dtypes.get(col, str if col in date_formats else None) for col in usecols}
+    dtype = {col: col_type for col, col_type in dtype.items() if col_type is not None}
+
+    df = pd.read_csv(path, usecols=usecols, dtype=dtype)
+    for col, date_format in date_formats.items():
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], format=date_format, errors='coerce')
+    return df
+
+def _read_typed_csv_pyarrow(path: Path, dtypes: Dict[str, object], date_formats: Dict[str, str],
+                            usecols: List[str]) -> pd.DataFrame:
+    """Typed CSV read with the multi-threaded pyarrow parser, converting to pandas once."""
+    arrow_types = {'float64': pa.float64(), 'Int64': pa.int64(), str: pa.string()}
+    column_types = {col: arrow_types[dtypes[col]] for col in usecols if col in dtypes}
+    # Each date column is parsed with its own format after the read
+    column_types.update({col: pa.string() for col in usecols if col in date_formats})
+
+    table = pa_csv.read_csv(path, convert_options=pa_csv.ConvertOptions(
+        column_types=column_types,
+        include_columns=usecols,
+        strings_can_be_null=True
+    ))
+    df = table.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+    for col, date_format in date_formats.items():
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], format=date_format, errors='coerce')
+    return df
+
+def read_standardized_csv(path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read a processed statement CSV (*_clean.csv, bcp_final.csv) with the standardized schema.
+
+    Args:
+        path (Path): Processed statement CSV
+        columns (list, optional): Subset of columns to read
+
+    Returns:
+        pd.DataFrame: Statement with transaction_date as datetime64 and text identifiers
+    """
+    return read_typed_csv(path, STANDARD_DTYPES, STANDARD_DATE_FORMATS, columns)
+
+def read_payment_report_csv(path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read a cleaned BCP payment report CSV with its schema.
+
+    Args:
+        path (Path): Cleaned payment report CSV
+        columns (list, optional): Subset of columns to read
+
+    Returns:
+        pd.DataFrame: Payment report with FECHA as datetime64
+    """
+    return read_typed_csv(path, PAYMENT_REPORT_DTYPES, PAYMENT_REPORT_DATE_FORMATS, columns)
+
+def read_ledger_csv(path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read an accounting ledger export CSV with its schema.
+
+    Args:
+        path (Path): Ledger CSV (entry_date, amount and optionally entry_id,
+            account_number, reference, description)
+        columns (list, optional): Subset of columns to read
+
+    Returns:
+        pd.DataFrame: Ledger entries with entry_date as datetime64
+    """
+    return read_typed_csv(path, LEDGER_DTYPES, LEDGER_DATE_FORMATS, columns)
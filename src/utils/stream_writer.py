@@ -0,0 +1,131 @@
+"""
+Incremental, optionally compressed CSV output for processed files.
+"""
+import gzip
+import io
+import os
+import pandas as pd
+from pathlib import Path
+from typing import Optional
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from src.utils.file_manager import COMPRESSION_SUFFIXES, compressed_path, output_compression, temporary_path
+
+# Rows formatted at once: bounds the text buffer of to_csv
+DEFAULT_CHUNK_ROWS = 50_000
+
+class CsvStreamWriter:
+    """
+    Append DataFrame chunks to a CSV as they are produced.
+
+    Chunks go to a temporary file next to the target, which replaces the target
+    only when the writer is closed without error, so readers never see a
+    partial output. Large frames are formatted chunk_rows rows at a time, and
+    the output can be gzip or zstd compressed (zstd needs pyarrow). Use as a
+    context manager.
+    """
+
+    def __init__(self, path: Path, compression: Optional[str] = None, float_format: Optional[str] = None,
+                 date_format: Optional[str] = None, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        self.path = compressed_path(path, compression)
+        self.compression = compression
+        self.float_format = float_format
+        self.date_format = date_format
+        self.chunk_rows = chunk_rows
+        self.rows = 0
+        self._tmp_path = temporary_path(self.path)
+        self._file = None
+        self._header_written = False
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.compression == 'gzip':
+            self._file = gzip.open(self._tmp_path, 'wt', encoding='utf-8', newline='', compresslevel=6)
+        elif self.compression == 'zstd':
+            if pa is None:
+                raise ImportError("pyarrow is required for zstd compressed output")
+            stream = pa.CompressedOutputStream(str(self._tmp_path), 'zstd')
+            self._file = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+        else:
+            self._file = open(self._tmp_path, 'w', encoding='utf-8', newline='')
+
+    def _write_rows(self, df: pd.DataFrame, header: bool) -> None:
+        df.to_csv(self._file, index=False, header=header, float_format=self.float_format,
+                  date_format=self.date_format)
+
+    def write_header(self, df: pd.DataFrame) -> None:
+        """Write the column names of df now, so the output lists them even without rows."""
+        if self._header_written:
+            return
+        if self._file is None:
+            self._open()
+        self._write_rows(df.iloc[0:0], header=True)
+        self._header_written = True
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Append a chunk (the header is written with the first non-empty chunk, unless written before)."""
+        if df.empty:
+            return
+        if self._file is None:
+            self._open()
+        for start in range(0, len(df), self.chunk_rows):
+            self._write_rows(df.iloc[start:start + self.chunk_rows], header=not self._header_written)
+            self._header_written = True
+        self.rows += len(df)
+
+    def close(self) -> Optional[Path]:
+        """
+        Publish the output.
+
+        Returns:
+            Path | None: Output path, None if nothing was written
+        """
+        if self._file is None:
+            return None
+        self._file.close()
+        self._file = None
+        os.replace(self._tmp_path, self.path)
+        return self.path
+
+    def abort(self) -> None:
+        """Discard the partial output."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> 'CsvStreamWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+def write_csv(df: pd.DataFrame, path: Path, compression: Optional[str] = None, float_format: Optional[str] = None,
+              date_format: Optional[str] = None, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Path:
+    """
+    Write a whole frame atomically, in chunks, like df.to_csv(path, index=False).
+
+    Args:
+        df (pd.DataFrame): Frame to write (an empty frame writes its header)
+        path (Path): Output CSV path
+        compression (str, optional): 'gzip' or 'zstd', defaults to the output compression
+            (see set_output_compression)
+        float_format (str, optional): Format of float columns, e.g. '%.2f'
+        date_format (str, optional): Format of datetime columns, e.g. '%Y-%m-%d'
+        chunk_rows (int): Rows formatted at once
+
+    Returns:
+        Path: Written path (with the compression suffix)
+    """
+    writer = CsvStreamWriter(path, compression or output_compression(), float_format, date_format, chunk_rows)
+    with writer:
+        writer.write_header(df)
+        writer.write(df)
+    return writer.path
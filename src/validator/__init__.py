@@ -0,0 +1,3 @@
+"""
+__init__.py para hacer que la carpeta validator sea un paquete Python.
+"""
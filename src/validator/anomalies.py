@@ -0,0 +1,208 @@
+"""
+Detection of suspected duplicate movements and amount outliers.
+
+Checking company_voucher only catches a movement imported twice with the same
+bank voucher. A bank export repeating a movement with another operation
+number, or the same movement downloaded twice, shows up as rows of the same
+account, signed amount and description a few minutes apart. Rows are sorted by
+(account, amount, description, timestamp) once and each row is compared with
+the previous one, so a year of every account is checked in a single pass.
+
+Outliers are movements whose amount is far from the recent history of their
+account: the log amount is compared with the mean and standard deviation of
+the previous movements of the account within a rolling time window.
+
+Rows are flagged, never removed.
+
+Usage: python -m src.validator.anomalies <statement_clean.csv> [<statement_clean.csv> ...]
+"""
+import sys
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Tuple
+
+from src.utils.file_manager import DATA_PROCESSED
+from src.utils.formatter import map_unique, normalize_text
+from src.utils.schema import read_standardized_csv
+from src.utils.stream_writer import write_csv
+
+DEFAULT_DUPLICATE_WINDOW_MINUTES = 10
+DEFAULT_OUTLIER_WINDOW = '90D'
+DEFAULT_OUTLIER_ZSCORE = 4.0
+
+# Previous movements an account needs in the window before outliers are flagged
+OUTLIER_MIN_PERIODS = 30
+
+def _timestamps(df: pd.DataFrame) -> pd.Series:
+    """transaction_date plus transaction_time (midnight when the time is missing)."""
+    # Dates and times repeat a lot: parse each distinct value once
+    dates = map_unique(df['transaction_date'], lambda uniques: pd.to_datetime(uniques.astype(object), errors='coerce'),
+                       dtype='datetime64[ns]')
+    if 'transaction_time' not in df.columns:
+        return pd.Series(dates, index=df.index)
+    times = map_unique(
+        df['transaction_time'],
+        lambda uniques: pd.to_timedelta(uniques.astype(object).astype(str), errors='coerce').fillna(pd.Timedelta(0)),
+        np.timedelta64(0, 'ns'), dtype='timedelta64[ns]'
+    )
+    return pd.Series(dates + times, index=df.index)
+
+def _signed_cents(df: pd.DataFrame) -> np.ndarray:
+    """Credit minus debit, in cents."""
+    credit = pd.to_numeric(df['credit_amount'], errors='coerce').fillna(0)
+    debit = pd.to_numeric(df['debit_amount'], errors='coerce').fillna(0)
+    return ((credit - debit) * 100).round().to_numpy(dtype=np.int64)
+
+def _account_codes(df: pd.DataFrame) -> np.ndarray:
+    accounts = df['bank_code'].astype(str) + '|' + df['account_number'].astype(str)
+    return pd.factorize(accounts)[0]
+
+def find_duplicates(df: pd.DataFrame,
+                    window_minutes: int = DEFAULT_DUPLICATE_WINDOW_MINUTES) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Group movements of the same account, signed amount and description within a time window.
+
+    A row joins the group of the previous row with the same account, amount and
+    description when it is at most window_minutes after it.
+
+    Args:
+        df (pd.DataFrame): Standardized statements (one or several accounts)
+        window_minutes (int): Largest gap between two movements of a group
+
+    Returns:
+        tuple: (group, first)
+            - Duplicate group per row, -1 for rows without a suspected duplicate
+            - Position of the first row of the group, -1 for the first row itself
+              and for rows without a suspected duplicate
+    """
+    n = len(df)
+    timestamps = _timestamps(df)
+    valid = timestamps.notna().to_numpy()
+    ts = timestamps.to_numpy(dtype='datetime64[ns]').astype(np.int64)
+    accounts = _account_codes(df)
+    cents = _signed_cents(df)
+    descriptions = pd.factorize(normalize_text(df['description']).str.upper())[0]
+
+    order = np.lexsort((ts, descriptions, cents, accounts, ~valid))
+    ts, accounts, cents, descriptions, valid = (values[order] for values in (ts, accounts, cents, descriptions, valid))
+
+    # A row continues the group of the previous row on the same key within the window
+    link = np.zeros(n, dtype=bool)
+    link[1:] = ((accounts[1:] == accounts[:-1]) & (cents[1:] == cents[:-1])
+                & (descriptions[1:] == descriptions[:-1]) & valid[1:] & valid[:-1]
+                & (ts[1:] - ts[:-1] <= window_minutes * 60 * 1_000_000_000))
+    group_sorted = np.cumsum(~link) - 1
+    flagged = np.bincount(group_sorted)[group_sorted] > 1
+
+    # Renumber the flagged groups 0..k-1
+    starts = np.flatnonzero(~link)
+    group_ids = np.full(len(starts), -1)
+    flagged_starts = flagged[starts]
+    group_ids[flagged_starts] = np.arange(flagged_starts.sum())
+
+    group = np.full(n, -1)
+    first = np.full(n, -1)
+    group[order] = group_ids[group_sorted]
+    first[order[link]] = order[starts[group_sorted[link]]]
+    return group, first
+
+def amount_zscores(df: pd.DataFrame, window: str = DEFAULT_OUTLIER_WINDOW,
+                   min_periods: int = OUTLIER_MIN_PERIODS) -> np.ndarray:
+    """
+    Z-score of each log amount against the previous movements of its account in a rolling window.
+
+    Args:
+        df (pd.DataFrame): Standardized statements (one or several accounts)
+        window (str): Time window of the history (pandas offset, e.g. '90D')
+        min_periods (int): Previous movements needed for a score
+
+    Returns:
+        np.ndarray: Z-score per row, NaN without enough history
+    """
+    timestamps = _timestamps(df)
+    cents = _signed_cents(df)
+    df_amounts = pd.DataFrame({
+        'account': _account_codes(df),
+        'timestamp': timestamps.to_numpy(),
+        'log_amount': np.log1p(np.abs(cents) / 100),
+        'position': np.arange(len(df)),
+    })
+    df_amounts = df_amounts[timestamps.notna().to_numpy() & (cents != 0)]
+    df_amounts = df_amounts.sort_values(['account', 'timestamp'], kind='stable')
+
+    # History only: the window closes before the row itself
+    rolling = df_amounts.groupby('account', sort=False).rolling(window, on='timestamp', closed='left',
+                                                                min_periods=min_periods)['log_amount']
+    mean = rolling.mean().to_numpy()
+    std = rolling.std().to_numpy()
+
+    zscores = np.full(len(df), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        zscores[df_amounts['position'].to_numpy()] = np.where(std > 0, (df_amounts['log_amount'].to_numpy() - mean) / std, np.nan)
+    return zscores
+
+def detect_anomalies(df: pd.DataFrame, window_minutes: int = DEFAULT_DUPLICATE_WINDOW_MINUTES,
+                     outlier_window: str = DEFAULT_OUTLIER_WINDOW,
+                     outlier_zscore: float = DEFAULT_OUTLIER_ZSCORE) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Flag suspected duplicates and amount outliers of standardized statements.
+
+    Args:
+        df (pd.DataFrame): Standardized statements (one or several accounts)
+        window_minutes (int): Largest gap between two suspected duplicates
+        outlier_window (str): History window of the outlier scores
+        outlier_zscore (float): Smallest absolute z-score flagged as outlier
+
+    Returns:
+        tuple: (flagged_df, statistics)
+            - Copy of df with duplicate_group (NA when none), duplicate_of
+              (company_voucher of the first row of the group), amount_zscore and is_outlier
+            - Flag counts
+    """
+    group, first = find_duplicates(df, window_minutes)
+    zscores = amount_zscores(df, outlier_window)
+
+    df_flagged = df.copy()
+    df_flagged['duplicate_group'] = pd.array(np.where(group >= 0, group + 1, 0), dtype='Int64')
+    df_flagged.loc[group < 0, 'duplicate_group'] = pd.NA
+    vouchers = df['company_voucher'].to_numpy(dtype=object)
+    df_flagged['duplicate_of'] = np.where(first >= 0, vouchers[np.maximum(first, 0)], None)
+    df_flagged['amount_zscore'] = np.round(zscores, 2)
+    df_flagged['is_outlier'] = np.abs(np.nan_to_num(zscores)) >= outlier_zscore
+
+    stats = {
+        'total_rows': len(df),
+        'duplicate_groups': int(group.max() + 1) if len(df) else 0,
+        'suspected_duplicates': int((first >= 0).sum()),
+        'outliers': int(df_flagged['is_outlier'].sum()),
+    }
+    return df_flagged, stats
+
+def process_anomaly_workflow(statement_files: List[str]) -> pd.DataFrame:
+    """
+    Flag duplicates and outliers across processed statements and save the flagged rows.
+
+    Args:
+        statement_files (list): Processed statement CSVs in the processed data folder
+
+    Returns:
+        pd.DataFrame: Combined statements with the anomaly columns
+    """
+    print("\nDetecting duplicates and outliers...")
+    df = pd.concat(
+        [read_standardized_csv(DATA_PROCESSED / name) for name in statement_files], ignore_index=True
+    )
+    df_flagged, stats = detect_anomalies(df)
+
+    output_file = write_csv(df_flagged[df_flagged['duplicate_group'].notna() | df_flagged['is_outlier']],
+                            DATA_PROCESSED / "anomalies.csv")
+    print(f"\nSuspected duplicates and outliers saved to: {output_file}")
+    for key, value in stats.items():
+        print(f"  {key}: {value}")
+    return df_flagged
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m src.validator.anomalies <statement_clean.csv> [...]")
+    else:
+        process_anomaly_workflow(sys.argv[1:])
@@ -0,0 +1,180 @@
+"""
+Validation of standardized statements against the bank_statements table constraints.
+
+All constraints are checked with vectorized masks in one pass, so rows the
+database would reject are split off with their reasons before the load.
+"""
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from src.utils.stream_writer import write_csv
+
+VALID_BANK_CODES = ['BNB1', 'BNB2', 'BNBUSD', 'BCP', 'UNION']
+
+# NOT NULL columns of the table
+REQUIRED_COLUMNS = ['bank_code', 'account_number', 'company_voucher', 'transaction_date', 'description', 'balance']
+
+# VARCHAR(n) columns
+MAX_LENGTHS: Dict[str, int] = {
+    'bank_code': 10,
+    'account_number': 50,
+    'company_voucher': 100,
+    'bank_voucher': 100,
+    'transaction_type': 20,
+    'reference_number': 100,
+    'transaction_code': 50,
+    'branch_office': 100,
+    'agency_code': 20,
+    'user_code': 50,
+    'operation_number': 50,
+    'import_batch_id': 36,
+}
+
+# DECIMAL(p,2) columns: largest absolute value that fits
+MAX_AMOUNTS: Dict[str, float] = {
+    'debit_amount': 1e13,
+    'credit_amount': 1e13,
+    'balance': 1e13,
+    'itf_amount': 1e6,
+}
+
+REJECTION_COLUMN = 'rejection_reasons'
+
+def _column(df: pd.DataFrame, col: str) -> pd.Series:
+    return df[col] if col in df.columns else pd.Series(np.nan, index=df.index, dtype=object)
+
+def _amount(df: pd.DataFrame, col: str) -> pd.Series:
+    values = _column(df, col)
+    return values if pd.api.types.is_float_dtype(values) else pd.to_numeric(values, errors='coerce')
+
+def constraint_violations(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Evaluate every table constraint on every row.
+
+    Args:
+        df (pd.DataFrame): Standardized statement
+
+    Returns:
+        pd.DataFrame: One boolean column per constraint, True where the row violates it
+    """
+    violations = {}
+
+    # chk_amounts: at least one amount present and non-negative
+    debit = _amount(df, 'debit_amount')
+    credit = _amount(df, 'credit_amount')
+    violations['chk_amounts'] = ~((debit >= 0) | (credit >= 0))
+
+    violations['chk_bank_code'] = ~_column(df, 'bank_code').isin(VALID_BANK_CODES)
+
+    # NOT NULL accepts empty text
+    for col in REQUIRED_COLUMNS:
+        violations[f'not_null_{col}'] = _column(df, col).isna()
+
+    for col, max_length in MAX_LENGTHS.items():
+        if col in df.columns:
+            values = df[col] if pd.api.types.is_string_dtype(df[col]) and df[col].dtype != object else df[col].astype('str')
+            violations[f'length_{col}'] = values.str.len().gt(max_length)
+
+    for col, max_amount in MAX_AMOUNTS.items():
+        if col in df.columns:
+            violations[f'range_{col}'] = _amount(df, col).abs().ge(max_amount)
+
+    names = list(violations)
+    matrix = np.column_stack([np.asarray(mask, dtype=bool) for mask in violations.values()])
+
+    # UNIQUE company_voucher, among rows the database would otherwise accept:
+    # the first occurrence is loaded, later ones are rejected
+    accepted = ~matrix.any(axis=1)
+    vouchers = _column(df, 'company_voucher')
+    duplicate = accepted & vouchers.where(accepted).duplicated(keep='first').to_numpy()
+
+    return pd.DataFrame(
+        np.column_stack([matrix, duplicate]),
+        index=df.index,
+        columns=names + ['unique_company_voucher']
+    )
+
+def validate_statements(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Split a standardized statement into rows that satisfy the table constraints and rejected rows.
+
+    Args:
+        df (pd.DataFrame): Standardized statement
+
+    Returns:
+        tuple: (valid_df, rejected_df)
+            - Rows that satisfy every constraint
+            - Violating rows with a rejection_reasons column ('chk_amounts;chk_bank_code')
+    """
+    violations = constraint_violations(df)
+    rejected = violations.to_numpy().any(axis=1)
+
+    df_valid = df[~rejected]
+    df_rejected = df[rejected].copy()
+    if rejected.any():
+        # Only the rejected rows need their reasons spelled out
+        reason_names = pd.Index(violations.columns) + ';'
+        df_rejected[REJECTION_COLUMN] = violations[rejected].dot(reason_names).str.rstrip(';')
+    else:
+        df_rejected[REJECTION_COLUMN] = pd.Series(dtype=object)
+    return df_valid, df_rejected
+
+class StreamValidator:
+    """
+    Validate a statement chunk by chunk, keeping company_voucher unique across chunks.
+
+    Vouchers already accepted are remembered as sorted 64-bit hashes (8 bytes
+    per row), so memory stays small next to the chunks themselves. The hashes
+    of each chunk are sorted on their own and merged in, the seen ones are
+    never sorted again.
+    """
+
+    def __init__(self):
+        self._seen = np.empty(0, dtype=np.uint64)
+
+    def validate(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Validate one chunk.
+
+        Args:
+            df (pd.DataFrame): Standardized statement chunk
+
+        Returns:
+            tuple: (valid_df, rejected_df) as returned by validate_statements, with
+            vouchers accepted in an earlier chunk rejected as unique_company_voucher
+        """
+        df_valid, df_rejected = validate_statements(df)
+        hashes = pd.util.hash_array(df_valid['company_voucher'].to_numpy(dtype=object))
+        positions = np.minimum(np.searchsorted(self._seen, hashes), max(len(self._seen) - 1, 0))
+        seen = self._seen[positions] == hashes if len(self._seen) else np.zeros(len(hashes), dtype=bool)
+
+        if seen.any():
+            df_rejected = pd.concat(
+                [df_rejected, df_valid[seen].assign(**{REJECTION_COLUMN: 'unique_company_voucher'})]
+            )
+            df_valid = df_valid[~seen]
+        new = np.sort(hashes[~seen])
+        self._seen = np.insert(self._seen, np.searchsorted(self._seen, new), new)
+        return df_valid, df_rejected
+
+def validate_batch(df: pd.DataFrame, rejected_file: Optional[Path] = None) -> pd.DataFrame:
+    """
+    Validate a cleaned batch, report and save the rejected rows.
+
+    Args:
+        df (pd.DataFrame): Standardized statement
+        rejected_file (Path, optional): CSV where rejected rows are saved
+
+    Returns:
+        pd.DataFrame: Rows that satisfy every constraint
+    """
+    df_valid, df_rejected = validate_statements(df)
+    print(f"\nValidation: {len(df_valid)} valid rows, {len(df_rejected)} rejected")
+    if not df_rejected.empty:
+        print(df_rejected[REJECTION_COLUMN].str.split(';').explode().value_counts().to_string())
+        if rejected_file:
+            rejected_file = write_csv(df_rejected, rejected_file)
+            print(f"Rejected rows saved to: {rejected_file}")
+    return df_valid
@@ -0,0 +1,135 @@
+"""
+Out-of-core backfill workflow: read, clean, validate, enrich and write statements chunk by chunk.
+
+Each sheet is streamed in chunks sized from a memory budget. Every chunk is
+cleaned with the usual cleaner (header row on top, one shared import_batch_id),
+validated, enriched from the month-partitioned payment store when it is a BCP
+chunk, and appended to the output files before the next chunk is read. Only
+the chunk in flight, the accepted voucher hashes and the daily aggregates are
+held in memory.
+"""
+import uuid
+import pandas as pd
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from src.detector.bank_detector import detect_file_layout
+from src.enricher.bcp_enricher import BCPEnricher
+from src.processors.bcp_cleaner import clean_bcp
+from src.processors.bnb_cleaner import clean_bnb
+from src.processors.union_cleaner import clean_union
+from src.reader.excel_reader import iter_excel_chunks, list_sheets, peek_excel
+from src.store.account_aggregates import AccountAggregates, combine_daily, daily_aggregates
+from src.store.payment_store import PaymentStore
+from src.store.search_index import SearchIndex
+from src.store.statement_store import StatementStore
+from src.utils.file_manager import DATA_PROCESSED
+from src.utils.schema import STANDARD_DATE_FORMATS, STANDARD_FLOAT_FORMAT
+from src.utils.stream_writer import CsvStreamWriter
+from src.validator.constraints import StreamValidator
+
+DEFAULT_MEMORY_BUDGET_MB = 1024
+
+# Copies of a chunk alive at once: raw rows, intermediate columns, cleaned,
+# validated and enriched frames, plus the CSV formatting buffer
+WORKING_SET_FACTOR = 12
+
+MIN_CHUNK_ROWS = 1_000
+MAX_CHUNK_ROWS = 2_000_000
+
+def chunk_rows_for_budget(df_sample: pd.DataFrame, memory_budget_mb: int = DEFAULT_MEMORY_BUDGET_MB) -> int:
+    """
+    Rows per chunk that keep the pipeline within a memory budget.
+
+    Args:
+        df_sample (pd.DataFrame): First rows of the raw sheet
+        memory_budget_mb (int): Memory available to the pipeline, in MB
+
+    Returns:
+        int: Body rows per chunk
+    """
+    bytes_per_row = max(df_sample.memory_usage(deep=True).sum() / max(len(df_sample), 1), 1)
+    rows = int(memory_budget_mb * 1024 * 1024 / (bytes_per_row * WORKING_SET_FACTOR))
+    return min(max(rows, MIN_CHUNK_ROWS), MAX_CHUNK_ROWS)
+
+def _chunk_cleaner(layout: Dict) -> Optional[Callable[..., pd.DataFrame]]:
+    """Cleaner of a statement chunk (header row at position 0), None for unsupported sheets."""
+    bank, account = layout['bank'], layout['account']
+    if layout['kind'] != 'statement':
+        return None
+    if bank == 'BCP':
+        return clean_bcp
+    if bank in ['BNB', 'BNB1', 'BNB2', 'BNBUSD']:
+        bank_code = bank if bank in ['BNB1', 'BNB2', 'BNBUSD'] else 'BNB1'
+        return partial(clean_bnb, bank_code=bank_code, account_number=account, header_row=0)
+    if bank == 'UNION':
+        return partial(clean_union, account_number=account)
+    return None
+
+def process_backfill_workflow(file_paths: List[Path], output_name: str = "backfill",
+                              memory_budget_mb: int = DEFAULT_MEMORY_BUDGET_MB,
+                              compression: Optional[str] = None) -> Dict:
+    """
+    Backfill many statement files with bounded memory.
+
+    Args:
+        file_paths (list): Excel statements (every sheet is processed)
+        output_name (str): Prefix of the output files in the processed data folder
+        memory_budget_mb (int): Memory available to the pipeline, in MB
+        compression (str, optional): Output compression, 'gzip' or 'zstd'
+
+    Returns:
+        dict: Row counts (clean, rejected, enriched chunks) and output paths
+    """
+    import_batch_id = str(uuid.uuid4())
+    print(f"\nBackfill of {len(file_paths)} files (import batch {import_batch_id}, budget {memory_budget_mb} MB)")
+
+    validator = StreamValidator()
+    store = PaymentStore(cached_months=3)
+    enricher = BCPEnricher()
+    statement_store = StatementStore()
+    daily_frames = []
+    stats = {'chunks': 0, 'clean_rows': 0, 'rejected_rows': 0}
+
+    formats = {'float_format': STANDARD_FLOAT_FORMAT, 'date_format': STANDARD_DATE_FORMATS['transaction_date']}
+    final_writer = CsvStreamWriter(DATA_PROCESSED / f"{output_name}_final.csv", compression, **formats)
+    rejected_writer = CsvStreamWriter(DATA_PROCESSED / f"{output_name}_rejected.csv", compression, **formats)
+    with final_writer, rejected_writer, SearchIndex() as search_index:
+        for file_path in file_paths:
+            for sheet_name in list_sheets(file_path):
+                df_peek = peek_excel(file_path, sheet_name=sheet_name)
+                layout = detect_file_layout(df_peek)
+                cleaner = _chunk_cleaner(layout)
+                if cleaner is None or layout['header_row'] is None:
+                    print(f"{file_path.name} / {sheet_name}: not a known statement, skipped")
+                    continue
+
+                chunk_rows = chunk_rows_for_budget(df_peek, memory_budget_mb)
+                print(f"{file_path.name} / {sheet_name}: {layout['bank']} {layout['account']}, chunks of {chunk_rows} rows")
+                options = layout['read_options']
+                for df_raw in iter_excel_chunks(file_path, chunk_rows, sheet_name, options['skiprows'],
+                                                options.get('usecols')):
+                    df_clean = cleaner(df_raw, import_batch_id=import_batch_id)
+                    df_valid, df_rejected = validator.validate(df_clean)
+                    if layout['bank'] == 'BCP' and store.months():
+                        df_valid, _ = enricher.enrich_from_store(df_valid, store)
+
+                    final_writer.write(df_valid)
+                    rejected_writer.write(df_rejected)
+                    daily_frames.append(daily_aggregates(df_valid))
+                    search_index.add_batch(df_valid)
+                    statement_store.append(df_valid)
+                    stats['chunks'] += 1
+                    stats['clean_rows'] += len(df_valid)
+                    stats['rejected_rows'] += len(df_rejected)
+
+    if daily_frames:
+        stats['account_days'] = AccountAggregates().update_daily(combine_daily(daily_frames))
+    stats['final_file'] = final_writer.path if final_writer.rows else None
+    stats['rejected_file'] = rejected_writer.path if rejected_writer.rows else None
+
+    print("\nBackfill statistics:")
+    for key, value in stats.items():
+        print(f"  {key}: {value}")
+    return stats
@@ -4,15 +4,124 @@ BCP specific workflows for processing bank statements and payment reports.
 import pandas as pd
 from pathlib import Path
 from typing import Dict, Optional, Tuple
-from src.processors.bcp_cleaner import clean_bcp
+from src.processors.parallel import clean_bcp_parallel
 from src.processors.bcp_payment_cleaner import clean_bcp_payments
-from src.enricher.bcp_enricher import BCPEnricher
-from src.utils.file_manager import find_bcp_clean_statement, find_payment_report
+from src.detector.layout_cache import get_layout_cache
+from src.enricher.currency import convert_payment_amounts, load_exchange_rates
+from src.enricher.incremental import enrich_incrementally
+from src.store.account_aggregates import AccountAggregates
+from src.store.counterparty_index import CounterpartyIndex
+from src.store.search_index import SearchIndex
+from src.store.statement_store import StatementStore
+from src.store.payment_store import PaymentStore
+from src.validator.constraints import validate_batch
+from src.utils.build_state import get_build_state
+from src.utils.file_manager import (BCP_FINAL_FILE, bcp_final_inputs, find_bcp_clean_statement, find_payment_report,
+                                    output_path)
+from src.utils.schema import (PAYMENT_REPORT_DATE_FORMATS, STANDARD_DATE_FORMATS, STANDARD_FLOAT_FORMAT,
+                              read_payment_report_csv, read_standardized_csv)
+from src.utils.stream_writer import write_csv
 
 # Project paths
 BASE_DIR = Path(__file__).parent.parent.parent
 DATA_PROCESSED = BASE_DIR / "data" / "processed"
 
+def get_payment_store() -> PaymentStore:
+    """
+    Open the payment store, seeding it from the latest cleaned payment report
+    the first time it is used.
+    
+    Returns:
+        PaymentStore: Store of all processed payment reports
+    """
+    store = PaymentStore()
+    if not store.months():
+        payment_file = find_payment_report()
+        if payment_file:
+            print(f"\nSeeding payment store from: {payment_file}")
+            store.append(read_payment_report_csv(payment_file))
+    return store
+
+def store_statement(df: pd.DataFrame) -> None:
+    """
+    Write BCP statement rows to the statement store, the counterparty index and the search index.
+    
+    Args:
+        df (pd.DataFrame): Cleaned or enriched statement rows
+    """
+    partitions = StatementStore().append(df)
+    print(f"Statement store updated: {partitions} partitions")
+    rows = CounterpartyIndex().update(df)
+    print(f"Counterparty index updated: {rows} rows")
+    with SearchIndex() as search_index:
+        rows = search_index.add_batch(df)
+    print(f"Search index updated: {rows} rows")
+
+def build_bcp_final(statement_file: Path, store: Optional[PaymentStore] = None, force: bool = False,
+                    dates=None) -> Optional[pd.DataFrame]:
+    """
+    Update bcp_final.csv from a cleaned BCP statement and the payment store,
+    unless it is already up to date with both.
+    
+    Only the statement dates that changed are enriched again: dates whose
+    statement rows differ from the previous bcp_final, plus the dates of new
+    payments (the given dates, or else every date in the months whose store
+    partition changed). The other rows keep their previous enrichment. The rows
+    that carry payment details are written again to the statement store and the
+    indexes, which already hold the cleaned statement.
+    
+    Args:
+        statement_file (Path): Cleaned BCP statement CSV
+        store (PaymentStore, optional): Payment store (opened and seeded when None)
+        force (bool): Enrich the whole statement even when the inputs did not change
+        dates (iterable, optional): Payment dates that were just added to the store
+        
+    Returns:
+        pd.DataFrame | None: The enriched statement, None if it was up to date or could not be built
+    """
+    store = store or get_payment_store()
+    if not store.months():
+        print("\nNo payment report found for enrichment.")
+        print("You can process a payment report later by running:")
+        print(f"python -m src.main ReporteAbonos.xls")
+        return None
+    
+    state = get_build_state()
+    inputs = bcp_final_inputs(statement_file)
+    final_file = output_path(BCP_FINAL_FILE)
+    if not force and state.is_current(final_file, inputs):
+        print(f"\nEnriched BCP statement is up to date: {final_file}")
+        return None
+    
+    print(f"\nUsing payment store: {store.root} ({len(store.months())} months)")
+    print(f"Using BCP statement: {statement_file}")
+    df_bcp = read_standardized_csv(statement_file)
+    df_previous = None
+    changed = state.changed_inputs(final_file, inputs)
+    if not force and final_file.exists():
+        df_previous = read_standardized_csv(final_file)
+        if dates is None:
+            # Months of the store partitions that changed since the last build
+            months = {path.stem.replace('payments_', '') for path in changed if path != inputs[0]}
+            statement_dates = df_bcp['transaction_date'].dropna()
+            dates = statement_dates[statement_dates.dt.strftime('%Y-%m').isin(months)].unique()
+    
+    df_enriched, stats = enrich_incrementally(df_bcp, df_previous, store, dates,
+                                              statement_changed=inputs[0] in changed)
+    if stats.get('error'):
+        return None
+    print(f"Enriched {stats['enriched_rows']} rows on {stats['enriched_dates']} dates, kept {stats['kept_rows']} rows")
+    write_csv(df_enriched, final_file, float_format=STANDARD_FLOAT_FORMAT,
+              date_format=STANDARD_DATE_FORMATS['transaction_date'])
+    state.record(final_file, inputs)
+    print(f"\nEnriched BCP statement saved to: {final_file}")
+    
+    # Payer names and channels come with the payment details
+    details, clean_details = df_enriched['additional_details'], df_bcp['additional_details']
+    enriched = details.ne(clean_details) & ~(details.isna() & clean_details.isna())
+    store_statement(df_enriched[enriched])
+    return df_enriched
+
 def process_bcp_statement_workflow(file_path: Path, df: pd.DataFrame) -> pd.DataFrame:
     """
     Handles the complete workflow for processing BCP bank statements.
@@ -26,27 +135,22 @@ def process_bcp_statement_workflow(file_path: Path, df: pd.DataFrame) -> pd.Data
     """
     print("\nProcessing BCP bank statement...")
       # Clean and save statement
-    df_clean = clean_bcp(df)
-    clean_csv = DATA_PROCESSED / f"{file_path.stem}_clean.csv"
-    df_clean.to_csv(clean_csv, index=False)
+    # Large statements are cleaned in row partitions on a process pool
+    df_clean = clean_bcp_parallel(df, layout_cache=get_layout_cache())
+    df_clean = validate_batch(df_clean, DATA_PROCESSED / f"{file_path.stem}_rejected.csv")
+    days = AccountAggregates().update(df_clean)
+    print(f"Account aggregates updated: {days} account days")
+    clean_csv = write_csv(df_clean, DATA_PROCESSED / f"{file_path.stem}_clean.csv", float_format=STANDARD_FLOAT_FORMAT,
+                          date_format=STANDARD_DATE_FORMATS['transaction_date'])
     print(f"\nBCP statement saved to: {clean_csv}")
     
-    # Look for payment report
-    payment_file = find_payment_report()
-    if payment_file:
-        print(f"\nFound payment report: {payment_file}")
-        df_payments = pd.read_csv(payment_file)
-          # Enrich with payment info
-        enricher = BCPEnricher()
-        df_enriched, stats = enricher.enrich_statement(df_clean, df_payments)
-        if not stats.get('error'):
-            enriched_csv = DATA_PROCESSED / "bcp_final.csv"
-            df_enriched.to_csv(enriched_csv, index=False)
-            print(f"\nEnriched BCP statement saved to: {enriched_csv}")
-    else:
-        print("\nNo payment report found for enrichment.")
-        print("You can process a payment report later by running:")
-        print(f"python -m src.main ReporteAbonos.xls")
+    # Stored and indexed as cleaned, as the other banks are, unless bcp_final was
+    # built from this very statement: its enriched rows are already there
+    if not get_build_state().is_current(output_path(BCP_FINAL_FILE), bcp_final_inputs(clean_csv)):
+        store_statement(df_clean)
+    
+    # Enrich the changed dates with the stored payment reports
+    build_bcp_final(clean_csv)
     
     return df_clean
 
@@ -63,33 +167,36 @@ def process_bcp_payment_workflow(file_path: Path, df: pd.DataFrame) -> Optional[
     """
     print("\nProcessing BCP payment report...")
     
-    # Check for existing BCP statement
-    bcp_file = find_bcp_clean_statement()
-    if not bcp_file:
-        print("\nError: No processed BCP statement found.")
-        print("Please process the BCP statement first by running:")
-        print("python -m src.main bcpHistoricos.xls")
-        return None
-    
     # Clean payment report
-    df_payments_clean = clean_bcp_payments(df)
+    df_payments_clean = clean_bcp_payments(df, layout_cache=get_layout_cache())
     if df_payments_clean.empty:
         print("\nError processing payment report")
         return None
     
+    # Open the store before saving, so a first-time seed uses the previous report
+    store = get_payment_store()
+    
+    # Operation amounts in other currencies, converted when the rate table exists
+    rates = load_exchange_rates()
+    if rates is not None:
+        df_payments_clean = convert_payment_amounts(df_payments_clean, rates)
+    
     # Save cleaned report
-    payments_csv = DATA_PROCESSED / f"{file_path.stem}_clean.csv"
-    df_payments_clean.to_csv(payments_csv, index=False)
+    payments_csv = write_csv(df_payments_clean, DATA_PROCESSED / f"{file_path.stem}_clean.csv",
+                             date_format=PAYMENT_REPORT_DATE_FORMATS['payment_date'])
     print(f"\nProcessed payment report saved to: {payments_csv}")
-      # Load BCP statement and enrich
-    print(f"\nUsing BCP statement: {bcp_file}")
-    df_bcp = pd.read_csv(bcp_file)
-    enricher = BCPEnricher()
-    df_enriched, stats = enricher.enrich_statement(df_bcp, df_payments_clean)
-    if not stats.get('error'):
-        enriched_csv = DATA_PROCESSED / "bcp_final.csv"
-        df_enriched.to_csv(enriched_csv, index=False)
-        print(f"\nEnriched BCP statement saved to: {enriched_csv}")
-        return df_enriched
-    
-    return None
+    
+    # Add the report to the payment store used by every later enrichment
+    added = store.append(df_payments_clean)
+    print(f"Payments added to store: {added}")
+    
+    # The report is stored either way; enrichment waits for a BCP statement
+    bcp_file = find_bcp_clean_statement()
+    if not bcp_file:
+        print("\nNo processed BCP statement found for enrichment.")
+        print("Process the BCP statement by running:")
+        print("python -m src.main bcpHistoricos.xls")
+        return None
+    # Only the statement dates covered by the report are enriched again
+    payment_dates = df_payments_clean['payment_date'].dropna().unique()
+    return build_bcp_final(bcp_file, store=store, dates=payment_dates)
@@ -0,0 +1,44 @@
+"""
+Ledger reconciliation workflow: match processed statements against a ledger export.
+"""
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List
+
+from src.reconciler.ledger_reconciler import DEFAULT_WINDOW_DAYS, reconcile
+from src.utils.file_manager import DATA_PROCESSED
+from src.utils.schema import read_ledger_csv, read_standardized_csv
+from src.utils.stream_writer import write_csv
+
+def process_reconciliation_workflow(statement_files: List[Path], ledger_file: Path,
+                                    window_days: int = DEFAULT_WINDOW_DAYS) -> Dict:
+    """
+    Reconcile processed statements against a ledger export and save the result sets.
+
+    Args:
+        statement_files (list): Processed statement CSVs (*_clean.csv, bcp_final.csv)
+        ledger_file (Path): Ledger export CSV
+        window_days (int): Largest date distance between a statement row and its entry
+
+    Returns:
+        dict: Reconciliation statistics
+    """
+    print("\nReconciling statements against ledger...")
+    df_bank = pd.concat([read_standardized_csv(path) for path in statement_files], ignore_index=True)
+    df_ledger = read_ledger_csv(ledger_file)
+
+    df_matched, df_unmatched_bank, df_unmatched_ledger, stats = reconcile(df_bank, df_ledger, window_days)
+
+    outputs = {
+        'reconciliation_matched.csv': df_matched,
+        'reconciliation_unmatched_bank.csv': df_unmatched_bank,
+        'reconciliation_unmatched_ledger.csv': df_unmatched_ledger,
+    }
+    for file_name, df in outputs.items():
+        output_file = write_csv(df, DATA_PROCESSED / file_name)
+        print(f"{file_name}: {len(df)} rows saved to {output_file}")
+
+    print("\nReconciliation statistics:")
+    for key, value in stats.items():
+        print(f"  {key}: {value}")
+    return stats
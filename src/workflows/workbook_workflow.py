@@ -0,0 +1,137 @@
+"""
+Multi-sheet workbook workflow: detect and clean every sheet of a workbook in parallel.
+
+The workbook is opened and parsed once; each worker receives the raw frame of
+its sheet instead of opening the file again (xlrd parses a whole .xls file
+on every open, unless it is opened on demand).
+"""
+import uuid
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.detector.layout_cache import get_layout_cache
+from src.processors.bcp_cleaner import clean_bcp
+from src.processors.bnb_cleaner import clean_bnb
+from src.processors.union_cleaner import clean_union
+from src.reader.excel_reader import detect_frame, list_sheets, open_excel
+from src.utils.schema import STANDARD_COLUMNS
+
+def read_sheets(file_path: Path, sheet_names: List[str]) -> Dict[str, pd.DataFrame]:
+    """
+    Parse the given sheets of a workbook without headers, opening it once.
+
+    Args:
+        file_path (Path): Path to the Excel workbook, or the workbook opened with open_excel
+        sheet_names (list): Sheets to read
+
+    Returns:
+        dict: Raw DataFrame per sheet name, in the given order
+    """
+    if isinstance(file_path, pd.ExcelFile):
+        return {name: file_path.parse(name, header=None) for name in sheet_names}
+    with open_excel(file_path) as workbook:
+        return {name: workbook.parse(name, header=None) for name in sheet_names}
+
+def clean_sheet(sheet_name: str, df_raw: pd.DataFrame, import_batch_id: str) -> Optional[pd.DataFrame]:
+    """
+    Detect the bank and account of a single sheet and clean it.
+
+    Args:
+        sheet_name (str): Name of the sheet (for the log)
+        df_raw (pd.DataFrame): Raw sheet read without headers
+        import_batch_id (str): Batch ID shared by every sheet of the workbook
+
+    Returns:
+        pd.DataFrame | None: Cleaned sheet, or None if the sheet is empty,
+        a payment report or from an unknown bank
+    """
+    layout, df = detect_frame(df_raw)
+    if df.dropna(how='all').empty:
+        print(f"Sheet '{sheet_name}': empty, skipped")
+        return None
+
+    # Payment reports have their own workflow and are not bank statements
+    if layout['kind'] == 'payment_report':
+        print(f"Sheet '{sheet_name}': BCP payment report, skipped")
+        return None
+
+    bank, account = layout['bank'], layout['account']
+    print(f"Sheet '{sheet_name}': bank {bank}, account {account}")
+
+    if bank == "BCP":
+        return clean_bcp(df, import_batch_id=import_batch_id, layout_cache=get_layout_cache())
+    if bank in ["BNB", "BNB1", "BNB2", "BNBUSD"]:
+        bank_code = bank if bank in ["BNB1", "BNB2", "BNBUSD"] else "BNB1"
+        header_row = layout['header_row'] if layout['header_row'] is not None else 1
+        return clean_bnb(df, bank_code=bank_code, account_number=account, import_batch_id=import_batch_id,
+                         header_row=header_row)
+    if bank == "UNION":
+        return clean_union(df, account_number=account, import_batch_id=import_batch_id,
+                           layout_cache=get_layout_cache())
+
+    print(f"Sheet '{sheet_name}': unknown bank, skipped")
+    return None
+
+def payment_report_sheets(sheets: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """
+    Pick the BCP payment reports out of the sheets of a workbook.
+
+    Args:
+        sheets (dict): Raw DataFrame per sheet name, as returned by read_sheets
+
+    Returns:
+        dict: Body of each payment report sheet (header row first), in sheet order
+    """
+    reports = {}
+    for name, df_raw in sheets.items():
+        layout, df = detect_frame(df_raw)
+        if layout['kind'] == 'payment_report':
+            reports[name] = df
+    return reports
+
+def process_workbook(file_path: Path, sheet_names: Optional[List[str]] = None,
+                     max_workers: Optional[int] = None,
+                     sheets: Optional[Dict[str, pd.DataFrame]] = None) -> pd.DataFrame:
+    """
+    Clean every sheet of a workbook concurrently and concatenate the results.
+
+    The workbook is parsed once, then the sheets are cleaned in a process pool;
+    the results are concatenated in workbook sheet order. All sheets share one
+    import_batch_id.
+
+    Args:
+        file_path (Path): Path to the Excel workbook
+        sheet_names (list, optional): Sheets to process, defaults to all sheets
+        max_workers (int, optional): Size of the worker pool, defaults to the CPU count
+        sheets (dict, optional): Sheets already read with read_sheets, read from the file when None
+
+    Returns:
+        pd.DataFrame: Concatenated cleaned DataFrame (empty, with the standard columns, if no
+        sheet could be cleaned)
+    """
+    sheet_names = sheet_names if sheet_names is not None else list_sheets(file_path)
+    import_batch_id = str(uuid.uuid4())
+    print(f"\nProcessing {len(sheet_names)} sheets (import batch {import_batch_id})")
+    if sheets is None:
+        sheets = read_sheets(file_path, sheet_names)
+    else:
+        sheets = {name: sheets[name] for name in sheet_names}
+
+    if max_workers == 1 or len(sheet_names) == 1:
+        results = [clean_sheet(name, df_raw, import_batch_id) for name, df_raw in sheets.items()]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # map() yields results in submission order, i.e. sheet order
+            results = list(executor.map(
+                clean_sheet,
+                list(sheets),
+                list(sheets.values()),
+                [import_batch_id] * len(sheets)
+            ))
+
+    frames = [result for result in results if result is not None and not result.empty]
+    if not frames:
+        return pd.DataFrame(columns=STANDARD_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
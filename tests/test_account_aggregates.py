@@ -0,0 +1,55 @@
+"""
+Test module for the incremental account aggregates.
+"""
+import pandas as pd
+from src.store.account_aggregates import AccountAggregates
+
+def _batch(dates, credits, balances):
+    return pd.DataFrame({
+        'bank_code': 'BCP',
+        'account_number': '201204',
+        'transaction_date': pd.to_datetime(dates),
+        'transaction_time': ['10:00:00'] * len(dates),
+        'debit_amount': [None] * len(dates),
+        'credit_amount': credits,
+        'itf_amount': [0.0] * len(dates),
+        'balance': balances
+    })
+
+def test_update_replaces_only_batch_days(tmp_path):
+    """Test that an overlapping batch replaces its days and keeps the others."""
+    aggregates = AccountAggregates(tmp_path)
+    assert aggregates.update(_batch(['2025-05-01', '2025-05-01', '2025-05-02'], [10.0, 20.0, 5.0], [10.0, 30.0, 35.0])) == 2
+    # Re-import of 2025-05-02 with one more movement, plus a day in June
+    assert aggregates.update(_batch(['2025-05-02', '2025-05-02', '2025-06-01'], [5.0, 1.0, 4.0], [35.0, 36.0, 40.0])) == 2
+
+    reloaded = AccountAggregates(tmp_path)
+    daily = reloaded.query_daily('2025-05-01', '2025-05-31')
+    assert daily['credit_total'].tolist() == [30.0, 6.0]
+    assert daily['closing_balance'].tolist() == [30.0, 36.0]
+
+    may = reloaded.query_period('2025-05')
+    assert may.loc[0, 'credit_total'] == 36.0
+    assert may.loc[0, 'transaction_count'] == 4
+
+    year = reloaded.query_period('2025')
+    assert year.loc[0, 'credit_total'] == 40.0
+    assert year.loc[0, 'closing_balance'] == 40.0
+
+def test_update_rewrites_only_batch_partitions(tmp_path):
+    """Test that a batch rewrites the daily partition of its month and the monthly one of its year."""
+    aggregates = AccountAggregates(tmp_path)
+    aggregates.update(_batch(['2024-12-30', '2025-05-01'], [1.0, 2.0], [1.0, 3.0]))
+    assert aggregates.months() == ['2024-12', '2025-05']
+    assert aggregates.years() == ['2024', '2025']
+    written = {path.name: path.stat().st_ino for path in tmp_path.glob("*.csv")}
+
+    aggregates.update(_batch(['2025-06-01'], [4.0], [7.0]))
+    rewritten = {path.name for path in tmp_path.glob("*.csv") if written.get(path.name) != path.stat().st_ino}
+    assert rewritten == {'daily_2025-06.csv', 'monthly_2025.csv'}
+
+    reloaded = AccountAggregates(tmp_path)
+    assert reloaded.query_period('2024').loc[0, 'credit_total'] == 1.0
+    assert reloaded.query_period('2025')['credit_total'].tolist() == [6.0]
+    assert reloaded.query_daily('2025-06-01')['credit_total'].tolist() == [4.0]
+    assert reloaded.query_period('2023').empty
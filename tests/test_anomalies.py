@@ -0,0 +1,50 @@
+"""
+Test module for duplicate and outlier detection.
+"""
+import numpy as np
+import pandas as pd
+from benchmarks.synthetic import standardized_statements
+from src.validator.anomalies import detect_anomalies
+
+def _rows(times, amounts, descriptions, account='201204'):
+    n = len(times)
+    return pd.DataFrame({
+        'bank_code': 'BCP',
+        'account_number': account,
+        'company_voucher': [f'BCP-{account}-{i}' for i in range(n)],
+        'transaction_date': pd.to_datetime(['2025-05-02'] * n),
+        'transaction_time': times,
+        'description': descriptions,
+        'debit_amount': np.nan,
+        'credit_amount': amounts,
+    })
+
+def test_repeated_movements_within_the_window_are_grouped():
+    """Test that equal account, amount and description within N minutes are flagged."""
+    df = _rows(['10:00:00', '10:05:00', '10:30:00', '10:01:00', '10:02:00'],
+               [100.0, 100.0, 100.0, 100.0, 250.0],
+               ['Abono ACH', 'ABONO  ACH', 'Abono ACH', 'Pago QR', 'Abono ACH'])
+    df_flagged, stats = detect_anomalies(df, window_minutes=10)
+
+    assert list(df_flagged['duplicate_group'].notna()) == [True, True, False, False, False]
+    assert df_flagged['duplicate_of'].iloc[1] == df['company_voucher'].iloc[0]
+    assert pd.isna(df_flagged['duplicate_of'].iloc[0])
+    assert stats['suspected_duplicates'] == 1
+
+def test_other_accounts_are_not_duplicates():
+    """Test that the same movement in two accounts is not a duplicate."""
+    df = pd.concat([_rows(['10:00:00'], [100.0], ['Abono']), _rows(['10:00:00'], [100.0], ['Abono'], account='999')],
+                   ignore_index=True)
+    df_flagged, stats = detect_anomalies(df)
+    assert df_flagged['duplicate_group'].isna().all()
+
+def test_amount_far_from_account_history_is_an_outlier():
+    """Test that a movement far above the recent amounts of its account is flagged."""
+    df = standardized_statements(2_000, days=60)
+    df['credit_amount'] = np.where(df['credit_amount'].notna(), 100.0 + np.arange(len(df)) % 7, np.nan)
+    df['debit_amount'] = np.where(df['debit_amount'].notna(), 50.0 + np.arange(len(df)) % 5, np.nan)
+    df.loc[1500, ['credit_amount', 'debit_amount']] = [1_000_000.0, np.nan]
+
+    df_flagged, stats = detect_anomalies(df)
+    assert df_flagged['is_outlier'].iloc[1500]
+    assert stats['outliers'] == 1
@@ -0,0 +1,171 @@
+"""
+Test module for the out-of-core building blocks.
+"""
+import datetime
+from functools import partial
+import pandas as pd
+import pytest
+import xlrd
+from benchmarks.synthetic import raw_statement, standardized_statements
+from src.processors.bcp_cleaner import clean_bcp
+from src.reader import excel_reader
+from src.reader.excel_reader import iter_excel_chunks
+from src.store.account_aggregates import AccountAggregates
+from src.store import statement_store
+from src.store.search_index import SearchIndex
+from src.store.statement_store import StatementStore
+from src.workflows import backfill_workflow
+from src.workflows.backfill_workflow import process_backfill_workflow
+from src.utils.schema import read_standardized_csv
+from src.utils.stream_writer import CsvStreamWriter, write_csv
+from src.validator.constraints import StreamValidator
+
+def test_chunks_clean_like_the_whole_sheet(tmp_path):
+    """Test that streamed chunks, each headed by the header row, clean into the whole-sheet result."""
+    path = tmp_path / "bcp.xlsx"
+    raw_statement('BCP', 25).to_excel(path, header=False, index=False)
+
+    chunks = list(iter_excel_chunks(path, 10, skiprows=2))
+    assert [len(chunk) for chunk in chunks] == [11, 11, 6]
+    assert all(chunk.iloc[0, 0] == 'Fecha' for chunk in chunks)
+
+    df_chunked = pd.concat([clean_bcp(chunk, import_batch_id='batch') for chunk in chunks], ignore_index=True)
+    df_whole = clean_bcp(pd.read_excel(path, header=None), import_batch_id='batch')
+    assert df_chunked['company_voucher'].tolist() == df_whole['company_voucher'].tolist()
+    assert df_chunked['balance'].tolist() == df_whole['balance'].tolist()
+
+def test_stream_validator_rejects_vouchers_of_earlier_chunks():
+    """Test that a voucher accepted in one chunk is rejected in a later one."""
+    df = standardized_statements(10)
+    validator = StreamValidator()
+
+    valid_first, _ = validator.validate(df.iloc[:6])
+    valid_second, rejected_second = validator.validate(df.iloc[4:])
+    assert len(valid_first) == 6
+    assert len(valid_second) == 4
+    assert rejected_second['rejection_reasons'].tolist() == ['unique_company_voucher'] * 2
+
+def test_csv_stream_writer(tmp_path):
+    """Test that chunks are published together and only on success."""
+    path = tmp_path / "out.csv"
+    with CsvStreamWriter(path) as writer:
+        writer.write(pd.DataFrame({'a': [1, 2]}))
+        writer.write(pd.DataFrame({'a': [3]}))
+        assert not path.exists()
+    assert pd.read_csv(path)['a'].tolist() == [1, 2, 3]
+
+    # A header written up front is not repeated by the first chunk
+    with CsvStreamWriter(tmp_path / "header.csv") as writer:
+        writer.write_header(pd.DataFrame(columns=['a']))
+        writer.write(pd.DataFrame({'a': [5]}))
+    assert (tmp_path / "header.csv").read_text().splitlines() == ['a', '5']
+
+    try:
+        with CsvStreamWriter(path) as writer:
+            writer.write(pd.DataFrame({'a': [4]}))
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert pd.read_csv(path)['a'].tolist() == [1, 2, 3]
+    assert list(tmp_path.glob("*.tmp")) == []
+
+@pytest.mark.parametrize('compression', [None, 'gzip', 'zstd'])
+def test_write_csv_in_chunks_and_compressed(tmp_path, compression):
+    """Test that chunked, compressed output reads back like a single to_csv."""
+    if compression == 'zstd':
+        pytest.importorskip('pyarrow')
+    df = standardized_statements(1_000)
+    path = write_csv(df, tmp_path / "statement_clean.csv", compression, float_format='%.2f',
+                     date_format='%Y-%m-%d', chunk_rows=300)
+    assert path.name == {None: "statement_clean.csv", 'gzip': "statement_clean.csv.gz",
+                         'zstd': "statement_clean.csv.zst"}[compression]
+
+    df.to_csv(tmp_path / "expected.csv", index=False, float_format='%.2f', date_format='%Y-%m-%d')
+    pd.testing.assert_frame_equal(read_standardized_csv(path), read_standardized_csv(tmp_path / "expected.csv"))
+
+    assert read_standardized_csv(write_csv(df.head(0), tmp_path / "empty.csv")).empty
+
+class _XlsSheet:
+    """Stand-in for an xlrd sheet: row values with their cell types."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.nrows = len(rows)
+
+    def row_values(self, i):
+        return [value for value, _ in self.rows[i]]
+
+    def row_types(self, i):
+        return [cell_type for _, cell_type in self.rows[i]]
+
+class _XlsBook:
+    """Stand-in for an xlrd workbook opened on demand."""
+    datemode = 0
+
+    def __init__(self, sheet):
+        self.sheet = sheet
+        self.released = False
+
+    def sheet_by_index(self, index):
+        return self.sheet
+
+    def release_resources(self):
+        self.released = True
+
+def test_xls_chunks_are_streamed_with_xlrd(monkeypatch):
+    """Test that .xls sheets are read row by row with xlrd, cells typed like pandas reads them."""
+    text, number, date, empty = xlrd.XL_CELL_TEXT, xlrd.XL_CELL_NUMBER, xlrd.XL_CELL_DATE, xlrd.XL_CELL_EMPTY
+    rows = [[('Extracto', text), ('', empty)], [('Fecha', text), ('Monto', text)]]
+    rows += [[(45779.0 + i, date), (10.0 + i / 2, number)] for i in range(5)]
+    rows += [[(0.5, date), ('', empty)]]
+    book = _XlsBook(_XlsSheet(rows))
+    monkeypatch.setattr(xlrd, 'open_workbook', lambda path, on_demand: book)
+    monkeypatch.setattr(excel_reader, 'select_engine', lambda file_path: 'xlrd')
+
+    chunks = list(iter_excel_chunks('statement.xls', 4, skiprows=1))
+    assert [len(chunk) for chunk in chunks] == [5, 3]
+    assert chunks[0].iloc[0].tolist() == ['Fecha', 'Monto']
+    assert chunks[0].iloc[1].tolist() == [datetime.datetime(2025, 5, 2), 10]
+    assert chunks[0].iloc[2, 1] == 10.5
+    assert chunks[1].iloc[2, 0] == datetime.time(12, 0)
+    assert pd.isna(chunks[1].iloc[2, 1])
+    assert book.released
+
+def test_process_backfill_workflow(tmp_path, monkeypatch):
+    """Test a backfill of two workbooks end to end, in chunks and into every store."""
+    processed = tmp_path / "processed"
+    processed.mkdir()
+    monkeypatch.setattr(backfill_workflow, 'DATA_PROCESSED', processed)
+    monkeypatch.setattr(backfill_workflow, 'MIN_CHUNK_ROWS', 10)
+    monkeypatch.setattr(backfill_workflow, 'AccountAggregates', partial(AccountAggregates, processed / "aggregates"))
+    monkeypatch.setattr(backfill_workflow, 'SearchIndex', partial(SearchIndex, processed / "search.db"))
+    monkeypatch.setattr(backfill_workflow, 'StatementStore', partial(StatementStore, processed / "statements"))
+
+    first = tmp_path / "2024.xlsx"
+    with pd.ExcelWriter(first) as writer:
+        raw_statement('BCP', 25).to_excel(writer, sheet_name='BCP', header=False, index=False)
+        raw_statement('BNB', 15, seed=1).to_excel(writer, sheet_name='BNB', header=False, index=False)
+        pd.DataFrame([['notas']]).to_excel(writer, sheet_name='Notas', header=False, index=False)
+    # The same BCP movements exported again: rejected as already loaded
+    second = tmp_path / "2024_again.xlsx"
+    raw_statement('BCP', 25).to_excel(second, header=False, index=False)
+
+    stats = process_backfill_workflow([first, second], memory_budget_mb=0)
+
+    assert stats['chunks'] == 3 + 2 + 3
+    assert stats['clean_rows'] == 40
+    assert stats['rejected_rows'] == 25
+    df_final = pd.read_csv(stats['final_file'])
+    assert len(df_final) == 40
+    assert df_final['company_voucher'].is_unique
+    assert df_final['import_batch_id'].nunique() == 1
+    df_rejected = pd.read_csv(stats['rejected_file'])
+    assert set(df_rejected['rejection_reasons']) == {'unique_company_voucher'}
+
+    if statement_store.pa is not None:
+        assert len(StatementStore(processed / "statements").query()) == 40
+    daily = AccountAggregates(processed / "aggregates").query_daily()
+    assert daily['transaction_count'].sum() == 40
+    with SearchIndex(processed / "search.db") as index:
+        assert index.batches()['rows'].sum() == 40
+    assert list(processed.rglob("*.tmp")) == []
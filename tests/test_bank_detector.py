@@ -0,0 +1,67 @@
+"""
+Test module for file layout detection and detected reads.
+"""
+import pandas as pd
+import pytest
+from benchmarks.synthetic import raw_payment_report, raw_statement
+from src.detector.bank_detector import detect_file_layout
+from src.reader.excel_reader import PEEK_ROWS, read_detected
+
+def _write(df, path):
+    """Write a raw sheet without headers, as the banks export it."""
+    df.to_excel(path, header=False, index=False)
+    return path
+
+@pytest.mark.parametrize('bank, expected_bank, account, skiprows', [
+    ('BCP', 'BCP', '201-0005751-3-23', 2),
+    ('BNB', 'BNB1', '1000092297', 1),
+    ('UNION', 'UNION', '10000012345', 1),
+])
+def test_detect_statement_layouts(bank, expected_bank, account, skiprows):
+    """Test bank, account and read options of each statement layout."""
+    layout = detect_file_layout(raw_statement(bank, 60).iloc[:PEEK_ROWS])
+    assert layout['kind'] == 'statement'
+    assert layout['bank'] == expected_bank
+    assert layout['account'] == account
+    assert layout['header_row'] == 0
+    assert layout['read_options'] == {'skiprows': skiprows}
+
+def test_detect_payment_report():
+    """Test that a BCP payment report is told apart from statements."""
+    title = pd.DataFrame([['CONSULTA DE ABONOS RECIBIDOS'] + [None] * 7,
+                          ['Nro. Cuenta Destino: 201-0005751-3-23'] + [None] * 7], dtype=object)
+    layout = detect_file_layout(pd.concat([title, raw_payment_report(5)], ignore_index=True))
+    assert layout['kind'] == 'payment_report'
+    assert layout['account'] == '201-0005751-3-23'
+    assert layout['read_options'] == {'skiprows': 2}
+
+def test_read_detected_skips_title_rows(tmp_path):
+    """Test that long and short sheets are both read from the header row."""
+    for rows in [10, 100]:
+        path = _write(raw_statement('BCP', rows), tmp_path / f"bcp_{rows}.xlsx")
+        layout, df = read_detected(path)
+        assert layout['bank'] == 'BCP'
+        assert df.iloc[0, 0] == 'Fecha'
+        assert len(df) == rows + 1
+
+def test_read_detected_unknown_fallback(tmp_path):
+    """Test that account details below the first rows are found on the full read."""
+    notes = pd.DataFrame([[f"nota {i}"] + [None] * 8 for i in range(PEEK_ROWS + 5)], dtype=object)
+    path = _write(pd.concat([notes, raw_statement('BCP', 5)], ignore_index=True), tmp_path / "late.xlsx")
+
+    layout, df = read_detected(path)
+    assert layout['bank'] == 'BCP'
+    assert layout['header_row'] is None
+    assert layout['read_options'] == {}
+    assert len(df) == PEEK_ROWS + 5 + 3 + 5
+
+def test_read_detected_keeps_data_under_blank_header(tmp_path):
+    """Test that a body column without header label is not dropped."""
+    df_raw = raw_statement('BNB', 5)
+    df_raw[11] = [None, None] + ['extra'] * 5
+    path = _write(df_raw, tmp_path / "bnb.xlsx")
+
+    layout, df = read_detected(path)
+    assert layout['bank'] == 'BNB1'
+    assert df.shape[1] == 12
+    assert df.iloc[1:, 11].tolist() == ['extra'] * 5
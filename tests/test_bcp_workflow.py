@@ -0,0 +1,63 @@
+"""
+Test module for the BCP statement and payment report workflows.
+"""
+from functools import partial
+import pandas as pd
+from benchmarks.synthetic import payment_report, raw_statement
+from src.reader.excel_reader import detect_frame
+from src.store.account_aggregates import AccountAggregates
+from src.store.counterparty_index import CounterpartyIndex
+from src.store.payment_store import PaymentStore
+from src.store.search_index import SearchIndex
+from src.store.statement_store import StatementStore
+from src.utils import file_manager
+from src.utils.build_state import BuildState
+from src.workflows import bcp_workflow
+
+def _isolate(monkeypatch, processed):
+    """Send every output, store and index of the BCP workflows to a temporary folder."""
+    state = BuildState(processed / "build_state.json")
+    monkeypatch.setattr(bcp_workflow, 'DATA_PROCESSED', processed)
+    monkeypatch.setattr(bcp_workflow, 'BCP_FINAL_FILE', processed / "bcp_final.csv")
+    monkeypatch.setattr(file_manager, 'PAYMENT_STORE_DIR', processed / "payment_store")
+    monkeypatch.setattr(bcp_workflow, 'PaymentStore', partial(PaymentStore, processed / "payment_store"))
+    monkeypatch.setattr(bcp_workflow, 'find_payment_report', lambda: None)
+    monkeypatch.setattr(bcp_workflow, 'get_build_state', lambda: state)
+    monkeypatch.setattr(bcp_workflow, 'AccountAggregates', partial(AccountAggregates, processed / "aggregates"))
+    monkeypatch.setattr(bcp_workflow, 'StatementStore', partial(StatementStore, processed / "statements"))
+    monkeypatch.setattr(bcp_workflow, 'CounterpartyIndex', partial(CounterpartyIndex, processed / "counterparties.csv"))
+    monkeypatch.setattr(bcp_workflow, 'SearchIndex', partial(SearchIndex, processed / "search.db"))
+
+def _search(processed, query):
+    with SearchIndex(processed / "search.db") as search_index:
+        return search_index.search(query, limit=1000)
+
+def test_statement_is_indexed_before_enrichment(tmp_path, monkeypatch):
+    """Test that BCP statement rows are indexed without payments, then replaced by their enriched rows."""
+    processed = tmp_path / "processed"
+    processed.mkdir()
+    _isolate(monkeypatch, processed)
+    file_path = tmp_path / "bcpHistoricos.xls"
+    _, df_raw = detect_frame(raw_statement('BCP', 40))
+
+    df_clean = bcp_workflow.process_bcp_statement_workflow(file_path, df_raw)
+
+    assert not (processed / "bcp_final.csv").exists()
+    with SearchIndex(processed / "search.db") as search_index:
+        assert search_index.batches()['rows'].sum() == len(df_clean)
+    assert len(StatementStore(processed / "statements").query()) == len(df_clean)
+
+    # A payment report arrives: only the paid rows are indexed again
+    df_payments = payment_report(df_clean)
+    PaymentStore(processed / "payment_store").append(df_payments)
+    df_final = bcp_workflow.build_bcp_final(processed / "bcpHistoricos_clean.csv")
+    paid = df_final['additional_details'].notna().sum()
+    assert paid == len(df_payments)
+    assert len(_search(processed, 'CLIENTE')) == paid
+
+    # The same statement again: bcp_final is up to date and the index keeps the payment details
+    bcp_workflow.process_bcp_statement_workflow(file_path, df_raw)
+    assert len(_search(processed, 'CLIENTE')) == paid
+    df_stored = StatementStore(processed / "statements").query()
+    assert len(df_stored) == len(df_clean)
+    assert df_stored['additional_details'].notna().sum() == paid
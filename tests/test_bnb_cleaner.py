@@ -3,6 +3,8 @@ Test module for the BNB bank statement cleaner.
 """
 import pandas as pd
 from datetime import date, time
+from benchmarks.synthetic import raw_statement
+from src.validator.constraints import validate_statements
 from src.processors.bnb_cleaner import clean_bnb, generate_company_voucher, extract_transaction_type
 
 def test_clean_bnb():
@@ -70,3 +72,17 @@ def test_extract_transaction_type():
     assert extract_transaction_type('Cargo por transferencia') == 'DEBIT'
     assert extract_transaction_type('TRANSFERENCIA ENTRE CUENTAS') == 'TRANSFER'
     assert extract_transaction_type('OTRO TIPO DE OPERACION') == 'OTHER'
+
+def test_missing_description_becomes_empty():
+    """Test that a movement without description is cleaned with an empty description."""
+    df_raw = raw_statement('BNB', 5)
+    df_raw.iloc[3, 3] = None
+
+    clean_df = clean_bnb(df_raw, 'BNB1', '1000092297', import_batch_id='batch')
+    assert len(clean_df) == 5
+    assert clean_df['description'].iloc[1] == ''
+    assert clean_df['transaction_type'].iloc[1] == 'OTHER'
+
+    # The description column is NOT NULL, which empty text satisfies
+    _, df_rejected = validate_statements(clean_df)
+    assert df_rejected.empty
@@ -0,0 +1,45 @@
+"""
+Test module for the build state of processed outputs.
+"""
+import os
+from src.utils.build_state import BuildState
+
+def test_output_is_rebuilt_only_when_inputs_change(tmp_path):
+    """Test that an output is current until an input's content, the input set or the output changes."""
+    raw = tmp_path / "raw.xlsx"
+    other = tmp_path / "other.csv"
+    output = tmp_path / "raw_clean.csv"
+    raw.write_bytes(b"statement v1")
+    other.write_bytes(b"payments")
+    output.write_text("clean v1")
+
+    state = BuildState(tmp_path / ".build_state.json")
+    assert not state.is_current(output, [raw])
+    state.record(output, [raw])
+    assert state.is_current(output, [raw])
+
+    # A fresh state reads the recorded hashes; touching without changes keeps it current
+    state = BuildState(tmp_path / ".build_state.json")
+    stat = os.stat(raw)
+    os.utime(raw, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert state.is_current(output, [raw])
+
+    assert not state.is_current(output, [raw, other])
+    raw.write_bytes(b"statement v2")
+    assert not state.is_current(output, [raw])
+
+    state.record(output, [raw])
+    output.write_text("edited by hand")
+    assert not state.is_current(output, [raw])
+
+def test_missing_output_is_not_current(tmp_path):
+    """Test that a recorded output that was deleted is rebuilt."""
+    raw = tmp_path / "raw.xlsx"
+    output = tmp_path / "raw_clean.csv"
+    raw.write_bytes(b"statement")
+    output.write_text("clean")
+
+    state = BuildState(tmp_path / ".build_state.json")
+    state.record(output, [raw])
+    output.unlink()
+    assert not state.is_current(output, [raw])
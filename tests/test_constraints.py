@@ -0,0 +1,39 @@
+"""
+Test module for the bank_statements constraint validation.
+"""
+import pandas as pd
+from datetime import date
+from src.validator.constraints import validate_statements
+
+def _statements():
+    return pd.DataFrame({
+        'bank_code': ['BCP', 'BCP', 'XYZ', 'BCP', 'BCP'],
+        'account_number': ['201-1', '201-1', '201-1', '201-1', '201-1'],
+        'company_voucher': ['BCP-1', 'BCP-2', 'BCP-3', 'BCP-1', 'BCP-5'],
+        'transaction_date': [date(2025, 5, 2), date(2025, 5, 2), date(2025, 5, 2), date(2025, 5, 3), None],
+        'description': ['PAGO', 'ABONO', 'ABONO', 'ABONO', 'ABONO'],
+        'debit_amount': [10.0, None, None, None, None],
+        'credit_amount': [None, -5.0, 5.0, 5.0, 5.0],
+        'balance': [100.0, 95.0, 100.0, 105.0, 110.0]
+    })
+
+def test_validate_statements_splits_rejected_rows():
+    """Test that violating rows are split off with every constraint they break."""
+    df_valid, df_rejected = validate_statements(_statements())
+
+    assert df_valid['company_voucher'].tolist() == ['BCP-1']
+    reasons = df_rejected.set_index('company_voucher')['rejection_reasons']
+    assert reasons['BCP-2'] == 'chk_amounts'
+    assert reasons['BCP-3'] == 'chk_bank_code'
+    assert reasons['BCP-5'] == 'not_null_transaction_date'
+    # Only the second occurrence of a voucher is rejected
+    assert df_rejected.loc[3, 'rejection_reasons'] == 'unique_company_voucher'
+
+def test_checks_match_the_table():
+    """Test that empty text passes NOT NULL and one non-negative amount passes chk_amounts."""
+    df = _statements().iloc[:2].assign(description=['', None], debit_amount=[10.0, -1.0], credit_amount=[-5.0, None])
+
+    df_valid, df_rejected = validate_statements(df)
+
+    assert df_valid['company_voucher'].tolist() == ['BCP-1']
+    assert df_rejected['rejection_reasons'].tolist() == ['chk_amounts;not_null_description']
@@ -0,0 +1,49 @@
+"""
+Test module for counterparty extraction and the counterparty index.
+"""
+import pandas as pd
+from datetime import date
+from src.processors.counterparty_extractor import extract_counterparties
+from src.store.counterparty_index import CounterpartyIndex
+
+def _statements():
+    return pd.DataFrame({
+        'bank_code': ['BNB1', 'BNB1', 'BCP', 'BCP', 'UNION'],
+        'account_number': ['1000092297', '1000092297', '201204', '201204', '10000012345'],
+        'company_voucher': ['BNB1-20250530-A1', 'BNB1-20250530-A2', 'BCP-20250502-1', 'BCP-20250502-2', 'UNION-20250502-9'],
+        'transaction_date': [date(2025, 5, 30), date(2025, 5, 30), date(2025, 5, 2), date(2025, 5, 2), date(2025, 5, 2)],
+        'description': ['Abono Cta por ACH', 'Cargo por transferencia', 'TRF RECIBIDA QR', 'ABONO', 'Deposito'],
+        'debit_amount': [None, 1000.0, None, None, None],
+        'credit_amount': [210.0, None, 21.0, 42.0, 84.0],
+        'additional_details': [
+            'Cuenta Origen: 1041305633. Nombre Originante: MANEJO INTEGRADO DE PLAGAS MIP S.R.L..',
+            'Nombre Destinatario: José Núñez. Glosa: pago',
+            'CLIENTE A - FACT 1 - Canal: BANCA MOVIL',
+            'FACT 2',
+            None,
+        ],
+    })
+
+def test_extract_counterparties_per_bank():
+    """Test that account, name and channel are extracted with each bank's patterns."""
+    df = extract_counterparties(_statements())
+    assert df['counterparty_account'].tolist() == ['1041305633', None, None, None, None]
+    assert df['counterparty_name'].tolist() == \
+        ['MANEJO INTEGRADO DE PLAGAS MIP S.R.L.', 'José Núñez', 'CLIENTE A', None, None]
+    # The channel falls back to the description when the details do not name one
+    assert df['counterparty_channel'].tolist() == ['ACH', None, 'BANCA MOVIL', None, None]
+
+def test_counterparty_index_lookups(tmp_path):
+    """Test lookups by name prefix (case and accents ignored) and account, and re-imports."""
+    index = CounterpartyIndex(tmp_path / "counterparties.csv")
+    assert index.update(_statements()) == 3
+
+    index = CounterpartyIndex(tmp_path / "counterparties.csv")
+    assert index.lookup(name='manejo integrado')['company_voucher'].tolist() == ['BNB1-20250530-A1']
+    assert index.lookup(name='JOSE NUNEZ')['company_voucher'].tolist() == ['BNB1-20250530-A2']
+    assert index.lookup(account='1041305633')['credit_amount'].tolist() == [210.0]
+    assert index.lookup(name='CLIENTE', account='1041305633').empty
+
+    # Re-importing a row replaces it
+    assert index.update(_statements().iloc[:1]) == 1
+    assert len(index.frame()) == 3
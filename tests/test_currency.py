@@ -0,0 +1,48 @@
+"""
+Test module for the exchange-rate conversion of statements and payment reports.
+"""
+import numpy as np
+import pandas as pd
+from src.enricher.currency import (ExchangeRates, convert_payment_amounts, convert_statement_amounts,
+                                   load_exchange_rates)
+
+def _rates():
+    return ExchangeRates(pd.DataFrame({
+        'rate_date': pd.to_datetime(['2025-05-01', '2025-05-10', '2025-05-01']),
+        'currency': ['USD', 'usd', 'EUR'],
+        'rate': [6.96, 7.10, 7.50],
+    }))
+
+def test_rates_are_taken_as_of_the_last_earlier_date():
+    """Test that each row gets the rate of its date or of the last earlier date."""
+    rates = _rates().rates(['USD', 'USD', 'USD', 'BOB', 'USD', 'GBP'],
+                           pd.to_datetime(['2025-04-30', '2025-05-01', '2025-05-09', '2025-04-30', '2025-06-01', '2025-05-05']))
+    np.testing.assert_array_equal(rates, [np.nan, 6.96, 6.96, 1.0, 7.10, np.nan])
+
+def test_convert_statement_amounts_by_account_currency():
+    """Test that only accounts held in dollars are converted."""
+    df = pd.DataFrame({
+        'bank_code': ['BNBUSD', 'BNB1', 'BNBUSD'],
+        'transaction_date': pd.to_datetime(['2025-05-02', '2025-05-02', '2025-05-12']),
+        'debit_amount': [100.0, 100.0, np.nan],
+        'credit_amount': [np.nan, np.nan, 10.0],
+        'balance': [1000.0, 500.0, 1010.0],
+    })
+    result = convert_statement_amounts(df, _rates())
+    assert list(result['currency']) == ['USD', 'BOB', 'USD']
+    np.testing.assert_array_equal(result['debit_amount_bob'], [696.0, 100.0, np.nan])
+    np.testing.assert_array_equal(result['credit_amount_bob'], [np.nan, np.nan, 71.0])
+
+def test_convert_payment_amounts_uses_operation_currency():
+    """Test that MONTO OP. is converted with the rate of MONEDA OP. on FECHA."""
+    df = pd.DataFrame({
+        'FECHA': ['02/05/2025', '02/05/2025', '11/05/2025'],
+        'MONTO OP.': ['10.00', '1,000.00', '5.00'],
+        'MONEDA OP.': ['$us', 'BOB', 'EUR'],
+    })
+    result = convert_payment_amounts(df, _rates())
+    np.testing.assert_array_equal(result['operation_amount_bob'], [69.6, 1000.0, 37.5])
+
+def test_missing_rate_table_disables_the_stage(tmp_path):
+    """Test that no rates are loaded when the table does not exist."""
+    assert load_exchange_rates(tmp_path / "exchange_rates.csv") is None
@@ -0,0 +1,55 @@
+"""
+Test module for the Excel reader backends.
+"""
+import pandas as pd
+import pytest
+from benchmarks.synthetic import raw_statement
+from src.reader import engines
+from src.reader.engines import available_engines, select_engine, set_excel_engine
+from src.reader.excel_reader import iter_excel_chunks, read_detected
+
+@pytest.fixture(autouse=True)
+def automatic_engine():
+    """Reset the engine override after each test."""
+    yield
+    set_excel_engine(None)
+
+def test_select_engine_by_file_type():
+    """Test that the fastest installed engine reading the file type is chosen."""
+    installed = available_engines()
+    xlsx = [name for name in installed if '.xlsx' in engines.EXCEL_ENGINES[name][1]]
+    xls = [name for name in installed if '.xls' in engines.EXCEL_ENGINES[name][1]]
+    assert select_engine("statement.xlsx") == xlsx[0]
+    assert select_engine("STATEMENT.XLS") == xls[0]
+    assert select_engine("statement.txt") is None
+    assert select_engine("statement.xlsx", engine='openpyxl') == 'openpyxl'
+    assert select_engine("statement.xls", engine='openpyxl') == xls[0]
+
+def test_set_excel_engine():
+    """Test the engine override and its validation."""
+    set_excel_engine('openpyxl')
+    assert select_engine("statement.xlsx") == 'openpyxl'
+    # openpyxl does not read .xls: those files keep the automatic choice
+    xls = [name for name in available_engines() if '.xls' in engines.EXCEL_ENGINES[name][1]]
+    assert select_engine("statement.xls") == xls[0]
+    set_excel_engine(None)
+    assert select_engine("statement.xlsx") in available_engines()
+    with pytest.raises(ValueError):
+        set_excel_engine('lotus')
+
+def test_calamine_reads_like_openpyxl(tmp_path):
+    """Test that calamine frames and streamed chunks match the openpyxl ones."""
+    pytest.importorskip('python_calamine')
+    path = tmp_path / "bcp.xlsx"
+    raw_statement('BCP', 25).to_excel(path, header=False, index=False)
+
+    results = {}
+    for engine in ['calamine', 'openpyxl']:
+        set_excel_engine(engine)
+        layout, df = read_detected(path)
+        chunks = list(iter_excel_chunks(path, 10, skiprows=2))
+        results[engine] = (layout['bank'], df, pd.concat(chunks, ignore_index=True))
+
+    assert results['calamine'][0] == results['openpyxl'][0] == 'BCP'
+    pd.testing.assert_frame_equal(results['calamine'][1], results['openpyxl'][1])
+    pd.testing.assert_frame_equal(results['calamine'][2], results['openpyxl'][2])
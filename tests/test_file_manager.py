@@ -0,0 +1,46 @@
+"""
+Test module for the file management utilities.
+"""
+import os
+import pytest
+from pathlib import Path
+from benchmarks.synthetic import standardized_statements
+from src.utils import file_manager
+from src.utils.file_manager import (atomic_path, clean_output_path, find_bcp_clean_statement, set_output_compression,
+                                    temporary_path)
+from src.utils.schema import read_standardized_csv
+from src.utils.stream_writer import write_csv
+
+def test_temporary_path_is_unique_per_process(tmp_path):
+    """Test that the temporary file sits next to the target and carries the process id."""
+    path = tmp_path / "payments_2025-05.csv"
+    assert temporary_path(path) == tmp_path / f"payments_2025-05.csv.{os.getpid()}.tmp"
+
+def test_atomic_path(tmp_path):
+    """Test that the target is replaced on success and left untouched on error."""
+    path = tmp_path / "daily.csv"
+    with atomic_path(path) as tmp_file:
+        tmp_file.write_text("v1")
+    assert path.read_text() == "v1"
+
+    with pytest.raises(RuntimeError):
+        with atomic_path(path) as tmp_file:
+            tmp_file.write_text("partial")
+            raise RuntimeError("write failed")
+    assert path.read_text() == "v1"
+    assert list(tmp_path.glob("*.tmp")) == []
+
+def test_compressed_outputs(tmp_path, monkeypatch):
+    """Test that processed outputs follow the output compression and are still found and read."""
+    monkeypatch.setattr(file_manager, 'DATA_PROCESSED', tmp_path)
+    monkeypatch.setattr(file_manager, '_output_compression', None)
+    with pytest.raises(ValueError):
+        set_output_compression('zip')
+
+    set_output_compression('gzip')
+    df = standardized_statements(20)
+    path = write_csv(df, tmp_path / "bcpHistoricos_clean.csv")
+    assert path == tmp_path / "bcpHistoricos_clean.csv.gz"
+    assert clean_output_path(Path("bcpHistoricos.xls")) == path
+    assert find_bcp_clean_statement() == path
+    assert len(read_standardized_csv(path)) == 20
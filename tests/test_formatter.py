@@ -0,0 +1,45 @@
+"""
+Test module for the text formatting utilities.
+"""
+import numpy as np
+import pandas as pd
+from src.utils.formatter import clean_text, map_unique, normalize_text
+
+VALUES = pd.Series(['  Abono  Cta\\npor ACH ', 'Abono Cta por ACH', np.nan, 1041305633, 'x\xa0\ty', '', None], dtype=object)
+
+def test_normalize_text_matches_clean_text():
+    """Test that the column-wise normalization gives the per-cell results."""
+    assert normalize_text(VALUES).tolist() == [clean_text(value) for value in VALUES]
+    assert normalize_text(VALUES, remove_all_spaces=True).tolist() == \
+        ['AbonoCtaporACH', 'AbonoCtaporACH', None, '1041305633', 'xy', '', None]
+    assert normalize_text(VALUES, collapse_spaces=False)[0] == 'Abono  Cta\\npor ACH'
+
+def test_normalize_text_shares_equal_results():
+    """Test that equal normalized texts share one object, or one category."""
+    result = normalize_text(VALUES)
+    assert result[0] is result[1]
+
+    encoded = normalize_text(VALUES, categorical=True)
+    assert list(encoded.cat.categories) == ['Abono Cta por ACH', '1041305633', 'x y', '']
+    assert encoded.isna().tolist() == [False, False, True, False, False, False, True]
+
+def test_normalize_text_unicode_form():
+    """Test that decomposed accents are composed with NFC."""
+    decomposed = pd.Series(['De\u0301bito automa\u0301tico'])
+    assert normalize_text(decomposed)[0] != 'D\u00e9bito autom\u00e1tico'
+    assert normalize_text(decomposed, unicode_form='NFC')[0] == 'D\u00e9bito autom\u00e1tico'
+
+def test_map_unique_converts_each_distinct_value_once():
+    """Test that map_unique converts the distinct values once and gives missing values their result."""
+    seen = []
+    def _upper(uniques):
+        seen.append(len(uniques))
+        return uniques.str.upper()
+
+    values = pd.Series(['a', 'b', None, 'a', 'b', 'a'], dtype=object)
+    assert map_unique(values, _upper).tolist() == ['A', 'B', None, 'A', 'B', 'A']
+    assert seen == [2]
+
+    dates = map_unique(pd.Series(['2025-05-02', None]), pd.to_datetime, dtype='datetime64[ns]')
+    assert dates[0] == np.datetime64('2025-05-02') and np.isnat(dates[1])
+    assert map_unique(values, lambda uniques: uniques.str.len(), 'OTHER').tolist() == [1, 1, 'OTHER', 1, 1, 1]
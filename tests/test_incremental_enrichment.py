@@ -0,0 +1,69 @@
+"""
+Test module for date-sliced incremental enrichment.
+"""
+import pandas as pd
+from benchmarks.synthetic import standardized_statements
+from src.enricher.incremental import enrich_incrementally
+from src.store.payment_store import PaymentStore
+from src.utils.schema import read_standardized_csv
+
+def _statement(tmp_path, df):
+    path = tmp_path / "statement_clean.csv"
+    df.to_csv(path, index=False)
+    return read_standardized_csv(path)
+
+def _payments(df_credits):
+    """Payment report with one payment per statement credit."""
+    return pd.DataFrame({
+        'CANAL': 'ACH',
+        'FECHA': pd.to_datetime(df_credits['transaction_date']).dt.strftime('%d/%m/%Y'),
+        'HORA': '10:00:00',
+        'MONTO ABONADO': df_credits['credit_amount'],
+        'MONTO OP.': df_credits['credit_amount'],
+        'MONEDA OP.': 'BOB',
+        'GLOSA': 'FACT ' + df_credits['bank_voucher'],
+        'TITULAR': 'CLIENTE',
+        'Adicionales': 'CLIENTE - FACT ' + df_credits['bank_voucher'],
+    })
+
+def test_new_payments_enrich_only_their_dates(tmp_path):
+    """Test that a report covering two days re-enriches those days only, as a full run would."""
+    df_statement = _statement(tmp_path, standardized_statements(300, days=60))
+    df_credits = df_statement[df_statement['credit_amount'].notna()]
+    dates = sorted(df_credits['transaction_date'].unique())
+    store = PaymentStore(tmp_path / "store")
+    store.append(_payments(df_credits[~df_credits['transaction_date'].isin(dates[:2])]))
+    df_previous, _ = enrich_incrementally(df_statement, None, store)
+
+    df_new = _payments(df_credits[df_credits['transaction_date'].isin(dates[:2])])
+    store.append(df_new)
+    df_final, stats = enrich_incrementally(df_statement, df_previous, store, dates=dates[:2])
+
+    on_new_dates = df_statement['transaction_date'].isin(dates[:2])
+    assert stats['enriched_dates'] == 2
+    assert stats['enriched_rows'] == on_new_dates.sum()
+    df_full, _ = enrich_incrementally(df_statement, None, store)
+    assert df_final['additional_details'].notna().sum() == len(df_credits)
+    assert df_final['additional_details'].tolist() == df_full['additional_details'].tolist()
+
+def test_changed_statement_rows_enrich_only_their_dates(tmp_path):
+    """Test that a new statement re-enriches the dates whose rows changed."""
+    df_raw = standardized_statements(300, days=60)
+    df_statement = _statement(tmp_path, df_raw)
+    store = PaymentStore(tmp_path / "store")
+    store.append(_payments(df_statement[df_statement['credit_amount'].notna()]))
+    df_previous, _ = enrich_incrementally(df_statement, None, store)
+
+    # A new export: another import batch, one credit amended
+    row = df_raw['credit_amount'].first_valid_index()
+    df_raw = df_raw.assign(import_batch_id='11111111-1111-4111-8111-111111111111')
+    df_raw.loc[row, 'credit_amount'] += 1
+    df_changed = _statement(tmp_path, df_raw)
+    df_final, stats = enrich_incrementally(df_changed, df_previous, store)
+
+    changed_date = df_changed.loc[row, 'transaction_date']
+    assert stats['enriched_dates'] == 1
+    assert stats['enriched_rows'] == (df_changed['transaction_date'] == changed_date).sum()
+    assert pd.isna(df_final.loc[row, 'additional_details'])
+    df_full, _ = enrich_incrementally(df_changed, None, store)
+    assert df_final['additional_details'].tolist() == df_full['additional_details'].tolist()
@@ -0,0 +1,35 @@
+"""
+Test module for header detection and the layout cache.
+"""
+import pandas as pd
+from src.detector.layout_cache import LayoutCache, find_header_row
+
+def _raw_union(rows: int = 3) -> pd.DataFrame:
+    data = [['Cuenta:', None, '10000012345', None], ['Fecha Movimiento', 'AG', 'Descripción', 'Monto']]
+    data += [[f'0{i + 1}/05/2025', '201', 'DEPOSITO', 10.0] for i in range(rows)]
+    return pd.DataFrame(data)
+
+def test_find_header_row():
+    """Test exact, substring, case-insensitive and last-match header detection."""
+    df = _raw_union()
+    assert find_header_row(df, ['Fecha Movimiento'], exact=True) == 1
+    assert find_header_row(df, ['Fecha', 'Monto']) == 1
+    assert find_header_row(df, ['FECHA MOVIMIENTO'], case_sensitive=False) == 1
+    assert find_header_row(df, ['Saldo']) is None
+
+def test_layout_cache_hit_and_miss(tmp_path):
+    """Test that a repeated layout hits the cache and a changed header misses."""
+    cache = LayoutCache(tmp_path / 'layouts.json')
+    df = _raw_union()
+    assert cache.get('UNION', df) is None
+
+    cache.put('UNION', df, 1, {'Monto': 'Monto'})
+    reloaded = LayoutCache(tmp_path / 'layouts.json')
+    layout = reloaded.get('UNION', _raw_union())
+    assert layout['header_row'] == 1
+    assert layout['columns'] == {'Monto': 'Monto'}
+
+    renamed = _raw_union()
+    renamed.iloc[1, 3] = 'Importe'
+    assert reloaded.get('UNION', renamed) is None
+    assert reloaded.get('BCP', df) is None
@@ -0,0 +1,77 @@
+"""
+Test module for the ledger reconciliation.
+"""
+import pandas as pd
+from src.reconciler.ledger_reconciler import reconcile
+
+def _statement():
+    return pd.DataFrame({
+        'bank_code': ['BCP', 'BCP', 'BCP', 'BCP', 'BCP'],
+        'account_number': ['201-1', '201-1', '201-1', '201-1', '201-1'],
+        'company_voucher': ['BCP-1', 'BCP-2', 'BCP-3', 'BCP-4', 'BCP-5'],
+        'transaction_date': pd.to_datetime(['2025-05-02', '2025-05-02', '2025-05-02', '2025-05-03', '2025-05-20']),
+        'debit_amount': [None, None, 50.0, None, None],
+        'credit_amount': [100.0, 100.0, None, 75.5, 10.0]
+    })
+
+def _ledger():
+    return pd.DataFrame({
+        'entry_id': ['L1', 'L2', 'L3', 'L4', 'L5'],
+        'entry_date': pd.to_datetime(['2025-05-01', '2025-05-02', '2025-05-02', '2025-05-05', '2025-05-02']),
+        'reference': ['bcp-2', None, None, None, None],
+        'amount': [100.0, 100.0, -50.0, 75.5, 999.0]
+    })
+
+def test_reconcile_passes():
+    """Test reference, same-date and date-window matches and the unmatched sets."""
+    df_matched, df_unmatched_bank, df_unmatched_ledger, stats = reconcile(_statement(), _ledger(), window_days=3)
+
+    pairs = df_matched.set_index('company_voucher')[['ledger_entry_id', 'match_rule']]
+    assert pairs.loc['BCP-2'].tolist() == ['L1', 'reference']
+    assert pairs.loc['BCP-1'].tolist() == ['L2', 'same_date']
+    assert pairs.loc['BCP-3'].tolist() == ['L3', 'same_date']
+    assert pairs.loc['BCP-4'].tolist() == ['L4', 'date_window']
+    assert df_unmatched_bank['company_voucher'].tolist() == ['BCP-5']
+    assert df_unmatched_ledger['entry_id'].tolist() == ['L5']
+    assert stats['matched'] == 4
+
+def test_reconcile_is_one_to_one():
+    """Test that each ledger entry is matched to at most one statement row."""
+    df_ledger = _ledger().iloc[[1]]
+    df_matched, df_unmatched_bank, _, _ = reconcile(_statement(), df_ledger, window_days=3)
+
+    assert len(df_matched) == 1
+    assert len(df_unmatched_bank) == 4
+
+def test_rows_without_amount_stay_unmatched():
+    """Test that a statement row without debit and credit does not match a zero entry."""
+    df_bank = _statement()
+    df_bank.loc[4, 'credit_amount'] = None
+    df_ledger = pd.DataFrame({
+        'entry_id': ['Z1'],
+        'entry_date': pd.to_datetime(['2025-05-20']),
+        'amount': [0.0]
+    })
+    df_matched, df_unmatched_bank, df_unmatched_ledger, _ = reconcile(df_bank, df_ledger, window_days=3)
+
+    assert df_matched.empty
+    assert df_unmatched_ledger['entry_id'].tolist() == ['Z1']
+    assert 'BCP-5' in df_unmatched_bank['company_voucher'].tolist()
+
+def test_window_prefers_closest_dates_with_repeated_amounts():
+    """Test that repeated amounts pair one-to-one with the closest dates first."""
+    df_bank = pd.DataFrame({
+        'company_voucher': ['B1', 'B2', 'B3'],
+        'transaction_date': pd.to_datetime(['2025-05-01', '2025-05-04', '2025-05-08']),
+        'debit_amount': [None, None, None],
+        'credit_amount': [20.0, 20.0, 20.0]
+    })
+    df_ledger = pd.DataFrame({
+        'entry_id': ['E1', 'E2', 'E3'],
+        'entry_date': pd.to_datetime(['2025-05-06', '2025-05-03', '2025-05-02']),
+        'amount': [20.0, 20.0, 20.0]
+    })
+    df_matched, _, _, _ = reconcile(df_bank, df_ledger, window_days=3)
+
+    pairs = df_matched.set_index('company_voucher')['ledger_entry_id']
+    assert pairs.to_dict() == {'B1': 'E3', 'B2': 'E2', 'B3': 'E1'}
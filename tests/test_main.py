@@ -0,0 +1,150 @@
+"""
+Test module for the single-file processing of the command line entry point.
+"""
+from functools import partial
+import pandas as pd
+import xlrd
+from benchmarks.synthetic import raw_payment_report, raw_statement
+from src import main
+from src.enricher.currency import ExchangeRates
+from src.reader import engines
+from src.processors.bcp_payment_cleaner import clean_bcp_payments
+from src.store.account_aggregates import AccountAggregates
+from src.store.counterparty_index import CounterpartyIndex
+from src.store.search_index import SearchIndex
+from src.store.statement_store import StatementStore
+from src.utils.schema import read_standardized_csv
+
+def _isolate(monkeypatch, processed):
+    """Send every output and store of main to a temporary folder."""
+    monkeypatch.setattr(main, 'DATA_PROCESSED', processed)
+    monkeypatch.setattr(main, 'AccountAggregates', partial(AccountAggregates, processed / "aggregates"))
+    monkeypatch.setattr(main, 'StatementStore', partial(StatementStore, processed / "statements"))
+    monkeypatch.setattr(main, 'CounterpartyIndex', partial(CounterpartyIndex, processed / "counterparties.csv"))
+    monkeypatch.setattr(main, 'SearchIndex', partial(SearchIndex, processed / "search.db"))
+
+def test_process_bnbusd_file(tmp_path, monkeypatch):
+    """Test that a BNB dollar account is cleaned as BNBUSD and converted to bolivianos."""
+    processed = tmp_path / "processed"
+    processed.mkdir()
+    _isolate(monkeypatch, processed)
+    rates = ExchangeRates(pd.DataFrame({
+        'rate_date': pd.to_datetime(['2024-01-01']),
+        'currency': ['USD'],
+        'rate': [6.96],
+    }))
+    monkeypatch.setattr(main, 'load_exchange_rates', lambda: rates)
+
+    df_raw = raw_statement('BNB', 8)
+    df_raw.iloc[0, 1] = '1400017553'
+    path = tmp_path / "bnb_dolares.xlsx"
+    df_raw.to_excel(path, header=False, index=False)
+
+    main._process_file(path)
+
+    df = read_standardized_csv(processed / "bnb_dolares_clean.csv")
+    assert len(df) == 8
+    assert set(df['bank_code']) == {'BNBUSD'}
+    assert set(df['account_number']) == {'1400017553'}
+    assert set(df['currency']) == {'USD'}
+    assert df['balance_bob'].tolist() == (df['balance'] * 6.96).round(2).tolist()
+    debit = df['debit_amount'].notna()
+    assert df.loc[debit, 'debit_amount_bob'].tolist() == (df.loc[debit, 'debit_amount'] * 6.96).round(2).tolist()
+    assert AccountAggregates(processed / "aggregates").query_daily()['bank_code'].unique().tolist() == ['BNBUSD']
+
+def test_process_payment_report_workbook(tmp_path, monkeypatch):
+    """Test that a payment report saved with an extra empty sheet still goes to the payment workflow."""
+    processed = tmp_path / "processed"
+    processed.mkdir()
+    _isolate(monkeypatch, processed)
+    reports = []
+    monkeypatch.setattr(main, 'process_bcp_payment_workflow', lambda path, df: reports.append((path, df)))
+
+    title = pd.DataFrame([['CONSULTA DE ABONOS RECIBIDOS'] + [None] * 7,
+                          ['Nro. Cuenta Destino: 201-0005751-3-23'] + [None] * 7], dtype=object)
+    path = tmp_path / "ReporteAbonos.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        pd.concat([title, raw_payment_report(5)], ignore_index=True).to_excel(
+            writer, sheet_name='Abonos', header=False, index=False)
+        pd.DataFrame().to_excel(writer, sheet_name='Hoja2', header=False, index=False)
+
+    main._process_file(path)
+
+    assert len(reports) == 1
+    report_path, df = reports[0]
+    assert report_path == path
+    assert len(clean_bcp_payments(df)) == 5
+    assert not (processed / "ReporteAbonos_clean.csv").exists()
+
+def test_process_workbook_without_statements(tmp_path, monkeypatch):
+    """Test that a workbook with no statement sheet leaves the stores untouched instead of failing."""
+    processed = tmp_path / "processed"
+    processed.mkdir()
+    _isolate(monkeypatch, processed)
+
+    path = tmp_path / "notas.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame([['nota', 1], ['otra', 2]]).to_excel(writer, sheet_name='Notas', header=False, index=False)
+        pd.DataFrame().to_excel(writer, sheet_name='Vacia', header=False, index=False)
+
+    main._process_file(path)
+
+    assert read_standardized_csv(processed / "notas_clean.csv").empty
+    assert AccountAggregates(processed / "aggregates").months() == []
+    assert StatementStore(processed / "statements").partitions().empty
+
+class _XlsSheet:
+    """Stand-in for an xlrd sheet of text cells."""
+
+    def __init__(self, df):
+        self.rows = df.astype(object).where(df.notna(), '').values.tolist()
+        self.nrows = len(self.rows)
+
+    def row_values(self, i):
+        return self.rows[i]
+
+    def row_types(self, i):
+        return [xlrd.XL_CELL_TEXT if value != '' else xlrd.XL_CELL_EMPTY for value in self.rows[i]]
+
+class _XlsBook:
+    """Stand-in for an xlrd workbook opened on demand, counting the sheets it parses."""
+    datemode = 0
+
+    def __init__(self, sheets):
+        self.sheets = sheets
+        self.loaded = []
+
+    def sheet_names(self):
+        return list(self.sheets)
+
+    def sheet_by_index(self, index):
+        return self.sheet_by_name(list(self.sheets)[index])
+
+    def sheet_by_name(self, name):
+        if name not in self.loaded:
+            self.loaded.append(name)
+        return self.sheets[name]
+
+    def release_resources(self):
+        pass
+
+def test_xls_file_is_parsed_once(tmp_path, monkeypatch):
+    """Test that an .xls file read with xlrd is opened once, on demand, to list, peek and read it."""
+    processed = tmp_path / "processed"
+    processed.mkdir()
+    _isolate(monkeypatch, processed)
+    monkeypatch.setattr(main, 'load_exchange_rates', lambda: None)
+    monkeypatch.setattr(engines, '_engine_override', None)
+    engines.set_excel_engine('xlrd')
+
+    book = _XlsBook({'Hoja1': _XlsSheet(raw_statement('BNB', 60))})
+    opened = []
+    monkeypatch.setattr(xlrd, 'open_workbook', lambda **kwargs: opened.append(kwargs) or book)
+    path = tmp_path / "bnb.xls"
+    path.write_bytes(b'xls')
+
+    main._process_file(path)
+
+    assert [kwargs['on_demand'] for kwargs in opened] == [True]
+    assert book.loaded == ['Hoja1']
+    assert len(read_standardized_csv(processed / "bnb_clean.csv")) == 60
@@ -0,0 +1,30 @@
+"""
+Test module for partition-parallel cleaning.
+"""
+import pandas as pd
+from functools import partial
+from benchmarks.synthetic import raw_statement
+from src.processors.bcp_cleaner import clean_bcp
+from src.processors.bnb_cleaner import clean_bnb
+from src.processors.parallel import clean_partitioned, split_partitions
+
+def test_split_partitions_repeats_header():
+    """Test that every partition starts with the header row and no body row is lost."""
+    df = raw_statement('BCP', 10)
+    parts = split_partitions(df, 2, 3)
+    assert len(parts) == 3
+    assert all(part.iloc[0, 0] == 'Fecha' for part in parts)
+    assert sum(len(part) - 1 for part in parts) == 10
+
+def test_clean_partitioned_matches_single_process():
+    """Test that partitions cleaned in a pool reassemble into the single-process result."""
+    df = raw_statement('BCP', 50)
+    expected = clean_bcp(df, import_batch_id='batch')
+    result = clean_partitioned(clean_bcp, df, 2, workers=2, partitions=4, import_batch_id='batch')
+    pd.testing.assert_frame_equal(result, expected)
+
+    df = raw_statement('BNB', 50)
+    expected = clean_bnb(df, 'BNB1', '1000092297', import_batch_id='batch', header_row=1)
+    cleaner = partial(clean_bnb, bank_code='BNB1', account_number='1000092297', header_row=0)
+    result = clean_partitioned(cleaner, df, 1, workers=1, partitions=4, import_batch_id='batch')
+    pd.testing.assert_frame_equal(result, expected)
@@ -0,0 +1,66 @@
+"""
+Test module for the BCP payment report cleaner.
+"""
+import datetime
+import pandas as pd
+from src.enricher.bcp_enricher import BCPEnricher
+from src.processors.bcp_payment_cleaner import clean_bcp_payments
+from src.store.payment_store import PaymentStore
+from src.utils.schema import PAYMENT_REPORT_DATE_FORMATS, read_payment_report_csv
+from src.utils.stream_writer import write_csv
+
+def _raw_report():
+    """Raw report with a title row, typed and text values and missing parts."""
+    return pd.DataFrame([
+        ['Reporte de abonos', None, None, None, None, None, None, None],
+        ['CANAL', 'FECHA', 'HORA', 'MONTO ABONADO', 'MONTO OP.', 'MONEDA OP.', 'GLOSA', 'TITULAR'],
+        ['ACH', '02/05/2025', '10:00:00', '1,250.50', '1250.50', 'BOB', 'FACT 1', 'CLIENTE A'],
+        ['QR', datetime.datetime(2025, 5, 3), datetime.time(9, 5), 84.0, 84.0, 'BOB', None, 'CLIENTE B'],
+        [None, ' 04/05/2025', '9:05:00', 'N/A', None, 'USD', 'FACT 3', None],
+        [None, None, None, None, None, None, None, None],
+    ], dtype=object)
+
+def test_clean_bcp_payments():
+    """Test formats, Adicionales and the matching key of a cleaned report."""
+    df = clean_bcp_payments(_raw_report())
+
+    assert len(df) == 3
+    assert df['FECHA'].tolist() == ['02/05/2025', '03/05/2025', '04/05/2025']
+    assert df['HORA'].tolist() == ['10:00:00', '09:05:00', '09:05:00']
+    assert df['MONTO ABONADO'].tolist()[:2] == [1250.5, 84.0]
+    assert pd.isna(df.loc[2, 'MONTO ABONADO'])
+    assert df['Adicionales'].tolist() == [
+        'CLIENTE A - FACT 1 - Canal: ACH',
+        'CLIENTE B - Canal: QR',
+        'FACT 3',
+    ]
+    assert df['payment_date'].tolist() == [pd.Timestamp('2025-05-02'), pd.Timestamp('2025-05-03'),
+                                           pd.Timestamp('2025-05-04')]
+    assert df['amount_cents'].tolist()[:2] == [125050, 8400]
+    assert pd.isna(df.loc[2, 'amount_cents'])
+
+def test_enricher_uses_the_same_cleaner():
+    """Test that BCPEnricher cleans reports with clean_bcp_payments."""
+    pd.testing.assert_frame_equal(BCPEnricher().clean_payment_report(_raw_report()), clean_bcp_payments(_raw_report()))
+
+def test_missing_header_and_columns():
+    """Test a report without header and one without some columns."""
+    assert clean_bcp_payments(pd.DataFrame([['a', 'b'], ['c', 'd']], dtype=object)).empty
+
+    df = clean_bcp_payments(pd.DataFrame([['FECHA', 'MONTO ABONADO'], ['02/05/2025', '10.00']], dtype=object))
+    assert df['Adicionales'].tolist() == [None]
+    assert df['amount_cents'].tolist() == [1000]
+
+def test_cleaned_report_round_trip_to_store(tmp_path):
+    """Test that the saved report keeps its key and seeds the store like the frame."""
+    df = clean_bcp_payments(_raw_report())
+    path = tmp_path / "ReporteAbonos_clean.csv"
+    write_csv(df, path, date_format=PAYMENT_REPORT_DATE_FORMATS['payment_date'])
+
+    df_read = read_payment_report_csv(path)
+    assert df_read['payment_date'].tolist() == df['payment_date'].tolist()
+    assert df_read['amount_cents'].tolist()[:2] == [125050, 8400]
+
+    store = PaymentStore(tmp_path / "store")
+    assert store.append(df_read) == 2
+    assert store.load([datetime.date(2025, 5, 3)])['Adicionales'].tolist() == ['CLIENTE B - Canal: QR']
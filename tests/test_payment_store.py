@@ -0,0 +1,52 @@
+"""
+Test module for the payment store and store-based BCP enrichment.
+"""
+import pandas as pd
+from datetime import date
+from src.store.payment_store import PaymentStore
+from src.enricher.bcp_enricher import BCPEnricher
+
+def _payments():
+    return pd.DataFrame({
+        'CANAL': ['BANCA MOVIL', 'ACH', 'ACH', 'CAJA'],
+        'FECHA': ['02/05/2025', '02/05/2025', '02/05/2025', '03/06/2025'],
+        'HORA': ['10:00:00', '11:00:00', '12:00:00', '09:00:00'],
+        'MONTO ABONADO': [21.00, 42.00, 42.00, 84.00],
+        'MONTO OP.': [21.00, 42.00, 42.00, 84.00],
+        'MONEDA OP.': ['BOB', 'BOB', 'BOB', 'BOB'],
+        'GLOSA': ['FACT 1', 'FACT 2', 'FACT 3', 'FACT 4'],
+        'TITULAR': ['CLIENTE A', 'CLIENTE B', 'CLIENTE C', 'CLIENTE D'],
+        'Adicionales': ['CLIENTE A - FACT 1', 'CLIENTE B - FACT 2', 'CLIENTE C - FACT 3', 'CLIENTE D - FACT 4']
+    })
+
+def test_append_deduplicates_and_partitions_by_month(tmp_path):
+    """Test that overlapping reports are deduplicated into monthly partitions."""
+    store = PaymentStore(tmp_path)
+    assert store.append(_payments()) == 4
+    assert store.append(_payments()) == 0
+    assert store.months() == ['2025-05', '2025-06']
+
+    df = store.load([date(2025, 5, 2)])
+    assert len(df) == 3
+    assert set(df['amount_cents']) == {2100, 4200}
+
+def test_enrich_from_store(tmp_path):
+    """Test enrichment of a standardized statement from the store."""
+    store = PaymentStore(tmp_path)
+    store.append(_payments())
+
+    df_bcp = pd.DataFrame({
+        'transaction_date': [date(2025, 5, 2), date(2025, 5, 2), date(2025, 5, 2)],
+        'debit_amount': [None, None, 21.00],
+        'credit_amount': [21.00, 42.00, None],
+        'additional_details': [None, None, None]
+    })
+
+    df_enriched, stats = BCPEnricher().enrich_from_store(df_bcp, store)
+
+    assert df_enriched.iloc[0]['additional_details'] == 'CLIENTE A - FACT 1'
+    assert df_enriched.iloc[1]['additional_details'] == 'CLIENTE B - FACT 2 | CLIENTE C - FACT 3'
+    assert pd.isna(df_enriched.iloc[2]['additional_details'])
+    assert stats['matched'] == 1
+    assert stats['multiple_matches'] == 1
+    assert stats['no_match'] == 1
@@ -0,0 +1,54 @@
+"""
+Test module for the transaction records and batch iterators.
+"""
+import datetime
+import numpy as np
+import pandas as pd
+import pytest
+from benchmarks.synthetic import raw_statement, standardized_statements
+from src.processors.bcp_cleaner import clean_bcp
+from src.utils.records import TransactionRecord, iter_column_batches, iter_record_batches, iter_records
+from src.utils.schema import STANDARD_COLUMNS
+
+def test_transaction_record_layout():
+    """Test that a record holds exactly the table columns, in order, without a __dict__."""
+    record = TransactionRecord('BCP', '201204', company_voucher='BCP-20240101-1', debit_amount=10.5)
+    assert TransactionRecord.__slots__ == tuple(STANDARD_COLUMNS)
+    assert not hasattr(record, '__dict__')
+    assert record.as_tuple()[:3] == ('BCP', '201204', 'BCP-20240101-1')
+    assert record.as_dict()['debit_amount'] == 10.5
+    assert record.as_dict()['credit_amount'] is None
+    assert record == TransactionRecord(**record.as_dict())
+    with pytest.raises(AttributeError):
+        record.payer = 'JUAN PEREZ'
+
+def test_records_match_the_cleaned_rows():
+    """Test that records carry the cleaner output as plain Python values."""
+    df = clean_bcp(raw_statement('BCP', 30), import_batch_id='batch')
+    df.loc[3, 'transaction_date'] = None
+    records = list(iter_records(df, batch_rows=7))
+
+    assert len(records) == len(df)
+    for record, (_, row) in zip(records, df.iterrows()):
+        assert record.company_voucher == row['company_voucher']
+        assert record.transaction_time == row['transaction_time'].strftime('%H:%M:%S')
+        for col in ['debit_amount', 'credit_amount', 'balance']:
+            assert record.as_dict()[col] == (None if pd.isna(row[col]) else row[col])
+    assert records[0].transaction_date == df.loc[0, 'transaction_date']
+    assert isinstance(records[0].transaction_date, datetime.date)
+    assert records[3].transaction_date is None
+    assert records[0].branch_office is None
+
+def test_record_batches_and_column_batches():
+    """Test batch sizes, column types and columns missing from the frame."""
+    df = standardized_statements(25).drop(columns=['user_code'])
+
+    assert [len(records) for records in iter_record_batches(df, batch_rows=10)] == [10, 10, 5]
+
+    batches = list(iter_column_batches(df, batch_rows=10, columns=['transaction_date', 'debit_amount', 'user_code']))
+    assert [len(batch['debit_amount']) for batch in batches] == [10, 10, 5]
+    assert batches[0]['transaction_date'].dtype == np.dtype('datetime64[D]')
+    assert batches[0]['debit_amount'].dtype == np.float64
+    assert batches[0]['user_code'].tolist() == [None] * 10
+    debits = np.concatenate([batch['debit_amount'] for batch in batches])
+    np.testing.assert_array_equal(debits, df['debit_amount'].to_numpy())
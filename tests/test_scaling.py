@@ -0,0 +1,111 @@
+"""
+Scaling guards: the cleaners, detectors and enrichers must stay (near) linear.
+
+Each hot path runs on synthetic inputs of growing size and the time ratio
+between sizes is checked against an n log n bound with headroom for timer
+noise. For 8 times the rows the bound is about 25 times the time, while a
+quadratic implementation takes 64 times as long.
+"""
+import math
+import time
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import ledger_entries, payment_report, raw_statement, standardized_statements
+from src.detector.layout_cache import find_header_row
+from src.enricher.bcp_enricher import BCPEnricher
+from src.processors.bcp_cleaner import clean_bcp
+from src.processors.bnb_cleaner import clean_bnb
+from src.processors.union_cleaner import clean_union, find_union_header_row
+from src.reconciler.ledger_reconciler import match_ledger
+from src.reconciler.transfer_pairing import pair_internal_transfers
+from src.utils.formatter import normalize_text
+
+SIZES = (2_000, 16_000)
+
+# Allowed growth over n log n: covers timer noise and cache effects, not a change of complexity
+HEADROOM = 2.5
+
+def _best_time(func, repeats: int = 3) -> float:
+    """Shortest of a few runs, the least noisy estimate of the cost."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def assert_near_linear(make_input, run):
+    """Assert that run(make_input(n)) grows at most like n log n between SIZES."""
+    small, large = SIZES
+    inputs = {n: make_input(n) for n in SIZES}
+    run(inputs[small])  # warm-up: imports, regex compilation, caches
+    timings = {n: _best_time(partial(run, inputs[n])) for n in SIZES}
+
+    bound = (large / small) * math.log(large) / math.log(small) * HEADROOM
+    ratio = timings[large] / max(timings[small], 1e-6)
+    assert ratio <= bound, f"time grew {ratio:.1f}x for {large // small}x rows (bound {bound:.1f}x)"
+
+@pytest.mark.parametrize('bank', ['BCP', 'BNB', 'UNION'])
+def test_cleaners_scale_linearly(bank):
+    """Test that cleaning a statement grows linearly with its rows."""
+    cleaners = {
+        'BCP': partial(clean_bcp, import_batch_id='batch'),
+        'BNB': partial(clean_bnb, bank_code='BNB1', account_number='1000092297', import_batch_id='batch'),
+        'UNION': partial(clean_union, account_number='10000012345', import_batch_id='batch'),
+    }
+    assert_near_linear(lambda n: raw_statement(bank, n), cleaners[bank])
+
+def test_header_searches_scale_linearly():
+    """Test that locating the header row of a whole sheet grows linearly."""
+    assert_near_linear(lambda n: raw_statement('BCP', n), lambda df: find_header_row(df, ['Fecha', 'Hora']))
+    assert_near_linear(lambda n: raw_statement('UNION', n), find_union_header_row)
+
+def test_enricher_scales_linearly():
+    """Test that enriching a statement with its payment report grows linearly."""
+    def make_input(n):
+        df_statement = standardized_statements(n)
+        return df_statement, payment_report(df_statement)
+
+    enricher = BCPEnricher()
+    assert_near_linear(make_input, lambda args: enricher.enrich_statement(*args))
+
+def test_text_normalization_scales_linearly():
+    """Test that column-wise text normalization grows linearly."""
+    assert_near_linear(lambda n: raw_statement('BNB', n)[3], normalize_text)
+
+def _repeated_amounts(df_statement, distinct=5):
+    """Statement on every other day whose rows share a handful of amounts, like fees or fixed payments."""
+    df = df_statement.copy()
+    dates = pd.to_datetime(df['transaction_date'])
+    df['transaction_date'] = (dates - pd.to_timedelta(dates.dt.dayofyear % 2, unit='D')).dt.date
+    amounts = np.array([10.0, 25.0, 50.0, 100.0, 250.0])[np.arange(len(df)) % distinct]
+    df['debit_amount'] = np.nan
+    df['credit_amount'] = amounts
+    return df
+
+def test_window_matching_scales_with_repeated_amounts():
+    """Test that the date-window pass stays linear when amounts repeat thousands of times."""
+    def make_input(n):
+        df_statement = _repeated_amounts(standardized_statements(n))
+        df_ledger = ledger_entries(df_statement, coverage=1.0, reference_share=0.0, max_shift_days=0)
+        # Every entry a day late, on a day without statement rows: all are left to the date-window pass
+        df_ledger['entry_date'] += pd.Timedelta(days=1)
+        return df_statement, df_ledger
+
+    assert_near_linear(make_input, lambda args: match_ledger(*args))
+
+def test_transfer_pairing_scales_with_repeated_amounts():
+    """Test that pairing transfers stays linear when amounts repeat across accounts."""
+    def make_input(n):
+        df = pd.concat([
+            standardized_statements(n // 4, bank_code=bank_code, account_number=f"10000{seed:05d}", seed=seed)
+            for seed, bank_code in enumerate(['BCP', 'BNB1', 'BNB2', 'UNION'])
+        ], ignore_index=True)
+        df[['debit_amount', 'credit_amount']] = np.where(df[['debit_amount', 'credit_amount']].notna(), 50.0, np.nan)
+        return df
+
+    assert_near_linear(make_input, pair_internal_transfers)
@@ -0,0 +1,73 @@
+"""
+Test module for the typed CSV readers.
+"""
+import numpy as np
+import pandas as pd
+from benchmarks.synthetic import payment_report, standardized_statements
+from src.utils import schema
+from src.utils.schema import read_payment_report_csv, read_standardized_csv
+
+ENGINES = ['c'] + (['pyarrow'] if schema.pa is not None else [])
+
+def _read_with_engines(monkeypatch, read, path, **kwargs):
+    """Read a CSV with each installed parser."""
+    frames = {}
+    for engine in ENGINES:
+        monkeypatch.setattr(schema, 'CSV_ENGINE', engine)
+        frames[engine] = read(path, **kwargs)
+    return frames
+
+def test_read_standardized_csv_round_trip(tmp_path, monkeypatch):
+    """Test that a written statement reads back typed, the same with both parsers."""
+    df = standardized_statements(50)
+    df.loc[3, 'description'] = None
+    df['transaction_time'] = df['transaction_time'].astype(str)
+    path = tmp_path / "statement_clean.csv"
+    df.to_csv(path, index=False)
+
+    frames = _read_with_engines(monkeypatch, read_standardized_csv, path)
+    for df_read in frames.values():
+        assert pd.api.types.is_datetime64_any_dtype(df_read['transaction_date'])
+        assert df_read['transaction_date'].dt.date.tolist() == df['transaction_date'].tolist()
+        assert df_read['debit_amount'].dtype == np.float64
+        np.testing.assert_array_equal(df_read['balance'].to_numpy(), df['balance'].to_numpy())
+        # Identifiers stay text, leading zeros and all
+        assert df_read['bank_voucher'].tolist() == df['bank_voucher'].tolist()
+        assert df_read['transaction_code'].tolist() == ['2401'] * 50
+        assert pd.isna(df_read.loc[3, 'description'])
+    if len(frames) == 2:
+        pd.testing.assert_frame_equal(frames['c'], frames['pyarrow'])
+
+def test_read_subset_and_missing_columns(tmp_path, monkeypatch):
+    """Test a column subset and a file lacking some schema columns."""
+    df = standardized_statements(10)[['company_voucher', 'transaction_date', 'credit_amount']]
+    path = tmp_path / "partial.csv"
+    df.to_csv(path, index=False)
+
+    frames = _read_with_engines(monkeypatch, read_standardized_csv, path,
+                                columns=['transaction_date', 'credit_amount', 'balance'])
+    for df_read in frames.values():
+        assert df_read.columns.tolist() == ['transaction_date', 'credit_amount']
+    if len(frames) == 2:
+        pd.testing.assert_frame_equal(frames['c'], frames['pyarrow'])
+
+def test_read_payment_report_csv_round_trip(tmp_path, monkeypatch):
+    """Test report dates in DD/MM/YYYY, the Int64 key and unparsable dates."""
+    df = payment_report(standardized_statements(40)).drop(columns=['MONTO OP.'])
+    df['payment_date'] = pd.to_datetime(df['FECHA'], format='%d/%m/%Y').dt.strftime('%Y-%m-%d')
+    df['amount_cents'] = (df['MONTO ABONADO'] * 100).round().astype('Int64')
+    df.loc[0, 'FECHA'] = 'sin fecha'
+    df.loc[1, 'amount_cents'] = pd.NA
+    path = tmp_path / "ReporteAbonos_clean.csv"
+    df.to_csv(path, index=False)
+
+    frames = _read_with_engines(monkeypatch, read_payment_report_csv, path)
+    for df_read in frames.values():
+        assert 'MONTO OP.' not in df_read.columns
+        assert pd.isna(df_read.loc[0, 'FECHA'])
+        assert df_read.loc[2, 'FECHA'] == pd.to_datetime(df.loc[2, 'FECHA'], format='%d/%m/%Y')
+        assert df_read['payment_date'].tolist() == pd.to_datetime(df['payment_date']).tolist()
+        assert df_read['amount_cents'].dtype == pd.Int64Dtype()
+        assert pd.isna(df_read.loc[1, 'amount_cents'])
+    if len(frames) == 2:
+        pd.testing.assert_frame_equal(frames['c'], frames['pyarrow'])
@@ -0,0 +1,58 @@
+"""
+Test module for the full-text search index.
+"""
+import pandas as pd
+
+from src.store.search_index import SearchIndex, match_expression
+
+def _batch(batch_id, details, bank_code='BNB1'):
+    """Cleaned batch with one row per additional details text."""
+    return pd.DataFrame({
+        'company_voucher': [f'{bank_code}-2025050{i + 1}-{i}' for i in range(len(details))],
+        'bank_code': bank_code,
+        'account_number': '1000',
+        'transaction_date': pd.to_datetime([f'2025-05-0{i + 1}' for i in range(len(details))]),
+        'debit_amount': None,
+        'credit_amount': 100.0,
+        'description': 'Abono por transferencia',
+        'additional_details': details,
+        'import_batch_id': batch_id,
+    })
+
+def test_match_expression_quotes_terms():
+    """Test that queries become one quoted phrase, the last word a prefix when it is plain."""
+    assert match_expression('mip s.r.l') == '"mip s.r.l"'
+    assert match_expression('fact 012') == '"fact 012"*'
+    assert match_expression('  ') == ''
+
+def test_search_ignores_case_and_accents_and_filters_bank(tmp_path):
+    """Test accent and case folding, word order and the bank filter."""
+    index = SearchIndex(tmp_path / "search.db")
+    index.add_batch(_batch('b1', ['Nombre Originante: JOSÉ PÉREZ', 'Nombre Originante: MIP S.R.L.']))
+    index.add_batch(_batch('b2', ['PEREZ LTDA - PAGO FACT 123'], bank_code='BCP'))
+
+    assert len(index.search('jose perez')) == 1
+    assert set(index.search('perez')['bank_code']) == {'BNB1', 'BCP'}
+    assert list(index.search('perez', bank_code='BCP')['bank_code']) == ['BCP']
+    assert list(index.search('perez ltd')['company_voucher']) == ['BCP-20250501-0']
+    assert index.search('perez jose').empty
+
+def test_reindexed_rows_replace_previous_text(tmp_path):
+    """Test that unchanged rows are skipped, changed rows replaced and batches removed."""
+    index = SearchIndex(tmp_path / "search.db")
+    assert index.add_batch(_batch('b1', ['Pago de cliente'])) == 1
+    assert index.add_batch(_batch('b1', ['Pago de cliente'])) == 0
+
+    index.add_batch(_batch('b2', ['ACME SA - Canal: QR']))
+    assert index.search('cliente').empty
+    assert len(index.search('acme')) == 1
+
+    assert index.remove_batch('b2') == 1
+    assert index.search('acme').empty
+
+def test_context_manager_closes_connection(tmp_path):
+    """Test that leaving the with block closes the database connection."""
+    with SearchIndex(tmp_path / "search.db") as index:
+        index.add_batch(_batch('b1', ['Pago de cliente']))
+        assert index._connection is not None
+    assert index._connection is None
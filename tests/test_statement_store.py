@@ -0,0 +1,50 @@
+"""
+Test module for the partitioned statement store.
+"""
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from benchmarks.synthetic import standardized_statements
+from src.store.statement_store import StatementStore
+
+def test_append_partitions_by_bank_account_and_month(tmp_path):
+    """Test one partition per month and that re-imported rows replace the stored ones."""
+    store = StatementStore(tmp_path)
+    df = standardized_statements(300, start='2024-01-01', days=90)
+    assert store.append(df) == 3
+    assert list(store.partitions()['month']) == ['2024-01', '2024-02', '2024-03']
+
+    # Re-importing the batch replaces its rows instead of adding them again
+    store.append(df.iloc[:50])
+    df_stored = store.query()
+    assert len(df_stored) == 300
+    assert df_stored['company_voucher'].is_unique
+
+def test_query_filters_account_dates_and_amounts(tmp_path):
+    """Test that a query returns the rows of its account, date range and amounts only."""
+    store = StatementStore(tmp_path)
+    df_bcp = standardized_statements(400, start='2024-01-01', days=365)
+    df_other = standardized_statements(400, account_number='999', start='2024-01-01', days=365, seed=1)
+    store.append(df_bcp)
+    store.append(df_other)
+
+    df = store.query(account_number='201204', start='2024-03-01', end='2024-04-30', min_amount=100,
+                     columns=['company_voucher', 'transaction_date', 'debit_amount', 'credit_amount'])
+    dates = df_bcp['transaction_date'].astype('datetime64[ns]')
+    amount = df_bcp['debit_amount'].fillna(df_bcp['credit_amount'])
+    expected = df_bcp[(dates >= '2024-03-01') & (dates <= '2024-04-30') & (amount >= 100)]
+
+    assert list(df.columns) == ['company_voucher', 'transaction_date', 'debit_amount', 'credit_amount']
+    assert sorted(df['company_voucher']) == sorted(expected['company_voucher'])
+
+def test_append_skips_rows_without_partition_keys(tmp_path):
+    """Test that rows lacking a date, bank or account are left out, wherever they are."""
+    store = StatementStore(tmp_path)
+    df = standardized_statements(10, start='2024-01-01', days=20)
+    df.loc[2, 'bank_code'] = None
+    df.loc[5, 'account_number'] = None
+    df.loc[7, 'transaction_date'] = None
+
+    assert store.append(df) == 1
+    assert sorted(store.query()['company_voucher']) == sorted(df['company_voucher'].drop([2, 5, 7]))
@@ -0,0 +1,32 @@
+"""
+Test module for the rules based transaction type classifier.
+"""
+import pandas as pd
+from src.processors.transaction_classifier import TransactionClassifier, classify_transactions
+
+def test_classify_transactions_precedence():
+    """Test that the first matching rule wins and unmatched values are OTHER."""
+    descriptions = pd.Series([
+        'Abono Cta por ACH',
+        'Cargo por transferencia',
+        'TRANSFERENCIA ENTRE CUENTAS',
+        'Débito automático',
+        'OTRO TIPO DE OPERACION',
+        None
+    ], index=[10, 11, 12, 13, 14, 15])
+
+    types = classify_transactions(descriptions, 'BNB1')
+
+    assert types.tolist() == ['CREDIT', 'DEBIT', 'TRANSFER', 'DEBIT', 'OTHER', 'OTHER']
+    assert types.index.tolist() == descriptions.index.tolist()
+
+def test_classify_transactions_all_banks():
+    """Test that BCP and UNION descriptions are classified with the same rules."""
+    assert classify_transactions(pd.Series(['DEPOSITO EN EFECTIVO']), 'BCP').iloc[0] == 'CREDIT'
+    assert classify_transactions(pd.Series(['PAGO SERVICIO']), 'UNION').iloc[0] == 'DEBIT'
+
+def test_custom_rules_table():
+    """Test a custom rules table with regular expressions."""
+    classifier = TransactionClassifier([('FEE', r'COMISI[OÓ]N'), ('CASH', r'^RETIRO\b')])
+    types = classifier.classify(pd.Series(['Comisión mensual', 'RETIRO CAJERO', 'NO RETIRO']))
+    assert types.tolist() == ['FEE', 'CASH', 'OTHER']
@@ -0,0 +1,85 @@
+"""
+Test module for the internal transfer pairing.
+"""
+import pandas as pd
+from src.reconciler.transfer_pairing import pair_internal_transfers
+
+def test_pair_internal_transfers():
+    """Test that opposite legs pair across accounts only, within the window and currency."""
+    df = pd.DataFrame({
+        'bank_code': ['BNB1', 'BCP', 'BNB1', 'BNBUSD', 'UNION', 'BCP'],
+        'account_number': ['1000092297', '201-0005751-3-23', '1000092297', '1400017553', '10000012345', '201-0005751-3-23'],
+        'company_voucher': ['BNB1-1', 'BCP-1', 'BNB1-2', 'BNBUSD-1', 'UNION-1', 'BCP-2'],
+        'transaction_date': pd.to_datetime(['2025-05-02', '2025-05-03', '2025-05-02', '2025-05-02', '2025-05-20', '2025-05-02']),
+        'description': ['TRASPASO A CUENTA PROPIA', 'ABONO', 'ABONO', 'TRANSFERENCIA', 'TRANSFERENCIA', 'TRANSFERENCIA RECIBIDA'],
+        'debit_amount': [500.0, None, None, 700.0, 900.0, None],
+        'credit_amount': [None, 500.0, 500.0, None, None, 700.0]
+    })
+
+    df_paired, stats = pair_internal_transfers(df, window_days=2)
+
+    paired = df_paired.set_index('company_voucher')['paired_company_voucher']
+    # Same account credit is never a counterpart, and USD never pairs with BOB
+    assert paired['BNB1-1'] == 'BCP-1'
+    assert paired['BCP-1'] == 'BNB1-1'
+    assert pd.isna(paired['BNB1-2'])
+    assert pd.isna(paired['BNBUSD-1'])
+    assert pd.isna(paired['UNION-1'])
+    assert df_paired['transfer_pair_id'].notna().sum() == 2
+    assert stats['transfer_pairs'] == 1
+
+def test_equal_amounts_need_a_signal():
+    """Test that a payment and a deposit of the same amount are not taken for a transfer."""
+    df = pd.DataFrame({
+        'bank_code': ['BCP', 'BNB1'],
+        'account_number': ['201-0005751-3-23', '1000092297'],
+        'company_voucher': ['BCP-1', 'BNB1-1'],
+        'transaction_date': pd.to_datetime(['2025-05-02', '2025-05-02']),
+        'description': ['PAGO FACTURA 123', 'DEPOSITO EN EFECTIVO'],
+        'debit_amount': [150.0, None],
+        'credit_amount': [None, 150.0]
+    })
+
+    df_paired, stats = pair_internal_transfers(df)
+
+    assert df_paired['transfer_pair_id'].isna().all()
+    assert stats['transfer_pairs'] == 0
+
+def test_account_mention_goes_first():
+    """Test that the credit naming the debited account wins over a closer credit without it."""
+    df = pd.DataFrame({
+        'bank_code': ['BCP', 'BNB1', 'UNION'],
+        'account_number': ['201-0005751-3-23', '1000092297', '10000012345'],
+        'company_voucher': ['BCP-1', 'BNB1-1', 'UNION-1'],
+        'transaction_date': pd.to_datetime(['2025-05-02', '2025-05-02', '2025-05-03']),
+        'description': ['TRANSFERENCIA', 'TRANSFERENCIA RECIBIDA', 'ABONO'],
+        'additional_details': [None, None, 'DE CTA 201 0005751 3 23'],
+        'debit_amount': [80.0, None, None],
+        'credit_amount': [None, 80.0, 80.0]
+    })
+
+    df_paired, stats = pair_internal_transfers(df)
+
+    paired = df_paired.set_index('company_voucher')['paired_company_voucher']
+    assert paired['BCP-1'] == 'UNION-1'
+    assert pd.isna(paired['BNB1-1'])
+    assert stats['account_pairs'] == 1
+
+def test_repeated_amounts_pair_across_accounts():
+    """Test that an account with debits and credits of one amount still pairs with the others."""
+    df = pd.DataFrame({
+        'bank_code': ['BCP'] * 3 + ['BNB1'] * 2,
+        'account_number': ['201-0005751-3-23'] * 3 + ['1000092297'] * 2,
+        'company_voucher': ['BCP-1', 'BCP-2', 'BCP-3', 'BNB1-1', 'BNB1-2'],
+        'transaction_date': pd.to_datetime(['2025-05-02'] * 5),
+        'description': ['TRASPASO'] * 5,
+        'debit_amount': [50.0, 50.0, None, 50.0, None],
+        'credit_amount': [None, None, 50.0, None, 50.0]
+    })
+
+    df_paired, stats = pair_internal_transfers(df)
+
+    paired = df_paired.set_index('company_voucher')['paired_company_voucher']
+    assert paired['BCP-3'] == 'BNB1-1'
+    assert paired['BNB1-2'] in ['BCP-1', 'BCP-2']
+    assert stats['transfer_pairs'] == 2
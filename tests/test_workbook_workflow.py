@@ -0,0 +1,48 @@
+"""
+Test module for the multi-sheet workbook workflow.
+"""
+import pandas as pd
+from benchmarks.synthetic import raw_payment_report, raw_statement
+from src.reader.excel_reader import list_sheets
+from src.workflows.workbook_workflow import clean_sheet, process_workbook
+
+def _payment_sheet():
+    """Raw payment report with its title rows."""
+    title = pd.DataFrame([['CONSULTA DE ABONOS RECIBIDOS'] + [None] * 7,
+                          ['Nro. Cuenta Destino: 201-0005751-3-23'] + [None] * 7], dtype=object)
+    return pd.concat([title, raw_payment_report(5)], ignore_index=True)
+
+def _workbook(path):
+    """Workbook with a BCP sheet, an empty sheet, a payment report and a BNB sheet."""
+    sheets = {
+        'Enero': raw_statement('BCP', 12),
+        'Vacia': pd.DataFrame(),
+        'Abonos': _payment_sheet(),
+        'Febrero': raw_statement('BNB', 8, seed=1),
+    }
+    with pd.ExcelWriter(path) as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, header=False, index=False)
+    return path
+
+def test_process_workbook(tmp_path):
+    """Test sheet order, the shared batch id and that skipped sheets stay out."""
+    path = _workbook(tmp_path / "multi.xlsx")
+    assert list_sheets(path) == ['Enero', 'Vacia', 'Abonos', 'Febrero']
+
+    for max_workers in [1, 2]:
+        df = process_workbook(path, max_workers=max_workers)
+        assert len(df) == 20
+        assert df['bank_code'].tolist() == ['BCP'] * 12 + ['BNB1'] * 8
+        assert df['import_batch_id'].nunique() == 1
+        assert df['account_number'].iloc[-1] == '1000092297'
+
+def test_clean_sheet_skips_non_statements():
+    """Test that empty sheets, payment reports and unknown sheets are not cleaned."""
+    assert clean_sheet('Vacia', pd.DataFrame([[None, None]], dtype=object), 'batch') is None
+    assert clean_sheet('Abonos', _payment_sheet(), 'batch') is None
+    assert clean_sheet('Notas', pd.DataFrame([['nota', 1], ['otra', 2]], dtype=object), 'batch') is None
+
+    df = clean_sheet('Enero', raw_statement('BCP', 5), 'batch')
+    assert len(df) == 5
+    assert set(df['import_batch_id']) == {'batch'}